@@ -0,0 +1,238 @@
+"""
+Analytics events for both apps
+Navigation clicks, section changes, search queries and answer submissions
+are captured as structured events into a bounded in-memory queue; a
+background thread drains it in batches to the sink named by
+MANUAL_ANALYTICS_SINK: jsonl:<directory> (the default, .analytics/, one
+gzip-compressed JSONL file per day) or sqlite:///<path> (relative to the
+working directory; sqlite:////<path> for an absolute path). A sink that
+cannot be opened is logged and nothing is captured.
+
+Capturing an event builds a tuple and puts it on the queue, a few
+microseconds. When the queue (MANUAL_ANALYTICS_QUEUE events) is full the
+MANUAL_ANALYTICS_POLICY applies: drop (the default) discards the new event
+and counts it, block waits up to BLOCK_SECONDS for the writer to make room.
+Set MANUAL_ANALYTICS=0 to capture nothing.
+"""
+
+import atexit
+import gzip
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import namedtuple
+from datetime import date
+from pathlib import Path
+
+from metrics import REGISTRY, script_run_ctx
+from progress_store import ConnectionPool, sqlite_path
+
+ANALYTICS_ENABLED = os.environ.get("MANUAL_ANALYTICS", "1").lower() not in ("0", "false", "no")
+ANALYTICS_SINK = os.environ.get("MANUAL_ANALYTICS_SINK", "jsonl:.analytics")
+QUEUE_SIZE = int(os.environ.get("MANUAL_ANALYTICS_QUEUE", "10000"))
+OVERFLOW_POLICY = os.environ.get("MANUAL_ANALYTICS_POLICY", "drop")
+# Longest a capture waits for room under the block policy before dropping
+BLOCK_SECONDS = 0.05
+BATCH_SIZE = 500
+FLUSH_SECONDS = 2.0
+
+_LOGGER = logging.getLogger(__name__)
+
+# data: the event's own fields, e.g. {"section": "2.4", "source": "tree"}
+Event = namedtuple("Event", "ts app session kind data")
+
+EVENTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    ts REAL NOT NULL,
+    app TEXT NOT NULL,
+    session TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_kind_ts ON events (kind, ts);
+"""
+
+
+def event_json(event):
+    return json.dumps(event._asdict(), ensure_ascii=False, separators=(",", ":"))
+
+
+# -----------------------------------
+# Sinks
+# -----------------------------------
+
+class JsonlSink:
+    """Daily events-YYYY-MM-DD.jsonl.gz files, one gzip member appended per batch
+
+    gzip readers (gzip.open, zcat) read the concatenated members as one
+    stream, so a file is never rewritten.
+    """
+    __slots__ = ("directory",)
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def write(self, batch):
+        days = {}
+        for event in batch:
+            days.setdefault(date.fromtimestamp(event.ts).isoformat(), []).append(event_json(event))
+        for day, lines in days.items():
+            with open(self.directory / f"events-{day}.jsonl.gz", "ab") as stream:
+                stream.write(gzip.compress(("\n".join(lines) + "\n").encode("utf-8")))
+
+    def close(self):
+        pass
+
+
+class SQLiteSink:
+    """An events table, one transaction per batch"""
+    __slots__ = ("pool",)
+
+    def __init__(self, path):
+        self.pool = ConnectionPool(path, 1)
+        with self.pool.connection() as connection:
+            connection.executescript(EVENTS_SCHEMA)
+
+    def write(self, batch):
+        rows = [
+            (event.ts, event.app, event.session, event.kind, json.dumps(event.data, ensure_ascii=False))
+            for event in batch
+        ]
+        with self.pool.connection() as connection, connection:
+            connection.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?)", rows)
+
+    def close(self):
+        self.pool.close()
+
+
+SINKS = {
+    "jsonl": lambda rest: JsonlSink(rest),
+    "sqlite": lambda rest: SQLiteSink(sqlite_path(rest)),
+}
+
+
+def open_sink(url=ANALYTICS_SINK):
+    """Sink for a URL such as jsonl:.analytics or sqlite:///.analytics/events.sqlite3"""
+    scheme, _, rest = url.partition(":")
+    if scheme not in SINKS:
+        raise ValueError(f"unknown analytics sink {scheme!r} (known: {', '.join(SINKS)})")
+    return SINKS[scheme](rest)
+
+
+# -----------------------------------
+# Pipeline
+# -----------------------------------
+
+class EventPipeline:
+    """Bounded queue of events drained into a sink by a daemon thread
+
+    Counts events queued, written and dropped (queue full or sink failure);
+    they are served as manual_analytics_events_total.
+    """
+    __slots__ = ("sink", "events", "block", "counts", "lock", "flush_lock", "writer")
+
+    def __init__(self, sink, size=QUEUE_SIZE, policy=OVERFLOW_POLICY):
+        if policy not in ("drop", "block"):
+            raise ValueError(f"unknown analytics overflow policy {policy!r} (drop or block)")
+        self.sink = sink
+        self.events = queue.Queue(size)
+        self.block = policy == "block"
+        self.counts = {"queued": 0, "written": 0, "dropped": 0}
+        self.lock = threading.Lock()
+        # Held while events are taken off the queue and written, so a batch
+        # is never held outside the queue by one thread while another flushes
+        self.flush_lock = threading.Lock()
+        self.writer = threading.Thread(target=self._run, name="analytics-writer", daemon=True)
+        self.writer.start()
+
+    def put(self, event):
+        """Queue an event, applying the overflow policy when the queue is full"""
+        try:
+            if self.block:
+                self.events.put(event, timeout=BLOCK_SECONDS)
+            else:
+                self.events.put_nowait(event)
+            outcome = "queued"
+        except queue.Full:
+            outcome = "dropped"
+        with self.lock:
+            self.counts[outcome] += 1
+
+    def _take(self, first):
+        batch = [first]
+        while len(batch) < BATCH_SIZE:
+            try:
+                batch.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        try:
+            self.sink.write(batch)
+        except Exception:
+            _LOGGER.exception("dropped %d analytics events", len(batch))
+            outcome = "dropped"
+        else:
+            outcome = "written"
+        with self.lock:
+            self.counts[outcome] += len(batch)
+
+    def _run(self):
+        while True:
+            self.flush()
+            # Let events gather into the next batch instead of writing one at a time
+            time.sleep(FLUSH_SECONDS)
+
+    def flush(self):
+        """Write every queued event now; returns once all of them are in the sink"""
+        with self.flush_lock:
+            while True:
+                try:
+                    first = self.events.get_nowait()
+                except queue.Empty:
+                    return
+                self._write(self._take(first))
+
+
+_pipeline = None
+_pipeline_failed = False
+_pipeline_lock = threading.Lock()
+
+
+def event_pipeline():
+    """The process-wide pipeline, started on first use
+
+    None when disabled or when the sink cannot be opened; the failure is
+    logged once and never reaches the page.
+    """
+    global _pipeline, _pipeline_failed
+    if not ANALYTICS_ENABLED:
+        return None
+    if _pipeline is None and not _pipeline_failed:
+        with _pipeline_lock:
+            if _pipeline is None and not _pipeline_failed:
+                try:
+                    sink = open_sink()
+                except Exception:
+                    _LOGGER.exception("analytics sink %s unavailable; capturing nothing", ANALYTICS_SINK)
+                    _pipeline_failed = True
+                    return None
+                _pipeline = EventPipeline(sink)
+                REGISTRY.watch_pipeline("analytics", _pipeline)
+                atexit.register(_pipeline.flush)
+    return _pipeline
+
+
+def capture(app, kind, **data):
+    """Log an event of the current session; a no-op outside a Streamlit session"""
+    ctx = script_run_ctx()
+    if ctx is None:
+        return
+    pipeline = event_pipeline()
+    if pipeline is not None:
+        pipeline.put(Event(time.time(), app, ctx.session_id, kind, data))
@@ -0,0 +1,108 @@
+"""
+Benchmark: capturing analytics events from many sessions at once
+
+Runs --sessions threads that each capture --events events into a pipeline
+writing to a fresh sink (--sink jsonl or sqlite), --rounds times, then
+repeats the run against a sink slowed down to overflow a small queue, once
+per overflow policy. Reports the cost of a capture as a session sees it and
+what each policy did with the overflow. Fails if the median over the rounds
+of the p99 capture takes longer than --budget-us microseconds, or if an
+event is lost in any round.
+
+Usage: python benchmarks/bench_analytics.py [--sessions 20] [--events 5000] [--sink jsonl] [--rounds 5] [--budget-us 50]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from analytics import Event, EventPipeline, open_sink  # noqa: E402
+
+
+class SlowSink:
+    """A sink taking delay seconds per batch, to fill the queue"""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def write(self, batch):
+        time.sleep(self.delay)
+
+    def close(self):
+        pass
+
+
+def run(pipeline, sessions, events):
+    """Capture events from concurrent sessions; per-capture seconds, sorted"""
+    timings = []
+
+    def session(number):
+        calls = []
+        for index in range(events):
+            start = time.perf_counter()
+            pipeline.put(Event(time.time(), "residentsmanual", f"session-{number}", "navigation",
+                               {"section": f"{index % 6 + 1}.1", "source": "tree"}))
+            calls.append(time.perf_counter() - start)
+        timings.extend(calls)
+
+    threads = [threading.Thread(target=session, args=(number,)) for number in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    timings.sort()
+    return timings
+
+
+def percentiles(timings):
+    return timings[len(timings) // 2] * 1e6, timings[int(len(timings) * 0.99) - 1] * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--events", type=int, default=5000, help="events per session")
+    parser.add_argument("--sink", choices=("jsonl", "sqlite"), default="jsonl")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--budget-us", type=float, default=50.0, help="allowed median p99 capture")
+    args = parser.parse_args()
+    expected = args.sessions * args.events
+
+    complete = True
+    p99s = []
+    for number in range(1, args.rounds + 1):
+        with tempfile.TemporaryDirectory() as directory:
+            url = f"jsonl:{directory}" if args.sink == "jsonl" else f"sqlite:///{directory}/events.sqlite3"
+            pipeline = EventPipeline(open_sink(url), size=expected)
+            start = time.perf_counter()
+            timings = run(pipeline, args.sessions, args.events)
+            pipeline.flush()
+            elapsed = time.perf_counter() - start
+            size = sum(path.stat().st_size for path in Path(directory).iterdir())
+        p50, p99 = percentiles(timings)
+        p99s.append(p99)
+        written = pipeline.counts["written"]
+        complete = complete and written == expected
+        print(f"round {number}, {args.sink}: {written} of {expected} events written in {elapsed:.2f} s "
+              f"({size / max(written, 1):.1f} bytes per event on disk); capture p50 {p50:.2f} us, p99 {p99:.2f} us")
+    p99 = statistics.median(p99s)
+    print(f"capture: median p99 {p99:.2f} us over {args.rounds} rounds (budget {args.budget_us:.0f} us)")
+
+    for policy in ("drop", "block"):
+        overflow = EventPipeline(SlowSink(0.01), size=1000, policy=policy)
+        overflow_p50, overflow_p99 = percentiles(run(overflow, args.sessions, 500))
+        print(f"full queue, {policy}: {overflow.counts['dropped']} of {args.sessions * 500} dropped, "
+              f"capture p50 {overflow_p50:.2f} us, p99 {overflow_p99:.2f} us")
+
+    if not complete or p99 > args.budget_us:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
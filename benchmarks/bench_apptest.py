@@ -0,0 +1,234 @@
+"""
+Benchmark suite for both apps, built on Streamlit's AppTest harness
+
+For the residents' manual (every chapter in the content store) and the
+nursing guide (every sidebar section) it measures:
+
+- cold start: a fresh interpreter importing streamlit and rendering the
+  first page
+- rerun latency: median and best wall time of --repeat reruns of each page,
+  and the best time in units of a fixed calibration workload
+- element and block (delta) counts and the serialized size of each page
+- peak Python memory allocated while rerendering each page (tracemalloc)
+
+Each run is appended to a JSON history file (by default
+.benchmarks/apptest_history.json, which git ignores). A page whose best rerun time
+(in calibration units) or peak memory exceeds the median of the last
+--window recorded runs by more than --threshold (and by more than --floor-ms
+for latency) is reported as a regression, and the run exits with status 1.
+
+Usage: python benchmarks/bench_apptest.py [--repeat N] [--threshold 0.4]
+           [--history .benchmarks/apptest_history.json] [--no-record]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from content_model import compile_content_store  # noqa: E402
+
+APPS = {
+    "residentsmanual": ROOT / "residentsmanual.py",
+    "streamlit_app": ROOT / "streamlit_app.py",
+}
+NURSING_NAV_LABEL = "Go to section:"
+DEFAULT_HISTORY = ROOT / ".benchmarks" / "apptest_history.json"
+
+COLD_START = """
+import time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({path!r}, default_timeout=60).run()
+assert not at.exception, at.exception
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def cold_start_ms(path):
+    """Wall time of a fresh interpreter rendering the app's first page"""
+    proc = subprocess.run(
+        [sys.executable, "-c", COLD_START.format(path=str(path))],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"cold start of {path.name} failed:\n{proc.stderr[-2000:]}")
+    return float(proc.stdout.strip().splitlines()[-1])
+
+
+def page_shape(node):
+    """(elements, blocks, serialized bytes) of an AppTest element tree"""
+    elements = blocks = size = 0
+    children = getattr(node, "children", None)
+    proto = getattr(node, "proto", None)
+    if proto is not None:
+        size += len(proto.SerializeToString())
+    if children is None:
+        return 1, 0, size
+    for child in children.values():
+        child_elements, child_blocks, child_size = page_shape(child)
+        elements += child_elements
+        blocks += child_blocks
+        size += child_size
+    return elements, blocks + 1, size
+
+
+def calibration_ms():
+    """Best time of a fixed pure-Python workload, to normalize for machine speed"""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        sorted(str(i * 7919 % 10007) for i in range(20000))
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def measure_page(at, select, repeat):
+    """Rerun timings, shape and peak memory for one page of a running AppTest"""
+    select(at)
+    at.run()
+    if at.exception:
+        raise SystemExit(f"page raised: {at.exception}")
+    calibration = calibration_ms()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    at.run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    elements, blocks, size = page_shape(at._tree)
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "best_ms": round(min(timings), 3),
+        "score": round(min(timings) / calibration, 3),
+        "elements": elements,
+        "blocks": blocks,
+        "bytes": size,
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def manual_pages():
+    """(page name, selector) for every chapter of the residents' manual"""
+    def select(chapter_id):
+        def apply(at):
+            at.session_state.current_section = chapter_id
+        return apply
+    return [(f"manual:{chapter.id}", select(chapter.id)) for chapter in compile_content_store()]
+
+
+def nursing_radio(at):
+    """The nursing guide's sidebar section radio"""
+    return next(widget for widget in at.sidebar.radio if widget.label == NURSING_NAV_LABEL)
+
+
+def nursing_pages(at):
+    """(page name, selector) for every section of the nursing guide"""
+    def select(section):
+        def apply(at):
+            nursing_radio(at).set_value(section)
+        return apply
+    return [(f"nursing:{section}", select(section)) for section in nursing_radio(at).options]
+
+
+def run_suite(repeat):
+    """Measure every page of both apps"""
+    from streamlit.testing.v1 import AppTest
+
+    results = {"cold_start_ms": {}, "pages": {}}
+    for app, path in APPS.items():
+        results["cold_start_ms"][app] = round(cold_start_ms(path), 1)
+        at = AppTest.from_file(str(path), default_timeout=60).run()
+        pages = manual_pages() if app == "residentsmanual" else nursing_pages(at)
+        for name, select in pages:
+            results["pages"][name] = measure_page(at, select, repeat)
+    return results
+
+
+def git_revision():
+    proc = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    return proc.stdout.strip() or None
+
+
+def load_history(path):
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+
+
+def find_regressions(results, history, threshold, floor_ms, window):
+    """Pages whose latency or memory regressed against recent history"""
+    regressions = []
+    recent = history[-window:]
+    for name, page in results["pages"].items():
+        past = [run["pages"][name] for run in recent if name in run.get("pages", {})]
+        if not past:
+            continue
+        # Compare best-of-N reruns in calibration units, which absorbs most of
+        # the noise from shared CI machines changing speed between runs
+        baseline_score = statistics.median(p["score"] for p in past)
+        baseline_ms = statistics.median(p["best_ms"] for p in past)
+        if page["score"] > baseline_score * (1 + threshold) and page["best_ms"] - baseline_ms > floor_ms:
+            regressions.append(
+                f"{name}: rerun {page['best_ms']:.1f} ms ({page['score']:.1f} units)"
+                f" vs {baseline_ms:.1f} ms ({baseline_score:.1f} units) baseline"
+            )
+        baseline_kb = statistics.median(p["peak_kb"] for p in past)
+        if page["peak_kb"] > baseline_kb * (1 + threshold):
+            regressions.append(f"{name}: peak memory {page['peak_kb']:.0f} KB vs {baseline_kb:.0f} KB baseline")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="timed reruns per page")
+    parser.add_argument("--threshold", type=float, default=0.4, help="allowed relative regression")
+    parser.add_argument("--floor-ms", type=float, default=10.0, help="ignore latency regressions below this")
+    parser.add_argument("--window", type=int, default=5, help="recorded runs the baseline is taken from")
+    parser.add_argument("--history", default=str(DEFAULT_HISTORY), help="JSON history file")
+    parser.add_argument("--no-record", action="store_true", help="do not append this run to the history")
+    args = parser.parse_args()
+
+    results = run_suite(args.repeat)
+    history = load_history(args.history)
+    regressions = find_regressions(results, history, args.threshold, args.floor_ms, args.window)
+
+    for app, ms in results["cold_start_ms"].items():
+        print(f"cold start {app:<18}{ms:>10.1f} ms")
+    print(f"{'page':<40}{'median ms':>10}{'best ms':>9}{'elements':>10}{'blocks':>8}{'bytes':>9}{'peak KB':>9}")
+    for name, page in results["pages"].items():
+        print(f"{name:<40}{page['median_ms']:>10.1f}{page['best_ms']:>9.1f}{page['elements']:>10}"
+              f"{page['blocks']:>8}{page['bytes']:>9}{page['peak_kb']:>9.0f}")
+
+    if not args.no_record:
+        entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "repeat": args.repeat,
+            **results,
+            "regressions": regressions,
+        }
+        Path(args.history).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.history).write_text(json.dumps(history + [entry], indent=1), encoding="utf-8")
+
+    if regressions:
+        print("\nREGRESSIONS:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
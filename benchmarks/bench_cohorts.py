@@ -0,0 +1,86 @@
+"""
+Benchmark: faculty dashboard statistics over a large attempt history
+
+Fills a fresh SQLite progress store with --attempts quiz attempts by
+--learners residents spread over --cohorts batches, answering the manual's
+review cards padded with synthetic ones to --cards. Times the first load of
+the running totals, an incremental refresh after --new more attempts, and
+the per-cohort, per-chapter and per-question statistics the dashboard
+computes on every refresh. Fails if a refresh plus the statistics takes
+longer than --budget-ms milliseconds.
+
+Usage: python benchmarks/bench_cohorts.py [--attempts 200000] [--learners 300] [--budget-ms 250]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cohort_stats import AttemptMatrix  # noqa: E402
+from progress_store import CohortAssignment, ProgressStore, QuizAttempt, SQLiteBackend  # noqa: E402
+
+
+def attempts(count, learners, cards, rng):
+    """Random review grades, about 70% of them correct"""
+    now = time.time()
+    for _ in range(count):
+        chapter_id, card_id = rng.choice(cards)
+        quality = rng.choice((1, 3, 4, 4, 5))
+        yield QuizAttempt(rng.choice(learners), "residentsmanual", chapter_id, card_id, str(quality), quality >= 3, now)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--attempts", type=int, default=200000)
+    parser.add_argument("--learners", type=int, default=300)
+    parser.add_argument("--cohorts", type=int, default=5)
+    parser.add_argument("--cards", type=int, default=500, help="questions answered")
+    parser.add_argument("--new", type=int, default=2000, help="attempts arriving between refreshes")
+    parser.add_argument("--budget-ms", type=float, default=250.0, help="allowed refresh plus statistics")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    learners = [f"resident-{n:03d}" for n in range(args.learners)]
+    cards = [(f"{number % 19}.1", f"{number % 19}.1.q{number}") for number in range(args.cards)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = ProgressStore(SQLiteBackend(Path(directory) / "progress.sqlite3"))
+        store.backend.write([
+            CohortAssignment(learner, f"Batch {number % args.cohorts + 1}", time.time())
+            for number, learner in enumerate(learners)
+        ])
+        store.backend.write(list(attempts(args.attempts, learners, cards, rng)))
+
+        matrix = AttemptMatrix(store)
+        _, first_load = timed(matrix.refresh)
+        statistics, first_stats = timed(matrix.statistics, store.cohorts(), "residentsmanual")
+
+        store.backend.write(list(attempts(args.new, learners, cards, rng)))
+        folded, refresh = timed(matrix.refresh)
+        _, stats = timed(matrix.statistics, store.cohorts(), "residentsmanual")
+        store.close()
+
+    print(f"{args.attempts} attempts by {args.learners} learners in {args.cohorts} batches: "
+          f"first load {first_load:.0f} ms, statistics {first_stats:.0f} ms "
+          f"({matrix.attempts.shape[0]} x {matrix.attempts.shape[1]} matrix, "
+          f"{len(statistics.chapters)} chapter and {len(statistics.items)} question rows)")
+    print(f"refresh with {folded} new attempts: {refresh:.0f} ms, statistics {stats:.0f} ms "
+          f"(budget {args.budget_ms:.0f} ms)")
+    if refresh + stats > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
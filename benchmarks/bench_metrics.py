@@ -0,0 +1,56 @@
+"""
+Benchmark: cost of the always-on rerun metrics
+
+Times recording one rerun (what every full or fragment rerun pays) and one
+scrape of the /metrics text, with the manual's chapters and the nursing
+sections as histogram labels. Fails if recording a rerun costs more than
+--budget-us microseconds.
+
+Usage: python benchmarks/bench_metrics.py [--repeat N] [--budget-us 20]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from content_model import compile_content_store  # noqa: E402
+from metrics import MetricsRegistry  # noqa: E402
+
+NURSING_SECTIONS = [
+    "Introduction", "Psychological Responses", "Psychosocial Challenges",
+    "Social Sphere", "Therapeutic Communication", "Self-Care", "Assessment",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=100000, help="reruns recorded")
+    parser.add_argument("--budget-us", type=float, default=20.0, help="allowed cost per rerun")
+    args = parser.parse_args()
+
+    labels = [("residentsmanual", chapter.id) for chapter in compile_content_store()]
+    labels += [("streamlit_app", section) for section in NURSING_SECTIONS]
+    registry = MetricsRegistry()
+
+    start = time.perf_counter()
+    for i in range(args.repeat):
+        app, section = labels[i % len(labels)]
+        registry.observe_rerun(app, "full", section, (i % 200) / 1000, f"session-{i % 500}")
+    per_rerun_us = (time.perf_counter() - start) * 1e6 / args.repeat
+
+    registry.exposition()  # warm up the streamlit.runtime import
+    start = time.perf_counter()
+    text = registry.exposition()
+    scrape_ms = (time.perf_counter() - start) * 1000
+
+    print(f"record one rerun:  {per_rerun_us:8.2f} us (budget {args.budget_us:.0f} us)")
+    print(f"scrape /metrics:   {scrape_ms:8.2f} ms ({len(text.splitlines())} lines, {len(text) / 1024:.0f} KB)")
+    if per_rerun_us > args.budget_us:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
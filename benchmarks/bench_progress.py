@@ -0,0 +1,101 @@
+"""
+Benchmark: recording learner progress from many sessions at once
+
+Runs --sessions threads that each record --records progress records (a mix
+of section visits, quiz answers and checklist results) into a fresh SQLite
+progress store while the background writer flushes batches to disk. Reports
+the cost of a record() call as a session sees it, and how fast batches
+reach the database. Fails if the p99 record() call takes longer than
+--budget-us microseconds, or if any record is missing afterwards.
+
+Usage: python benchmarks/bench_progress.py [--sessions 20] [--records 5000] [--budget-us 50]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from progress_store import (  # noqa: E402
+    TABLES, ChecklistResult, ProgressStore, QuizAttempt, SectionVisit, SQLiteBackend,
+)
+
+
+def session_records(learner, count, rng):
+    """Progress records one session might produce"""
+    now = time.time()
+    for number in range(count):
+        kind = rng.random()
+        if kind < 0.5:
+            yield SectionVisit(learner, "residentsmanual", f"{rng.randint(1, 6)}.{rng.randint(1, 5)}", now)
+        elif kind < 0.95:
+            yield QuizAttempt(
+                learner, "streamlit_app", "nursing.knowledge", f"q{number % 40}", '"answer"', rng.random() < 0.6, now
+            )
+        else:
+            yield ChecklistResult(learner, "streamlit_app", "burnout", '["Emotional numbness"]', now)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--records", type=int, default=5000, help="records per session")
+    parser.add_argument("--budget-us", type=float, default=50.0, help="allowed p99 record() call")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    workloads = [
+        list(session_records(f"resident-{n:03d}", args.records, random.Random(args.seed + n)))
+        for n in range(args.sessions)
+    ]
+    timings = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        backend = SQLiteBackend(Path(directory) / "progress.sqlite3")
+        store = ProgressStore(backend)
+
+        def session(records):
+            calls = []
+            for record in records:
+                start = time.perf_counter()
+                store.record(record)
+                calls.append(time.perf_counter() - start)
+            timings.extend(calls)
+
+        start = time.perf_counter()
+        threads = [threading.Thread(target=session, args=(records,)) for records in workloads]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        recorded = time.perf_counter() - start
+        store.flush()
+        persisted = time.perf_counter() - start
+
+        with backend.pool.connection() as connection:
+            rows = sum(
+                connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in TABLES.values()
+            )
+        store.close()
+
+    expected = args.sessions * args.records
+    timings.sort()
+    p50 = timings[len(timings) // 2] * 1e6
+    p99 = timings[int(len(timings) * 0.99) - 1] * 1e6
+    print(f"{args.sessions} sessions recorded {expected} records in {recorded:.2f} s; "
+          f"all on disk after {persisted:.2f} s ({rows / persisted:,.0f} rows/s)")
+    print(f"record(): p50 {p50:.2f} us, p99 {p99:.2f} us (budget {args.budget_us:.0f} us)")
+    if rows != expected:
+        print(f"missing records: {expected - rows}")
+        sys.exit(1)
+    if p99 > args.budget_us:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark: scoring quiz submissions against a large question bank
+
+Fills a question bank with --items synthetic questions (a quarter of them
+multiple choice, the rest single choice) next to the real quizzes, then
+times scoring pages of increasing size. Scoring should cost the same per
+answer whatever the page or bank size; fails if it costs more than
+--budget-us microseconds per answer.
+
+Usage: python benchmarks/bench_quiz.py [--items 5000] [--repeat 200] [--budget-us 2]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quiz_engine import compile_question_bank, multiple_choice, quiz, response, single_choice  # noqa: E402
+
+PAGE_SIZES = (3, 30, 300, 3000)
+
+
+def synthetic_quiz(quiz_id, count, start):
+    """A quiz of count generated questions, numbered from start"""
+    questions = []
+    for number in range(start, start + count):
+        options = [f"Option {letter} of item {number}" for letter in "ABCDE"]
+        if number % 4 == 0:
+            questions.append(multiple_choice(f"{quiz_id}.{number}", f"Item {number}", options, options[1:3]))
+        else:
+            questions.append(single_choice(f"{quiz_id}.{number}", f"Item {number}", options, options[number % 5]))
+    return quiz(quiz_id, f"Synthetic quiz {quiz_id}", questions)
+
+
+def submission(questions, rng):
+    """Widget values for every question, about half of them right"""
+    answers = {}
+    for question in questions:
+        if question.multiple:
+            value = sorted(question.answer) if rng.random() < 0.5 else list(question.options[:2])
+        else:
+            value = question.answer if rng.random() < 0.5 else question.options[0]
+        answers[question.id] = response(question, value)
+    return answers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000, help="synthetic questions in the bank")
+    parser.add_argument("--repeat", type=int, default=200, help="submissions scored per page size")
+    parser.add_argument("--budget-us", type=float, default=2.0, help="allowed cost per answer")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    bank = compile_question_bank()
+    for quiz_id in list(bank.entries):
+        bank.load(quiz_id)
+    questions = []
+    for index, start in enumerate(range(0, args.items, 100)):
+        synthetic = synthetic_quiz(f"bench.{index}", min(100, args.items - start), start)
+        bank.add(synthetic)
+        questions.extend(synthetic.questions)
+    print(f"question bank: {len(bank)} quizzes, {len(bank.answer_key)} answer key entries")
+
+    worst = 0.0
+    for size in PAGE_SIZES:
+        if size > len(questions):
+            break
+        pages = [submission(rng.sample(questions, size), rng) for _ in range(args.repeat)]
+        start = time.perf_counter()
+        for answers in pages:
+            bank.score(answers)
+        per_answer_us = (time.perf_counter() - start) * 1e6 / (args.repeat * size)
+        worst = max(worst, per_answer_us)
+        print(f"page of {size:5d} answers: {per_answer_us:6.3f} us per answer")
+
+    print(f"worst: {worst:.3f} us per answer (budget {args.budget_us:.1f} us)")
+    if worst > args.budget_us:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: rerun latency of the nursing guide's interactive blocks under load
+
+Starts `streamlit run streamlit_app.py` and connects N simulated nurses over
+the websocket protocol the browser uses. Each nurse opens the guide, visits
+every section with an interactive block and works through its widgets (the
+treatment phase selector, the communication practice scenarios, the cultural
+factors and burnout checklists, the self-care radio and the quiz).
+
+Every interaction is timed from the widget change to the end of the rerun,
+once as a full script rerun (how every click behaved before the widgets were
+fragments) and once as a fragment rerun (what the browser sends now).
+
+Usage: python benchmarks/bench_reruns.py [--users 50] [--rounds 2] [--url ws://host:port]
+"""
+
+import argparse
+import asyncio
+import statistics
+
+from st_client import StreamlitSession, free_port, start_server, stream_url
+
+NAV_LABEL = "Go to section:"
+
+# (section, [(widget label, value), ...]) worked through by every nurse;
+# a list value is a multiselect selection, True presses a button
+SESSION = [
+    ("Psychosocial Challenges", [
+        ("Select treatment phase:", "End of Treatment/Survivorship"),
+        ("Select treatment phase:", "Advanced/Palliative Stages"),
+        ("Select treatment phase:", "End of Life"),
+    ]),
+    ("Social Sphere", [
+        ("Cultural factors to explore:", ["Illness causation beliefs"]),
+        ("Cultural factors to explore:", ["Illness causation beliefs", "Spiritual practices"]),
+    ]),
+    ("Therapeutic Communication", [
+        ("Choose a patient scenario:", "Patient angry about treatment delays"),
+        ("Select the most therapeutic response:",
+         "I can hear how frustrated you are. This wait must be really difficult."),
+        ("Choose a patient scenario:", "Patient crying about hair loss"),
+        ("Select the most therapeutic response:", "Don't worry, it will grow back after treatment."),
+    ]),
+    ("Self-Care", [
+        ("Which signs have you experienced recently?", ["Emotional numbness", "Feeling ineffective"]),
+        ("Focus area:", "Team Support"),
+    ]),
+    ("Assessment", [
+        ("1. Which statement about hope in cancer care is most accurate?",
+         "Hope should be reframed to match current reality"),
+        ("3. What is 'economic toxicity'?", "The financial burden of cancer treatment"),
+        ("Check Answers", True),
+    ]),
+]
+
+
+async def nurse(url, mode, rounds):
+    """One simulated nurse working through SESSION; returns (seconds, bytes) per click"""
+    session = StreamlitSession(url)
+    await session.connect()
+    samples = []
+    try:
+        for _ in range(rounds):
+            for section, steps in SESSION:
+                session.set_state(NAV_LABEL, section)
+                await session.rerun()
+                for label, value in steps:
+                    fragment_id = session.set_state(label, value)
+                    samples.append(await session.rerun(fragment_id if mode == "fragment" else ""))
+    finally:
+        await session.close()
+    return samples
+
+
+async def load(url, users, mode, rounds):
+    """Run `users` concurrent nurses and return their (latency, bytes) samples"""
+    results = await asyncio.gather(*(nurse(url, mode, rounds) for _ in range(users)))
+    return [sample for samples in results for sample in samples]
+
+
+def percentile(values, q):
+    return statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else values[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=50, help="concurrent nurses")
+    parser.add_argument("--rounds", type=int, default=2, help="passes over the interactive sections")
+    parser.add_argument("--url", help="websocket URL of a running server (default: start one)")
+    args = parser.parse_args()
+
+    process = None
+    url = args.url
+    if url is None:
+        port = free_port()
+        process = start_server("streamlit_app.py", port)
+        url = stream_url(port)
+    try:
+        print(f"users: {args.users}  rounds: {args.rounds}")
+        print(f"{'rerun':<10}{'samples':>9}{'mean ms':>10}{'p50 ms':>9}{'p95 ms':>9}{'bytes/click':>13}")
+        results = {}
+        for mode in ("full", "fragment"):
+            samples = asyncio.run(load(url, args.users, mode, args.rounds))
+            latencies = [elapsed * 1000 for elapsed, _ in samples]
+            results[mode] = statistics.mean(latencies)
+            print(f"{mode:<10}{len(samples):>9}{results[mode]:>10.1f}{percentile(latencies, 50):>9.1f}"
+                  f"{percentile(latencies, 95):>9.1f}{statistics.mean(r for _, r in samples):>13.0f}")
+        print(f"fragment reruns: {results['full'] / results['fragment']:.1f}x lower mean latency")
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
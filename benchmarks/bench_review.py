@@ -0,0 +1,84 @@
+"""
+Benchmark: building daily review queues after a year of spaced repetition
+
+Simulates --days days of reviews by --learners residents in a fresh SQLite
+review database (each learner works through the whole daily queue, grading
+cards at random), over the manual's review deck padded with synthetic cards
+to --cards cards. Then times each learner's daily queue. Fails if the p95
+queue build takes longer than --budget-ms milliseconds.
+
+Usage: python benchmarks/bench_review.py [--learners 20] [--days 365] [--cards 500] [--budget-ms 5]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from content_model import compile_content_store  # noqa: E402
+from spaced_repetition import GRADES, Card, ReviewStore, review_deck, today  # noqa: E402
+
+
+def padded_deck(size):
+    """The manual's review deck plus synthetic cards up to size"""
+    deck = review_deck(compile_content_store())
+    for number in range(len(deck), size):
+        card_id = f"X.q{number}"
+        deck[card_id] = Card(card_id, "X", "Synthetic", f"Question {number}", f"Answer {number}")
+    return deck
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--learners", type=int, default=20)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--cards", type=int, default=500, help="deck size (the manual has 45 cards)")
+    parser.add_argument("--budget-ms", type=float, default=5.0, help="allowed p95 daily queue build")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    qualities = [quality for _, quality in GRADES]
+    deck = padded_deck(args.cards)
+    learners = [f"resident-{n:03d}" for n in range(args.learners)]
+    first_day = today() - args.days
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = ReviewStore(Path(directory) / "reviews.sqlite3")
+        start = time.perf_counter()
+        reviews = 0
+        for day in range(first_day, first_day + args.days):
+            for learner in learners:
+                for card_id in store.daily_queue(learner, deck, day):
+                    store.review(learner, card_id, rng.choices(qualities, (1, 2, 5, 2))[0], day)
+                    reviews += 1
+        simulated = time.perf_counter() - start
+
+        timings = []
+        for _ in range(5):
+            for learner in learners:
+                start = time.perf_counter()
+                queue = store.daily_queue(learner, deck)
+                timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        p50 = statistics.median(timings)
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        store.close()
+        with store.pool.connection() as connection:
+            log_rows, = connection.execute("SELECT COUNT(*) FROM review_log").fetchone()
+
+    print(f"simulated {args.days} days: {reviews} reviews by {args.learners} learners "
+          f"in {simulated:.1f} s ({log_rows} review log rows)")
+    print(f"daily queue: p50 {p50:.2f} ms, p95 {p95:.2f} ms (budget {args.budget_ms:.0f} ms, "
+          f"last queue {len(queue)} cards)")
+    if p95 > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Startup benchmark: import cost of the first-paint path, measured with -X importtime
+
+Runs the import of each app (plus its navigation registry and the chapter on
+the first page) in a fresh interpreter --runs times, reports where the time
+goes in the median run and enforces a budget:
+
+- none of lazy_imports.HEAVY_MODULES (pandas, numpy, pyarrow) may be imported
+- the median self time of first-party modules must stay under --budget-ms
+
+Exits with status 1 when the budget is exceeded, so CI can enforce it.
+
+Usage: python benchmarks/bench_startup.py [--budget-ms MS] [--runs N] [--top N]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from lazy_imports import HEAVY_MODULES  # noqa: E402
+
+# Code that reproduces what a fresh process imports before the first paint
+FIRST_PAINT = {
+    "residentsmanual": "import residentsmanual; residentsmanual.shared_content_store().get('1.1')",
+    "streamlit_app": "import streamlit_app; streamlit_app.main()",
+}
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def first_party_modules():
+    """Top-level module and package names that live in this repository"""
+    return {path.stem for path in ROOT.glob("*.py")} | {path.parent.name for path in ROOT.glob("*/__init__.py")}
+
+
+def import_times(code):
+    """Parse `python -X importtime` output into (module, self_us, cumulative_us, depth)"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"import failed:\n{proc.stderr[-2000:]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=100.0,
+                        help="maximum first-party import self time per app")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per app")
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    ours = first_party_modules()
+    failed = False
+    for app, code in FIRST_PAINT.items():
+        runs = []
+        for _ in range(args.runs):
+            rows = import_times(code)
+            own_ms = sum(row[1] for row in rows if row[0].split(".")[0] in ours) / 1000
+            runs.append((own_ms, rows))
+        runs.sort(key=lambda run: run[0])
+        own_ms, rows = runs[len(runs) // 2]
+        total_ms = sum(row[1] for row in rows) / 1000
+        heavy = sorted({row[0].split(".")[0] for _, run_rows in runs for row in run_rows} & set(HEAVY_MODULES))
+
+        print(f"== {app} ==")
+        print(f"total import time:        {total_ms:8.1f} ms ({len(rows)} modules, median run)")
+        print(f"first-party self time:    {own_ms:8.1f} ms median of {args.runs} "
+              f"({runs[0][0]:.1f}-{runs[-1][0]:.1f} ms; budget {args.budget_ms:.0f} ms)")
+        print(f"heavy modules imported:   {', '.join(heavy) or 'none'}")
+        print("slowest imports made by the app (cumulative):")
+        direct = [row for row in rows if row[3] == 1 or (row[3] == 0 and row[0].split(".")[0] in ours)]
+        for name, _, cumulative_us, _ in sorted(direct, key=lambda row: row[2], reverse=True)[:args.top]:
+            print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+        if heavy:
+            print(f"FAIL: {app} imports {', '.join(heavy)} before the first paint")
+            failed = True
+        if own_ms > args.budget_ms:
+            print(f"FAIL: {app} first-party import time {own_ms:.1f} ms exceeds {args.budget_ms:.0f} ms")
+            failed = True
+        print()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
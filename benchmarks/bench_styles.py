@@ -0,0 +1,57 @@
+"""
+Benchmark: bytes sent per interaction for the apps' stylesheets
+
+Every rerun re-sends each element the script emits. Compares the size of the
+websocket message carrying the inline <style> element with the one carrying
+the versioned <link> element (raw and deflated, as permessage-deflate would
+send it), and the bytes saved over a session of N interactions. The linked
+stylesheet itself is downloaded once per browser, not per interaction.
+
+Usage: python benchmarks/bench_styles.py [--interactions N]
+"""
+
+import argparse
+import sys
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from styles import link_tag, stylesheet, style_tag  # noqa: E402
+
+APPS = {"residentsmanual": "manual", "streamlit_app": "nursing"}
+
+
+def message_bytes(markup):
+    """Serialized ForwardMsg size for an st.markdown element, raw and deflated"""
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    msg = ForwardMsg()
+    msg.delta.new_element.markdown.body = markup
+    msg.delta.new_element.markdown.allow_html = True
+    msg.metadata.delta_path[:] = [0, 0]
+    data = msg.SerializeToString()
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return len(data), len(compressor.compress(data) + compressor.flush())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--interactions", type=int, default=50, help="reruns per session")
+    args = parser.parse_args()
+
+    print(f"{'app':<18}{'inline':>10}{'linked':>10}{'inline gz':>11}{'linked gz':>11}"
+          f"{'saved/session':>15}{'css once':>10}")
+    for app, name in APPS.items():
+        inline_raw, inline_gz = message_bytes(style_tag(name))
+        link_raw, link_gz = message_bytes(link_tag(name))
+        saved = (inline_gz - link_gz) * args.interactions
+        css_once = len(zlib.compress(stylesheet(name).encode("utf-8")))
+        print(f"{app:<18}{inline_raw:>10}{link_raw:>10}{inline_gz:>11}{link_gz:>11}"
+              f"{saved:>15}{css_once:>10}")
+    print(f"(bytes; saved/session = deflated saving x {args.interactions} interactions,"
+          f" css once = deflated stylesheet fetched on first load)")
+
+
+if __name__ == "__main__":
+    main()
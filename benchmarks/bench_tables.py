@@ -0,0 +1,79 @@
+"""
+Benchmark: per-rerun cost of rendering every table in the manual
+
+Compares the old path (build a pandas DataFrame and serialize it to Arrow,
+as st.table does, on every rerun) with the pre-rendered HTML table layer.
+
+Usage: python benchmarks/bench_tables.py [--repeat N]
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from content_model import Table, compile_content_store, walk_blocks  # noqa: E402
+from tables import table_html  # noqa: E402
+
+
+def all_tables():
+    """Every distinct Table record in the content store"""
+    seen = {}
+    for chapter in compile_content_store():
+        for block in walk_blocks(chapter.blocks):
+            if isinstance(block, Table):
+                seen[block] = None
+    return list(seen)
+
+
+def dataframe_rerun(tables):
+    """Old render_table: DataFrame + Arrow serialization for every table"""
+    import pandas as pd
+    import pyarrow as pa
+
+    payload = 0
+    for table in tables:
+        df = pd.DataFrame(dict(zip(table.columns, map(list, zip(*table.rows)))))
+        arrow_table = pa.Table.from_pandas(df)
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, arrow_table.schema) as writer:
+            writer.write_table(arrow_table)
+        payload += len(sink.getvalue())
+    return payload
+
+
+def html_rerun(tables):
+    """New render path: cached HTML markup for every table"""
+    return sum(len(table_html(table).encode("utf-8")) for table in tables)
+
+
+def measure(func, tables, repeat):
+    """Mean wall time per rerun in milliseconds"""
+    func(tables)  # warm up imports and caches
+    start = time.perf_counter()
+    for _ in range(repeat):
+        payload = func(tables)
+    return (time.perf_counter() - start) * 1000 / repeat, payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    tables = all_tables()
+    old_ms, old_bytes = measure(dataframe_rerun, tables, args.repeat)
+    new_ms, new_bytes = measure(html_rerun, tables, args.repeat)
+
+    print(f"tables: {len(tables)}  reruns: {args.repeat}")
+    print(f"{'path':<22}{'ms/rerun':>10}{'payload bytes':>16}")
+    print(f"{'DataFrame + Arrow':<22}{old_ms:>10.3f}{old_bytes:>16}")
+    print(f"{'cached HTML':<22}{new_ms:>10.3f}{new_bytes:>16}")
+    print(f"saving per rerun: {old_ms - new_ms:.3f} ms ({old_ms / max(new_ms, 1e-9):.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+Load test: how many concurrent learner sessions one Streamlit process sustains
+
+Starts each app headless on a local port and ramps up simulated learners
+over the browser's websocket protocol. Sessions are added level by level
+(--ramp) and keep running while the next level joins, like a batch of
+residents and nurses opening the manuals at orientation. Residents click
+sidebar chapter buttons, search, and open case studies; nurses switch
+sections with the sidebar radio, practise communication scenarios, fill in
+the burnout checklist and submit the quiz. Each learner waits a random think
+time (--think) between clicks.
+
+For every level it reports rerun latency percentiles (p50/p95/p99) of clicks,
+the p95 time for a joining session's first page, reruns per second,
+websocket throughput (messages and KB received per second), server RSS and
+RSS per session, and timed-out interactions.
+
+With --app portal both kinds of learners share the one server of the
+multipage portal, which shows the memory saved against two servers.
+
+Usage: python benchmarks/load_test.py [--app manual|nursing|both|portal]
+           [--ramp 10,25,50,100,200] [--duration 15] [--think 0.5 2.0] [--json out.json]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from pathlib import Path
+
+from st_client import StreamlitSession, free_port, start_server, stream_url
+
+SCRIPTS = {"manual": "residentsmanual.py", "nursing": "streamlit_app.py", "portal": "portal.py"}
+# Pages of portal.py (url paths) the two kinds of learners use
+PORTAL_PAGES = {"manual": "residents", "nursing": "nursing"}
+
+# Seconds before a rerun counts as timed out
+RERUN_TIMEOUT = 60
+
+SEARCH_TERMS = ["depression", "delirium", "spikes", "anxiety", "suicide", "opioid", "grief", "distress"]
+NURSING_SECTIONS = [
+    "Introduction", "Psychological Responses", "Psychosocial Challenges",
+    "Social Sphere", "Therapeutic Communication", "Self-Care", "Assessment",
+]
+QUIZ = [
+    ("1. Which statement about hope in cancer care is most accurate?",
+     ["Hope should be reframed to match current reality", "Nurses should maintain hope for cure at all times"]),
+    ("2. Which are appropriate therapeutic responses to anger? (Select all that apply)",
+     [["See anger as expression of underlying distress", "Respond with curiosity about the source"]]),
+    ("3. What is 'economic toxicity'?",
+     ["The financial burden of cancer treatment", "Side effects of chemotherapy"]),
+]
+SCENARIOS = [
+    "Patient expressing fear of dying", "Patient angry about treatment delays",
+    "Family member overwhelmed with caregiving", "Patient questioning 'Why me?'",
+    "Patient crying about hair loss",
+]
+BURNOUT_SIGNS = ["Cynicism about work", "Emotional numbness", "Physical exhaustion", "Feeling ineffective"]
+
+
+class LoadStats:
+    """Samples collected from all sessions during one measurement window"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.started = time.perf_counter()
+        self.latencies = []
+        self.connects = []
+        self.bytes = 0
+        self.messages = 0
+        self.timeouts = 0
+
+    def record(self, session, elapsed, received, messages_before, connect=False):
+        (self.connects if connect else self.latencies).append(elapsed)
+        self.bytes += received
+        self.messages += session.messages_received - messages_before
+
+
+async def interact(session, stats, fragment_id=""):
+    """One timed rerun, recorded in stats"""
+    messages_before = session.messages_received
+    try:
+        elapsed, received = await asyncio.wait_for(session.rerun(fragment_id), RERUN_TIMEOUT)
+    except asyncio.TimeoutError:
+        stats.timeouts += 1
+        raise
+    stats.record(session, elapsed, received, messages_before)
+
+
+async def resident_step(session, rng, stats):
+    """A resident's next click in the residents' manual"""
+    roll = rng.random()
+    cases = list(session.expanders)
+    if roll < 0.15 and cases:
+        label = rng.choice(cases)
+        fragment_id = session.set_state(label, rng.random() < 0.7, expander=True)
+        await interact(session, stats, fragment_id)
+    elif roll < 0.25:
+        session.set_state("Search topics...", rng.choice(SEARCH_TERMS))
+        await interact(session, stats)
+        session.set_state("Search topics...", "")
+    else:
+        _, sections = session.component_data("chapter_navigation")
+        chapters = [chapter_id for _, section in sections for chapter_id, _ in section]
+        session.trigger("chapter_navigation", "selected", rng.choice(chapters))
+        await interact(session, stats)
+
+
+async def nurse_step(session, rng, stats):
+    """A nurse's next section visit in the nursing guide, with its interactions"""
+    section = rng.choice(NURSING_SECTIONS)
+    session.set_state("Go to section:", section)
+    await interact(session, stats)
+    if section == "Assessment":
+        for label, answers in QUIZ:
+            session.set_state(label, rng.choice(answers))
+        await interact(session, stats, session.set_state("Check Answers", True))
+    elif section == "Therapeutic Communication":
+        await interact(session, stats, session.set_state("Choose a patient scenario:", rng.choice(SCENARIOS)))
+    elif section == "Self-Care":
+        signs = rng.sample(BURNOUT_SIGNS, rng.randint(1, 3))
+        await interact(session, stats, session.set_state("Which signs have you experienced recently?", signs))
+
+
+async def learner(url, app, rng, stats, think, stop):
+    """Keep one learner clicking until stop is set
+
+    On the portal, half of the learners are residents and half nurses.
+    """
+    if app == "portal":
+        app = rng.choice(("manual", "nursing"))
+        session = StreamlitSession(url, PORTAL_PAGES[app])
+    else:
+        session = StreamlitSession(url)
+    step = resident_step if app == "manual" else nurse_step
+    try:
+        messages_before = session.messages_received
+        elapsed, received = await asyncio.wait_for(session.connect(), RERUN_TIMEOUT)
+        stats.record(session, elapsed, received, messages_before, connect=True)
+        while not stop.is_set():
+            await asyncio.sleep(rng.uniform(*think))
+            await step(session, rng, stats)
+    except (asyncio.TimeoutError, OSError):
+        pass
+    finally:
+        await session.close()
+
+
+def rss_kb(pid):
+    """Resident set size of a process, from /proc"""
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1])
+    return 0
+
+
+def percentile(values, q):
+    """q-th percentile of durations in seconds, in ms (None without samples)"""
+    if not values:
+        return None
+    ms = statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else values[0]
+    return round(ms * 1000, 1)
+
+
+async def ramp(url, pid, app, levels, duration, think, seed):
+    """Add learners level by level; return one report row per level"""
+    rng = random.Random(seed)
+    stats = LoadStats()
+    stop = asyncio.Event()
+    tasks = []
+    idle_kb = rss_kb(pid)
+    rows = []
+    for level in levels:
+        while len(tasks) < level:
+            learner_rng = random.Random(rng.random())
+            tasks.append(asyncio.create_task(learner(url, app, learner_rng, stats, think, stop)))
+        stats.reset()
+        await asyncio.sleep(duration)
+        window = time.perf_counter() - stats.started
+        server_kb = rss_kb(pid)
+        latencies = stats.latencies
+        rows.append({
+            "sessions": level,
+            "reruns": len(stats.latencies),
+            "reruns_per_s": round(len(stats.latencies) / window, 1),
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "connect_p95_ms": percentile(stats.connects, 95),
+            "msgs_per_s": round(stats.messages / window, 1),
+            "kb_per_s": round(stats.bytes / 1024 / window, 1),
+            "rss_mb": round(server_kb / 1024, 1),
+            "rss_per_session_kb": round((server_kb - idle_kb) / level, 1),
+            "timeouts": stats.timeouts,
+        })
+        print_row(rows[-1])
+    stop.set()
+    await asyncio.gather(*tasks)
+    return rows
+
+
+COLUMNS = [
+    ("sessions", "{:>8}"), ("reruns_per_s", "{:>9}"), ("p50_ms", "{:>8}"), ("p95_ms", "{:>8}"),
+    ("p99_ms", "{:>8}"), ("connect_p95_ms", "{:>13}"), ("msgs_per_s", "{:>8}"), ("kb_per_s", "{:>8}"), ("rss_mb", "{:>8}"),
+    ("rss_per_session_kb", "{:>12}"), ("timeouts", "{:>9}"),
+]
+HEADERS = ["sessions", "reruns/s", "p50 ms", "p95 ms", "p99 ms", "connect p95", "msgs/s", "KB/s", "RSS MB", "RSS/sess KB", "timeouts"]
+
+
+def print_row(row):
+    print("".join(fmt.format("-" if row[key] is None else row[key]) for key, fmt in COLUMNS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--app", choices=("manual", "nursing", "both", "portal"), default="both",
+                        help="one guide, both guides on separate servers, or both pages of portal.py")
+    parser.add_argument("--ramp", default="10,25,50,100,200", help="comma-separated session counts")
+    parser.add_argument("--duration", type=float, default=15, help="measurement seconds per level")
+    parser.add_argument("--think", type=float, nargs=2, default=(0.5, 2.0), metavar=("MIN", "MAX"),
+                        help="think time between clicks in seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    levels = sorted(int(level) for level in args.ramp.split(","))
+    apps = ("manual", "nursing") if args.app == "both" else (args.app,)
+    results = {}
+    for app in apps:
+        port = free_port()
+        process = start_server(SCRIPTS[app], port)
+        try:
+            print(f"\n== {SCRIPTS[app]} ==")
+            print("".join(fmt.format(h) for (_, fmt), h in zip(COLUMNS, HEADERS)))
+            results[app] = asyncio.run(
+                ramp(stream_url(port), process.pid, app, levels, args.duration, args.think, args.seed)
+            )
+        finally:
+            process.terminate()
+            process.wait()
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=1), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
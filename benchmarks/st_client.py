@@ -0,0 +1,179 @@
+"""
+Minimal Streamlit websocket client for the load benchmarks
+
+Speaks the same protocol as the browser: BackMsg rerun requests carrying the
+widget states, ForwardMsg deltas back until the run finishes. Also starts
+the apps headless on a free local port.
+"""
+
+import json
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+WIDGET_TYPES = ("radio", "selectbox", "multiselect", "button", "text_input")
+
+# Widget id under which a custom component's events (setTriggerValue) arrive
+COMPONENT_EVENTS_ID = "$$STREAMLIT_INTERNAL_KEY_{}__events"
+
+
+class StreamlitSession:
+    """One simulated browser tab
+
+    Tracks the widgets seen in the latest runs by label (and the fragment
+    they belong to), custom components by name along with their data, and the
+    bytes/messages received, so callers can drive the app by label and
+    measure what each interaction costs.
+    """
+
+    def __init__(self, url, page_name=""):
+        self.url = url
+        # url_path of the page to run in a multipage app (portal.py)
+        self.page_name = page_name
+        self.ws = None
+        self.widgets = {}
+        self.expanders = {}
+        self.components = {}
+        self.states = {}
+        self.seen = set()
+        self.bytes_received = 0
+        self.messages_received = 0
+
+    async def connect(self):
+        import websockets
+
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        return await self.rerun()
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def rerun(self, fragment_id=""):
+        """Send the current widget states; return (seconds, bytes) once the run finishes"""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_name = self.page_name
+        msg.rerun_script.fragment_id = fragment_id
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        received = 0
+        if not fragment_id:
+            self.seen = set()
+        while True:
+            data = await self.ws.recv()
+            received += len(data)
+            self.messages_received += 1
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            kind = forward.WhichOneof("type")
+            if kind == "delta":
+                self._track(forward.delta)
+            elif kind == "script_finished" and forward.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                break
+        self.bytes_received += received
+        # Like the browser, only send states of widgets still on the page, and
+        # triggers (button clicks) only fire once
+        for widget_id, state in list(self.states.items()):
+            if state.HasField("trigger_value") or state.HasField("json_trigger_value") or (not fragment_id and widget_id not in self.seen):
+                del self.states[widget_id]
+        return time.perf_counter() - start, received
+
+    def _track(self, delta):
+        kind = delta.WhichOneof("type")
+        if kind == "new_element":
+            element = delta.new_element
+            widget_type = element.WhichOneof("type")
+            if widget_type in WIDGET_TYPES:
+                widget = getattr(element, widget_type)
+                self.widgets[widget.label] = (widget.id, delta.fragment_id)
+                self.seen.add(widget.id)
+            elif widget_type == "bidi_component":
+                component = element.bidi_component
+                data = json.loads(component.json) if component.json else None
+                self.components[component.component_name] = (component.id, delta.fragment_id, data)
+                self.seen.add(component.id)
+        elif kind == "add_block" and delta.add_block.WhichOneof("type") == "expandable":
+            expander = delta.add_block.expandable
+            if expander.id:
+                self.expanders[expander.label] = (expander.id, delta.fragment_id)
+                self.seen.add(expander.id)
+
+    def labels(self, prefix=""):
+        """Labels of the widgets on the current page that start with prefix"""
+        return [
+            label for label, (widget_id, _) in self.widgets.items()
+            if widget_id in self.seen and label.strip().startswith(prefix)
+        ]
+
+    def set_state(self, label, value, expander=False):
+        """Record a widget change; return the fragment the widget lives in
+
+        A list value is a multiselect selection, True presses a button (or
+        opens an expander when expander=True), a str is a selected option
+        or typed text.
+        """
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        widget_id, fragment_id = (self.expanders if expander else self.widgets)[label]
+        state = WidgetState(id=widget_id)
+        if expander:
+            state.bool_value = bool(value)
+        elif value is True:
+            state.trigger_value = True
+        elif isinstance(value, list):
+            state.string_array_value.data.extend(value)
+        else:
+            state.string_value = value
+        self.states[widget_id] = state
+        return fragment_id
+
+    def component_data(self, name):
+        """Data the app last sent to the custom component called name"""
+        return self.components[name][2]
+
+    def trigger(self, name, event, value):
+        """Record a custom component event; return the fragment it lives in"""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        component_id, fragment_id, _ = self.components[name]
+        events_id = COMPONENT_EVENTS_ID.format(component_id)
+        payload = json.dumps([{"event": event, "value": value}])
+        self.states[events_id] = WidgetState(id=events_id, json_trigger_value=payload)
+        return fragment_id
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(script, port):
+    """Launch an app headless and wait until it accepts connections"""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", script, "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"streamlit server for {script} did not start")
+
+
+def stream_url(port):
+    return f"ws://127.0.0.1:{port}/_stcore/stream"
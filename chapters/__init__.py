@@ -0,0 +1,6 @@
+"""
+Chapter content of the residents' manual, one module per navigation entry
+Each module defines BLOCKS, the chapter's content records. The navigation
+registry in manual_content names the module of every chapter, and the
+content store imports it on the chapter's first visit.
+"""
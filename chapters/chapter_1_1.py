@@ -0,0 +1,122 @@
+"""
+Chapter 1.1 of the residents' manual: Introduction to Psycho-Oncology
+"""
+
+from content_model import (
+    clinical_tip,
+    columns,
+    key_concept,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+    table,
+    warning,
+)
+
+BLOCKS = (
+    objectives([
+        "Define psycho-oncology and describe its scope and evolution",
+        "Explain the role of the psycho-oncologist within the multidisciplinary oncology team",
+        "Compare global and Indian perspectives on psycho-oncology practice"
+    ]),
+    markdown("""
+    ## 1.1 Definition, Scope, and Evolution
+    
+    Psycho-oncology is a specialized interdisciplinary field that addresses the psychological, social, behavioral, and ethical dimensions of cancer care. The discipline emerged from the recognition that cancer, as a disease, extends far beyond its biological manifestations to profoundly affect the psychological well-being of patients, their families, and even the healthcare professionals who care for them.
+    """),
+    markdown("### The Scope of Psycho-Oncology"),
+    table({
+        "Domain": ["Psychological Responses", "Psychosocial Factors", "Psychological Interventions"],
+        "Description": [
+            "Study of emotional and cognitive responses to cancer at all stages of the disease trajectory",
+            "Investigation of factors that may influence cancer incidence, progression, and outcomes",
+            "Development and implementation of interventions to improve quality of life and clinical outcomes"
+        ]
+    }),
+    markdown("""
+    The evolution of psycho-oncology as a formal discipline can be traced to several key developments. In the mid-twentieth century, pioneering work by Elizabeth Kübler-Ross transformed understanding of death and dying, introducing the influential model of five stages of grief. The formal establishment of the International Psycho-Oncology Society (IPOS) in 1984 marked a milestone in the field's institutional development.
+    """),
+    key_concept("""
+    **Key Historical Milestones:**
+    
+    - **1970s**: Kübler-Ross's work on death and dying
+    - **1984**: Establishment of International Psycho-Oncology Society (IPOS)
+    - **1990s-2000s**: Integration of psychosocial care into oncology guidelines
+    - **Present**: Growing recognition in India with dedicated departments at major cancer centers
+    """),
+    markdown("### 1.2 Role of the Psycho-Oncologist"),
+    markdown("""
+    The psycho-oncologist occupies a unique position within the oncology team, bringing specialized expertise in the assessment and management of psychological disorders while maintaining sensitivity to the medical context of cancer care.
+    """),
+    markdown("**Clinical services provided by psycho-oncologists include:**"),
+    columns(
+        [
+            markdown("""
+            - Assessment and treatment of psychiatric disorders (depression, anxiety, delirium, adjustment disorders)
+            - Management of psychological aspects of pain, fatigue, nausea, and other physical symptoms
+            - Consultation to oncology teams regarding treatment decision-making
+            """),
+        ],
+        [
+            markdown("""
+            - Capacity assessments
+            - Management of treatment refusal
+            - Education and training of oncology staff
+            - Research and quality improvement activities
+            """),
+        ],
+    ),
+    clinical_tip("""
+    **Indian Context:** Psycho-oncology departments have been established at major cancer centers including:
+    - Tata Memorial Hospital, Mumbai
+    - AIIMS, New Delhi
+    - Cancer Institute (WIA), Chennai
+    """),
+    markdown("### 1.3 Global and Indian Perspectives"),
+    markdown("""
+    The global landscape of psycho-oncology reflects both shared challenges and significant disparities in resources and implementation. High-income countries have generally made substantial progress in integrating psychosocial care into standard oncology practice.
+    """),
+    table({
+        "Metric": [
+            "Estimated annual new cancer cases",
+            "Common cancers in men",
+            "Common cancers in women",
+            "Prevalence of depression in advanced cancer",
+            "Prevalence of anxiety in cancer patients"
+        ],
+        "Value": [
+            "~1.4 million",
+            "Head and neck, lung, GI cancers",
+            "Breast, cervical, gynecological cancers",
+            "15-30%",
+            "20-25%"
+        ]
+    }, "Key Cancer Statistics in India"),
+    warning("""
+    **Challenges for Psycho-Oncology in India:**
+    
+    - Fragmented cancer care system
+    - Disparities between urban and rural access
+    - Significant public-private sector differences
+    - Cultural factors (stigma, family dynamics, traditional healing)
+    - Limited resources outside major urban centers
+    """),
+    summary("""
+    Psycho-oncology is an interdisciplinary field addressing the psychological, social, and behavioral dimensions of cancer care. The psycho-oncologist plays a unique role in assessing and treating psychiatric disorders while integrating medical knowledge with psychological expertise. India faces significant challenges in cancer care delivery, requiring culturally adapted approaches to psycho-oncology practice.
+    """),
+    review_questions([
+        (
+            "What are the three primary domains of psycho-oncology?",
+            "Psychological responses to cancer at every stage of the disease; psychosocial factors that may influence cancer incidence, progression and outcomes; and psychological interventions that improve quality of life and clinical outcomes."
+        ),
+        (
+            "How does the role of the psycho-oncologist differ from that of a general psychiatrist?",
+            "The psycho-oncologist treats psychiatric disorders within the medical context of cancer. This includes the psychological side of pain, fatigue and nausea, consultation to the oncology team on treatment decisions, capacity assessments, managing treatment refusal, and teaching oncology staff."
+        ),
+        (
+            "What are the main challenges for psycho-oncology practice in India?",
+            "A fragmented cancer care system, urban-rural disparities in access, public-private sector differences, cultural factors (stigma, family dynamics, traditional healing), and limited resources outside the major urban centres."
+        )
+    ]),
+)
@@ -0,0 +1,120 @@
+"""
+Chapter 1.2 of the residents' manual: Epidemiology of Cancer in India
+"""
+
+from content_model import (
+    case_study,
+    clinical_tip,
+    key_concept,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+    table,
+)
+
+BLOCKS = (
+    objectives([
+        "Describe the epidemiology of common cancers in India",
+        "Explain how sociocultural determinants influence cancer presentation",
+        "Discuss the psychological burden of cancer in Indian patients"
+    ]),
+    markdown("## 1.2 Epidemiology of Cancer in India"),
+    markdown("""
+    India faces a significant and growing cancer burden that presents unique challenges for healthcare systems and mental health professionals. The epidemiology of cancer in India differs in important ways from that observed in Western countries.
+    """),
+    markdown("### Common Cancers by Gender"),
+    table({
+        "Gender": ["Men", "Women"],
+        "Most Common Cancers": [
+            "Head and neck cancers, lung cancer, gastrointestinal cancers",
+            "Breast cancer, cervical cancer, gynecological cancers"
+        ],
+        "Key Risk Factors": [
+            "Tobacco use, diet, H. pylori infection",
+            "Reproductive factors, HPV infection, lifestyle changes"
+        ]
+    }),
+    clinical_tip("""
+    **Regional Variations:**
+    
+    - **North India**: Higher rates of tobacco-related cancers
+    - **South India**: Higher rates of breast cancer
+    - **Northeast India**: Higher rates of esophageal and lung cancer
+    - **Urban areas**: Increasing breast cancer rates
+    - **Rural areas**: Higher rates of cervical cancer
+    """),
+    markdown("### 1.2.1 Sociocultural Determinants of Cancer Presentation"),
+    markdown("""
+    The presentation of cancer in Indian patients is profoundly shaped by sociocultural factors that influence help-seeking behavior, symptom interpretation, treatment decisions, and psychological response.
+    """),
+    table({
+        "Factor": [
+            "Health Literacy",
+            "Stigma",
+            "Family Structures",
+            "Religious Beliefs",
+            "Traditional Healing"
+        ],
+        "Impact": [
+            "Limited knowledge delays presentation",
+            "Cancer perceived as divine punishment or moral failing",
+            "Extended family central to healthcare decisions",
+            "Provide resources and challenges for coping",
+            "Ayurveda, Siddha consulted alongside oncologists"
+        ]
+    }, "Key Sociocultural Factors"),
+    case_study(
+        "1.2.1",
+        "Delayed Presentation Due to Traditional Beliefs",
+        """
+        **Patient:** 55-year-old farmer from Bihar
+        
+        **Presentation:** 6-month history of oral ulcer treated by traditional healers
+        
+        **Outcome:** Diagnosed with oral cavity cancer after failing to improve
+        
+        **Factors:** Belief that illness was "bad karma" requiring spiritual healing
+        
+        **Lesson:** Cultural beliefs can significantly delay presentation and treatment
+        """
+    ),
+    markdown("### 1.2.2 Psychological Burden of Cancer in Indian Patients"),
+    table({
+        "Condition": ["Depression", "Anxiety Disorders", "Adjustment Disorders", "Significant Distress"],
+        "Prevalence": ["15-30%", "20-25%", "20-35%", "50%+"],
+        "Notes": [
+            "Higher in advanced disease",
+            "Includes procedural and health anxiety",
+            "Most common psychiatric diagnosis",
+            "Subthreshold distress requiring attention"
+        ]
+    }, "Psychological Morbidity in Indian Cancer Patients"),
+    key_concept("""
+    **Risk Factors for Psychological Morbidity:**
+    
+    1. Advanced disease stage
+    2. Uncontrolled pain
+    3. Poor performance status
+    4. Lack of social support
+    5. Financial toxicity
+    6. Late presentation
+    """),
+    summary("""
+    India faces a growing cancer burden with distinct epidemiological patterns. Sociocultural factors including stigma, family dynamics, and traditional healing practices significantly influence cancer presentation and care. Psychological morbidity is substantial, with depression, anxiety, and adjustment disorders being the most common presentations.
+    """),
+    review_questions([
+        (
+            "How does the epidemiology of cancer in India differ from Western countries?",
+            "In men, head and neck, lung and gastrointestinal cancers are the most common (risk factors: tobacco use, diet, H. pylori infection). In women, breast, cervical and other gynecological cancers are the most common (reproductive factors, HPV infection, lifestyle changes). Rates vary by region: tobacco-related cancers in the north, breast cancer in the south, esophageal and lung cancer in the northeast, rising breast cancer in urban areas and more cervical cancer in rural areas."
+        ),
+        (
+            "What sociocultural factors influence cancer presentation in Indian patients?",
+            "Limited health literacy delays presentation. Stigma frames cancer as divine punishment or moral failing. The extended family is central to healthcare decisions. Religious beliefs can help or hinder coping. Traditional healing (Ayurveda, Siddha) is consulted alongside oncologists."
+        ),
+        (
+            "What is the approximate prevalence of depression in Indian cancer patients?",
+            "About 15-30%, and higher in advanced disease. Anxiety disorders affect 20-25%, adjustment disorders 20-35%, and more than half of patients have significant distress."
+        )
+    ]),
+)
@@ -0,0 +1,106 @@
+"""
+Chapter 1.3 of the residents' manual: Biopsychosocial Model in Oncology
+"""
+
+from content_model import (
+    clinical_tip,
+    key_concept,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+    table,
+)
+
+BLOCKS = (
+    objectives([
+        "Explain the biopsychosocial model as applied to oncology",
+        "Discuss how family systems operate in the Indian collectivist culture",
+        "Describe the role of illness narratives and meaning-making in cancer adaptation"
+    ]),
+    markdown("## 1.3 Biopsychosocial Model in Oncology"),
+    markdown("""
+    The biopsychosocial model, articulated by George Engel in 1977, provides a comprehensive framework for understanding cancer that transcends purely biological explanations to encompass the full range of human experience.
+    """),
+    objectives([
+        "Explain the biopsychosocial model as applied to oncology",
+        "Discuss how family systems operate in the Indian collectivist culture",
+        "Describe the role of illness narratives and meaning-making in cancer adaptation"
+    ]),
+    markdown("### Dimensions of the Biopsychosocial Model"),
+    table({
+        "Dimension": ["Biological", "Psychological", "Social", "Spiritual/Existential"],
+        "Key Considerations": [
+            "Disease stage, treatment side effects, biological mechanisms",
+            "Cognitive appraisals, emotional responses, coping styles",
+            "Family relationships, social support, socioeconomic factors",
+            "Meaning-making, religious beliefs, death anxiety"
+        ]
+    }),
+    key_concept("""
+    **Biological Dimension:**
+    
+    - Disease stage determines prognosis and treatment options
+    - Treatment side effects (fatigue, pain, nausea, cognitive changes) have psychological consequences
+    - Certain cancers (pancreatic, lung) show stronger associations with depression
+    """),
+    markdown("### 1.3.1 Family Systems and Collectivist Culture"),
+    markdown("""
+    The family constitutes the primary unit of care in Indian society, and cancer is appropriately understood as a family diagnosis rather than an individual illness.
+    """),
+    markdown("**Family Roles in Cancer Care:**"),
+    table({
+        "Role": ["Practical Support", "Emotional Support", "Financial Support", "Decision-Making"],
+        "Examples": [
+            "Accompanying to appointments, managing medications, transportation",
+            "Listening, comforting, encouraging",
+            "Pooling resources, managing medical expenses",
+            "Participating in treatment decisions"
+        ]
+    }),
+    clinical_tip("""
+    **Cultural Consideration:**
+    
+    The family unit in India may include not only immediate relatives but also in-laws, clan elders, or community leaders whose opinions carry significant weight. Identifying key stakeholders is essential for effective communication.
+    """),
+    markdown("### 1.3.2 Illness Narratives and Meaning-Making"),
+    markdown("""
+    Cancer disrupts the life narrative that individuals construct to make sense of their experiences and identity. Patients develop an "illness narrative" that helps them understand what is happening and what it means.
+    """),
+    table({
+        "Pattern": ["Restitution", "Chaos", "Quest"],
+        "Description": [
+            "Emphasize recovery and return to normal life",
+            "Portray illness as overwhelming and incomprehensible",
+            "Frame cancer as a journey leading to growth or insight"
+        ]
+    }, "Common Narrative Patterns"),
+    key_concept("""
+    **Indian Context:**
+    
+    Illness narratives are shaped by religious and philosophical traditions:
+    
+    - **Hindu concepts of karma**: Current suffering as consequence of past actions
+    - **Divine will**: Illness as spiritual test
+    - **Buddhist perspectives**: Impermanence and detachment
+    
+    These frameworks may provide comfort or generate distress depending on interpretation.
+    """),
+    summary("""
+    The biopsychosocial model provides a comprehensive framework for understanding cancer that encompasses biological, psychological, social, and spiritual dimensions. In Indian culture, family systems play a central role in cancer care, with collectivist values shaping decision-making and support. Illness narratives help patients integrate cancer into their life story, with meaning-making influenced by religious and cultural frameworks.
+    """),
+    review_questions([
+        (
+            "What are the four dimensions of the biopsychosocial model?",
+            "Biological (disease stage, treatment effects), psychological (appraisals, emotions, coping), social (family, support, socioeconomic factors) and spiritual/existential (meaning, religious beliefs, death anxiety)."
+        ),
+        (
+            "How does the collectivist nature of Indian families influence cancer care?",
+            "Cancer is a family diagnosis. The family provides practical, emotional and financial support and takes part in treatment decisions, sometimes with in-laws, elders or community leaders. Identifying the key stakeholders is essential for effective communication."
+        ),
+        (
+            "What are the three common narrative patterns in illness narratives?",
+            "Restitution, which emphasizes recovery and a return to normal life. Chaos, in which illness is overwhelming and incomprehensible. Quest, which frames cancer as a journey leading to growth or insight."
+        )
+    ]),
+)
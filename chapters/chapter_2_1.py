@@ -0,0 +1,99 @@
+"""
+Chapter 2.1 of the residents' manual: Psychological Responses to Cancer Diagnosis
+"""
+
+from content_model import (
+    case_study,
+    columns,
+    key_concept,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+    table,
+)
+
+BLOCKS = (
+    objectives([
+        "Describe common emotional responses to cancer diagnosis",
+        "Explain cultural variations in the expression of distress",
+        "Differentiate normal from pathological responses to diagnosis"
+    ]),
+    markdown("## 2.1 Psychological Responses to Cancer Diagnosis"),
+    markdown("""
+    The diagnosis of cancer typically precipitates a crisis that triggers intense emotional responses. While these responses are highly variable across individuals, certain emotional reactions are sufficiently common to be considered characteristic.
+    """),
+    table({
+        "Response": ["Shock", "Denial", "Anger", "Fear", "Guilt"],
+        "Clinical Features": [
+            "Numbness, disbelief, sense of unreality, impaired processing",
+            "Protective mechanism allowing gradual absorption of reality",
+            "May be directed at cancer, healthcare system, family, or fate",
+            "Pervasive; may concern disease, treatment, death, social consequences",
+            "Self-blame for past behaviors, perceived moral failings, burden on family"
+        ]
+    }, "Common Emotional Responses to Diagnosis"),
+    markdown("### 2.1.1 Cultural Expressions of Distress"),
+    markdown("""
+    The expression of psychological distress is profoundly shaped by cultural norms. Indian culture, with its emphasis on emotional restraint, family privacy, and collective over individual expression, shapes how cancer-related distress is manifested.
+    """),
+    key_concept("""
+    **Cultural Patterns in Distress Expression:**
+    
+    1. **Emotional restraint**: Cultural value of "sthithi" may lead to minimization
+    2. **Somatization**: Body as culturally sanctioned medium for distress
+    3. **Gender modulation**: Emotional expression may be more accepted from women
+    4. **Religious expression**: Prayer, rituals, spiritual consultation
+    """),
+    markdown("### 2.1.2 Normal vs Pathological Responses"),
+    columns(
+        [
+            markdown("**Normal Response Characteristics:**"),
+            markdown("""
+            - Intense but time-limited emotions
+            - Gradual diminution over weeks to months
+            - Maintenance of engagement with treatment
+            - Ability to make use of support
+            """),
+        ],
+        [
+            markdown("**Pathological Response Red Flags:**"),
+            markdown("""
+            - Persistent inability to function
+            - Meets criteria for psychiatric disorder
+            - Expressed thoughts of self-harm or suicide
+            - Self-neglect or treatment refusal
+            """),
+        ],
+    ),
+    case_study(
+        "2.1.1",
+        "Typical Initial Response",
+        """
+        **Patient:** 48-year-old businessman with newly diagnosed lung cancer
+        
+        **Response:** Intense shock and disbelief on first visit, unable to recall information given during consultation. Returned with wife 1 week later in better emotional state, with questions about treatment options.
+        
+        **Assessment:** Normal acute response to diagnosis
+        
+        **Management:** Supportive follow-up, clear communication, family involvement
+        """
+    ),
+    summary("""
+    Cancer diagnosis triggers characteristic emotional responses including shock, denial, anger, fear, and guilt. Cultural norms shape how distress is expressed, with Indian patients often demonstrating emotional restraint and somatization. Normal responses are time-limited and improve with supportive care, while pathological responses require specific intervention.
+    """),
+    review_questions([
+        (
+            "Describe the five common emotional responses to cancer diagnosis.",
+            "Shock: numbness, disbelief, impaired processing. Denial: a protective mechanism allowing gradual absorption of reality. Anger at the cancer, the healthcare system, family or fate. Fear of the disease, treatment, death or social consequences. Guilt: self-blame for past behaviour or for being a burden on the family."
+        ),
+        (
+            "How does Indian culture influence the expression of psychological distress?",
+            "Emotional restraint may lead to minimization of distress. Somatization makes the body a culturally sanctioned medium for distress. Emotional expression may be more accepted from women. Distress is often expressed through prayer, rituals and spiritual consultation."
+        ),
+        (
+            "What are the red flags that suggest a normal response has become pathological?",
+            "Persistent inability to function, symptoms meeting criteria for a psychiatric disorder, thoughts of self-harm or suicide, and self-neglect or treatment refusal. A normal response is intense but time-limited and eases over weeks to months."
+        )
+    ]),
+)
@@ -0,0 +1,127 @@
+"""
+Chapter 2.2 of the residents' manual: Adjustment Disorders in Cancer Patients
+"""
+
+from content_model import (
+    case_study,
+    clinical_tip,
+    key_concept,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+    table,
+)
+
+BLOCKS = (
+    objectives([
+        "Describe the diagnostic criteria for adjustment disorders",
+        "Identify common clinical presentations in cancer patients",
+        "Outline evidence-based management strategies"
+    ]),
+    markdown("## 2.2 Adjustment Disorders in Cancer Patients"),
+    markdown("""
+    Adjustment disorders represent one of the most common psychiatric diagnoses in cancer populations, reflecting the significant psychological stress inherent in cancer diagnosis and treatment.
+    """),
+    objectives([
+        "Describe the diagnostic criteria for adjustment disorders",
+        "Identify common clinical presentations in cancer patients",
+        "Outline evidence-based management strategies"
+    ]),
+    markdown("### 2.2.1 Diagnostic Criteria"),
+    markdown("""
+    Adjustment disorders are characterized by emotional or behavioral symptoms in response to an identifiable stressor that develop within three months of the stressor's onset.
+    """),
+    table({
+        "Subtype": [
+            "With depressed mood",
+            "With anxiety",
+            "With mixed anxiety and depressed mood",
+            "With disturbance of conduct"
+        ],
+        "Features": [
+            "Sadness, tearfulness, feelings of hopelessness",
+            "Nervousness, worry, jitteriness",
+            "Both depressive and anxiety symptoms",
+            "Behavioral problems, violation of norms"
+        ]
+    }, "DSM-5 Subtypes of Adjustment Disorder"),
+    key_concept("""
+    **Diagnostic Criteria Requirements:**
+    
+    1. Identifiable stressor (cancer diagnosis, treatment, complications)
+    2. Symptoms develop within 3 months of stressor onset
+    3. Clinically significant distress or impairment
+    4. Symptoms not persisting >6 months after stressor ends
+    
+    **Prevalence:** 15-35% of cancer patients
+    """),
+    markdown("### 2.2.2 Clinical Presentation"),
+    markdown("**With Depressed Mood:**"),
+    markdown("""
+    - Persistent low mood and tearfulness
+    - Pessimism about treatment outcomes
+    - Sleep disturbance and appetite changes
+    - Social withdrawal
+    """),
+    markdown("**With Anxiety:**"),
+    markdown("""
+    - Excessive worry about prognosis and treatment
+    - Somatic symptoms of anxiety (palpitations, sweating)
+    - Reassurance-seeking behaviors
+    - Sleep disturbance
+    """),
+    case_study(
+        "2.2.1",
+        "Adjustment Disorder with Depressed Mood",
+        """
+        **Patient:** 52-year-old school teacher with oral cavity cancer
+        
+        **Situation:** Post-surgical resection with significant facial disfigurement and speech difficulty
+        
+        **Symptoms:** Withdrawn, missed appointments, stated "there is no point in continuing"
+        
+        **Treatment:**
+        - Supportive psychotherapy (8 sessions)
+        - Grief work related to losses
+        - Cognitive restructuring of catastrophic beliefs
+        - Family involvement (wife joined sessions)
+        
+        **Outcome:** Returned to part-time teaching, mood improved substantially
+        """
+    ),
+    markdown("### 2.2.3 Management Strategies"),
+    table({
+        "Intervention": ["Supportive Psychotherapy", "Psychoeducation", "CBT Techniques", "Pharmacotherapy"],
+        "Description": [
+            "Therapeutic alliance, emotional validation, coping enhancement",
+            "Understanding normal responses, expected course, treatment options",
+            "Cognitive restructuring, behavioral activation, relaxation",
+            "SSRIs/SNRIs for severe symptoms; benzodiazepines for acute anxiety"
+        ]
+    }, "Management Components"),
+    clinical_tip("""
+    **Stepped Care Approach:**
+    
+    1. **Mild**: Supportive counseling and psychoeducation
+    2. **Moderate**: Structured psychotherapy (CBT, supportive therapy)
+    3. **Severe**: Combination of psychotherapy and pharmacotherapy
+    """),
+    summary("""
+    Adjustment disorders are characterized by emotional or behavioral symptoms in response to cancer-related stressors that cause significant distress or impairment. Clinical presentations vary and may include depressed mood, anxiety, or behavioral disturbances. Management involves supportive psychotherapy, psychoeducation, and potentially pharmacotherapy.
+    """),
+    review_questions([
+        (
+            "What are the DSM-5 subtypes of adjustment disorder?",
+            "With depressed mood, with anxiety, with mixed anxiety and depressed mood, and with disturbance of conduct."
+        ),
+        (
+            "How does adjustment disorder with depressed mood typically present in cancer patients?",
+            "Within three months of a cancer-related stressor, with persistent low mood and tearfulness, pessimism about treatment outcomes, sleep and appetite changes, and social withdrawal, causing clinically significant distress or impairment."
+        ),
+        (
+            "What are the key components of management for adjustment disorders?",
+            "Supportive psychotherapy, psychoeducation about normal responses and the expected course, and CBT techniques. SSRIs/SNRIs are used for severe symptoms and benzodiazepines for acute anxiety. Care is stepped: supportive counseling and psychoeducation for mild, structured psychotherapy for moderate, and psychotherapy combined with pharmacotherapy for severe symptoms."
+        )
+    ]),
+)
@@ -0,0 +1,119 @@
+"""
+Chapter 2.3 of the residents' manual: Anxiety Disorders in Oncology
+"""
+
+from content_model import (
+    case_study,
+    columns,
+    key_concept,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+    table,
+)
+
+BLOCKS = (
+    objectives([
+        "Describe the spectrum of anxiety in cancer patients",
+        "Identify specific anxiety disorders commonly encountered",
+        "Implement evidence-based treatment approaches"
+    ]),
+    markdown("## 2.3 Anxiety Disorders in Oncology"),
+    markdown("""
+    Anxiety is among the most common psychological responses to cancer, occurring across the disease trajectory from diagnosis through survivorship or end-of-life care.
+    """),
+    objectives([
+        "Describe the spectrum of anxiety in cancer patients",
+        "Identify specific anxiety disorders commonly encountered",
+        "Implement evidence-based treatment approaches"
+    ]),
+    markdown("### 2.3.1 Cancer-Related Anxiety"),
+    table({
+        "Source": ["Disease-related", "Treatment-related", "Existential", "Social", "Practical/Financial"],
+        "Examples": [
+            "Fear of progression, recurrence, metastasis, death",
+            "Worry about efficacy, side effects, procedural experiences",
+            "Concerns about mortality, meaning, human existence",
+            "Impact on relationships, work, social roles",
+            "Treatment costs, employment impact, caregiving burden"
+        ]
+    }, "Sources of Cancer-Related Anxiety"),
+    key_concept("""
+    **Fear of Cancer Recurrence:**
+    
+    - Most prevalent concern among cancer survivors (20-70%)
+    - Associated with: younger age, greater symptom burden, lower quality of life
+    - May persist for years after treatment completion
+    - Interventions: CBT, mindfulness, meaning-making therapies
+    """),
+    markdown("### 2.3.2 Specific Anxiety Disorders"),
+    markdown("**Panic Disorder:**"),
+    markdown("""
+    Cancer patients may experience spontaneous panic attacks triggered by physical sensations interpreted catastrophically or occurring de novo due to physiological stress.
+    """),
+    markdown("**Specific Phobias:**"),
+    table({
+        "Phobia": ["Needle Phobia", "Blood/Injury Fear", "Claustrophobia", "Dental Phobia"],
+        "Relevance": ["Chemotherapy, blood draws", "Surgical procedures", "MRI scans", "Dental work for head/neck cancer"]
+    }),
+    case_study(
+        "2.3.1",
+        "Panic Disorder with Agoraphobia",
+        """
+        **Patient:** 45-year-old housewife undergoing chemotherapy
+        
+        **Presentation:** Panic attack during second infusion, developed anticipatory anxiety
+        
+        **Symptoms:** Palpitations, breathlessness, dizziness, fear of dying
+        
+        **Course:** Avoided social situations, considered refusing treatment
+        
+        **Treatment:**
+        - Psychoeducation about panic
+        - Cognitive restructuring
+        - Graduated exposure to chemotherapy setting
+        - Relaxation techniques
+        - Sertraline 50mg daily
+        
+        **Outcome:** Completed remaining chemotherapy with minimal distress
+        """
+    ),
+    markdown("### 2.3.3 Management Approaches"),
+    columns(
+        [
+            markdown("**Psychological Interventions:**"),
+            markdown("""
+            - Cognitive-behavioral therapy
+            - Exposure-based treatment for phobias
+            - Relaxation training
+            - Mindfulness-based interventions
+            """),
+        ],
+        [
+            markdown("**Pharmacological Interventions:**"),
+            markdown("""
+            - SSRIs as first-line for anxiety disorders
+            - Benzodiazepines for acute symptom relief (short-term)
+            - Careful consideration of drug interactions
+            """),
+        ],
+    ),
+    summary("""
+    Anxiety in cancer patients encompasses a spectrum from adaptive responses to pathological anxiety disorders. Common presentations include generalized anxiety, panic disorder, specific phobias related to medical procedures, and illness anxiety. Management combines psychological interventions (particularly CBT) and pharmacotherapy (SSRIs, short-term benzodiazepines).
+    """),
+    review_questions([
+        (
+            "What are the major sources of anxiety for cancer patients?",
+            "Disease-related: progression, recurrence, death. Treatment-related: efficacy, side effects, procedures. Existential: mortality and meaning. Social: relationships, work and roles. Practical and financial: costs, employment and caregiving. Fear of recurrence is the most prevalent concern among survivors."
+        ),
+        (
+            "How does panic disorder present in cancer patients?",
+            "Spontaneous panic attacks, triggered by physical sensations interpreted catastrophically or occurring de novo from physiological stress, with palpitations, breathlessness, dizziness and fear of dying. Anticipatory anxiety and avoidance can follow; the patient in the chapter's case considered refusing chemotherapy."
+        ),
+        (
+            "What are the key components of anxiety management in oncology?",
+            "Psychological treatment: CBT, exposure for procedural phobias, relaxation training and mindfulness. Medication: SSRIs first line, benzodiazepines short-term for acute relief, with careful attention to drug interactions."
+        )
+    ]),
+)
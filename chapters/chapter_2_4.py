@@ -0,0 +1,124 @@
+"""
+Chapter 2.4 of the residents' manual: Depression in Cancer
+"""
+
+from content_model import (
+    case_study,
+    key_concept,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+    table,
+    warning,
+)
+
+BLOCKS = (
+    objectives([
+        "Describe the diagnostic challenges in assessing depression in cancer patients",
+        "Differentiate depression from cancer-related somatic symptoms",
+        "Conduct suicide risk assessment in oncology patients"
+    ]),
+    markdown("## 2.4 Depression in Cancer"),
+    markdown("""
+    Depression is one of the most common and debilitating psychiatric complications of cancer, affecting an estimated 15 to 30 percent of patients.
+    """),
+    objectives([
+        "Describe the diagnostic challenges in assessing depression in cancer patients",
+        "Differentiate depression from cancer-related somatic symptoms",
+        "Conduct suicide risk assessment in oncology patients"
+    ]),
+    markdown("### 2.4.1 Diagnostic Challenges"),
+    markdown("""
+    The diagnosis of depression in cancer patients presents significant challenges that can lead to under-recognition and under-treatment.
+    """),
+    table({
+        "Challenge": ["Symptom Overlap", "Somatic Presentation", "Cultural Factors", "Attribution Bias"],
+        "Description": [
+            "Fatigue, sleep disturbance, appetite change common to both",
+            "Indian patients often express distress somatically",
+            "Emotional restraint may minimize reported suffering",
+            "Clinicians may attribute symptoms to cancer rather than depression"
+        ]
+    }, "Diagnostic Challenges"),
+    key_concept("""
+    **Strategies for Improved Diagnosis:**
+    
+    1. **Emphasize psychological symptoms**: mood, anhedonia, guilt, worthlessness, hopelessness, suicidal ideation
+    2. **Consider symptom timing**: predating cancer or disproportionate to disease stage
+    3. **Use collateral information**: family perspective on baseline functioning
+    4. **Screen systematically**: use validated tools
+    """),
+    markdown("### 2.4.2 Differentiating Depression from Cancer-Related Somatic Symptoms"),
+    markdown("**Symptoms Suggestive of Depression:**"),
+    table({
+        "Symptom": ["Sleep Disturbance", "Appetite Change", "Fatigue", "Cognitive Complaints"],
+        "Depressive Features": [
+            "Early morning awakening (2+ hours before desired time)",
+            "Significant decrease with weight loss not explained by cancer",
+            "Overwhelming exhaustion not relieved by rest, impairing all domains",
+            "Subjective complaints disproportionate to objective findings"
+        ]
+    }, "Differentiating Features"),
+    markdown("### 2.4.3 Suicide Risk Assessment"),
+    markdown("""
+    Cancer patients face elevated suicide risk (2-3 times general population). Systematic assessment is essential.
+    """),
+    table({
+        "Category": ["Psychiatric", "Medical", "Social", "Demographic"],
+        "Factors": [
+            "Depression, prior suicide attempt",
+            "Advanced disease, uncontrolled pain, functional decline",
+            "Social isolation, inadequate support",
+            "Male gender, older age"
+        ]
+    }, "Suicide Risk Factors"),
+    warning("""
+    **Assessment Components:**
+    
+    1. Frequency, duration, and intensity of suicidal ideation
+    2. Presence of plans for how suicide would be accomplished
+    3. Access to means
+    4. Any intent to act on ideation
+    5. Protective factors and reasons for living
+    6. History of prior suicide attempts
+    """),
+    case_study(
+        "2.4.1",
+        "Depression with Passive Suicidal Ideation",
+        """
+        **Patient:** 58-year-old businessman with metastatic lung cancer
+        
+        **Presentation:** Referred after stating "I don't want to live like this anymore"
+        
+        **History:** 6-week progressive mood decline, poor prognosis, smoking-related guilt
+        
+        **Assessment:** Major depressive disorder, passive suicidal ideation, no plan/intent
+        
+        **Treatment:**
+        - Supportive psychotherapy
+        - Cognitive therapy for guilt and all-or-nothing thinking
+        - Sertraline initiated
+        - Safety planning with family
+        
+        **Outcome:** Mood improved gradually, engaged with family, died peacefully 3 months later
+        """
+    ),
+    summary("""
+    Depression diagnosis in cancer patients is complicated by symptom overlap with cancer and treatment effects. Psychological symptoms such as guilt, worthlessness, and suicidal ideation are particularly valuable for diagnosis. Suicide risk is elevated in cancer patients and requires systematic assessment. Management combines psychotherapy and pharmacotherapy.
+    """),
+    review_questions([
+        (
+            "What are the main diagnostic challenges in assessing depression in cancer patients?",
+            "Somatic symptoms (fatigue, sleep and appetite change) overlap with cancer and its treatment. Indian patients often express distress somatically, and emotional restraint minimizes reported suffering. Clinicians may attribute symptoms to the cancer rather than depression. Emphasize psychological symptoms, symptom timing, collateral history and systematic screening."
+        ),
+        (
+            "How would you differentiate depressive fatigue from cancer-related fatigue?",
+            "Depressive fatigue is overwhelming exhaustion that is not relieved by rest and impairs all domains. Look for the psychological symptoms of depression (low mood, anhedonia, guilt, worthlessness, hopelessness), for symptoms that predate the cancer or are disproportionate to the disease stage, and for the family's view of baseline functioning."
+        ),
+        (
+            "What are the key components of suicide risk assessment in oncology patients?",
+            "The frequency, duration and intensity of suicidal ideation; any plan; access to means; intent to act; protective factors and reasons for living; and prior attempts. Weigh these against the risk factors: depression, advanced disease, uncontrolled pain, isolation, male sex and older age."
+        )
+    ]),
+)
@@ -0,0 +1,122 @@
+"""
+Chapter 2.5 of the residents' manual: Delirium and Neuropsychiatric Syndromes
+"""
+
+from content_model import (
+    bullets,
+    clinical_tip,
+    columns,
+    key_concept,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+    table,
+)
+
+BLOCKS = (
+    objectives([
+        "Describe the clinical features and causes of delirium in cancer patients",
+        "Identify neuropsychiatric complications of cancer and its treatment",
+        "Outline management approaches for delirium"
+    ]),
+    markdown("## 2.5 Delirium and Neuropsychiatric Syndromes"),
+    markdown("""
+    Delirium is the most common neuropsychiatric complication of advanced cancer, affecting an estimated 25 to 40 percent of hospitalized cancer patients and up to 85 percent in the terminal phase.
+    """),
+    objectives([
+        "Describe the clinical features and causes of delirium in cancer patients",
+        "Identify neuropsychiatric complications of cancer and its treatment",
+        "Outline management approaches for delirium"
+    ]),
+    markdown("### 2.5.1 Delirium in Advanced Cancer"),
+    markdown("**Clinical Features:**"),
+    table({
+        "Domain": ["Core", "Cognitive", "Psychomotor", "Circadian"],
+        "Features": [
+            "Disturbance in attention and awareness",
+            "Disorientation, memory impairment, language disturbance, perceptual disturbances",
+            "Hyperactive (agitation), hypoactive (lethargy), or mixed",
+            "Symptoms fluctuate throughout the day"
+        ]
+    }),
+    markdown("**Causes in Cancer Patients (typically multifactorial):**"),
+    bullets([
+        "Medications (opioids, benzodiazepines, anticholinergics, corticosteroids)",
+        "Metabolic disturbances (electrolyte abnormalities, hepatic/renal failure)",
+        "Infection",
+        "Hypoxia",
+        "Dehydration and nutritional deficiencies",
+        "Brain metastases or leptomeningeal disease"
+    ]),
+    key_concept("""
+    **Delirium Subtypes:**
+    
+    1. **Hyperactive**: Agitation, restlessness, hallucinations, attempts to remove devices
+    2. **Hypoactive**: Reduced motor activity, lethargy, decreased responsiveness (more common, often under-recognized)
+    3. **Mixed**: Fluctuations between hyperactive and hypoactive states
+    """),
+    markdown("### 2.5.2 Brain Metastases and Paraneoplastic Syndromes"),
+    columns(
+        [
+            markdown("**Brain Metastases:**"),
+            markdown("""
+            - Occur in 20-40% of cancer patients
+            - Higher rates in lung, breast, melanoma
+            - Psychiatric symptoms: personality change, emotional lability, depression, psychosis, cognitive impairment
+            - Any new psychiatric symptom warrants neurological evaluation
+            """),
+        ],
+        [
+            markdown("**Paraneoplastic Syndromes:**"),
+            markdown("""
+            - Remote effects of cancer via immune mechanisms
+            - Can affect any part of nervous system
+            - Psychiatric presentations: psychosis, depression, cognitive impairment
+            - May precede cancer diagnosis
+            """),
+        ],
+    ),
+    markdown("### 2.5.3 Chemotherapy-Related Cognitive Impairment"),
+    markdown("""
+    Cognitive impairment associated with cancer and its treatments ("chemo brain") affects an estimated 15 to 75 percent of cancer patients.
+    """),
+    table({
+        "Domain": ["Attention", "Processing Speed", "Working Memory", "Executive Function"],
+        "Deficit": ["Concentration difficulties", "Slowed thinking", "Memory problems", "Planning/organization difficulties"]
+    }, "Cognitive Domains Affected"),
+    markdown("**Contributing Factors:**"),
+    bullets([
+        "Direct neurotoxic effects of chemotherapy",
+        "Hormonal therapies (particularly breast cancer)",
+        "Radiation therapy to the brain",
+        "Fatigue, sleep disturbance, depression, anxiety",
+        "Supportive medications (benzodiazepines, opioids)"
+    ]),
+    clinical_tip("""
+    **Management of Cognitive Impairment:**
+    
+    1. Address modifiable contributing factors
+    2. Cognitive rehabilitation strategies
+    3. External memory aids and compensatory strategies
+    4. Lifestyle interventions (exercise, stress management)
+    5. Psychostimulants for persistent, functionally significant impairment
+    """),
+    summary("""
+    Delirium is the most common neuropsychiatric complication in advanced cancer, presenting with attention deficits, cognitive impairment, and psychomotor changes. Causes are typically multifactorial. Brain metastases and paraneoplastic syndromes can also produce psychiatric symptoms. Chemotherapy-related cognitive impairment affects many patients and requires multimodal management.
+    """),
+    review_questions([
+        (
+            "What are the core clinical features of delirium?",
+            "A disturbance in attention and awareness whose symptoms fluctuate through the day, with cognitive changes (disorientation, memory, language and perceptual disturbances) and psychomotor changes (hyperactive, hypoactive or mixed)."
+        ),
+        (
+            "List the common causes of delirium in cancer patients.",
+            "Medications (opioids, benzodiazepines, anticholinergics, corticosteroids), metabolic disturbances (electrolytes, hepatic or renal failure), infection, hypoxia, dehydration and nutritional deficiencies, and brain metastases or leptomeningeal disease. Causes are typically multifactorial."
+        ),
+        (
+            "What is the difference between hyperactive and hypoactive delirium?",
+            "Hyperactive delirium shows agitation, restlessness, hallucinations and attempts to remove devices. Hypoactive delirium shows reduced motor activity, lethargy and decreased responsiveness; it is more common and often under-recognized. Mixed delirium fluctuates between the two."
+        )
+    ]),
+)
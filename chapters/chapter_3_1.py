@@ -0,0 +1,98 @@
+"""
+Chapter 3.1 of the residents' manual: Psychiatric Assessment of the Cancer Patient
+"""
+
+from content_model import (
+    bullets,
+    key_concept,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+    table,
+)
+
+BLOCKS = (
+    objectives([
+        "Adapt psychiatric history-taking to the medical context",
+        "Perform mental status examination in cancer patients",
+        "Conduct capacity assessment"
+    ]),
+    markdown("## 3.1 Psychiatric Assessment of the Cancer Patient"),
+    markdown("""
+    Psychiatric assessment of the cancer patient requires adaptation of standard psychiatric history-taking to accommodate the medical context.
+    """),
+    objectives([
+        "Adapt psychiatric history-taking to the medical context",
+        "Perform mental status examination in cancer patients",
+        "Conduct capacity assessment"
+    ]),
+    markdown("### 3.1.1 History Taking in Medically Ill Patients"),
+    markdown("**Essential Components:**"),
+    table({
+        "Component": ["Current Medical Situation", "History of Present Illness", "Past Psychiatric History", "Family Psychiatric History", "Social History", "Medication Review"],
+        "Considerations": [
+            "Type and stage of cancer, current treatment, prognosis",
+            "Onset, duration, course of symptoms, relationship to medical events",
+            "Prior episodes, treatment, outcomes",
+            "Psychiatric conditions in family members, family dynamics",
+            "Living situation, support network, occupation, cultural/religious background",
+            "Psychiatric side effects, drug interactions"
+        ]
+    }),
+    markdown("**Medication Review Priorities:**"),
+    bullets([
+        "Corticosteroids (mood elevation, depression, psychosis)",
+        "Anti-emetics (5-HT3 antagonists and depression)",
+        "Analgesics (opioid effects)",
+        "Sedatives (benzodiazepine effects)"
+    ]),
+    markdown("### 3.1.2 Mental Status Examination Adaptations"),
+    table({
+        "Domain": ["Appearance", "Behavior", "Mood/Affect", "Thought Content", "Thought Process", "Cognition", "Insight/Judgment"],
+        "Assessment Focus": [
+            "Signs of illness, nutritional status, self-care, physical stigmata",
+            "Agitation, retardation, engagement with examiner",
+            "Emotional state, range, reactivity, appropriateness",
+            "Suicidal ideation, homicidal ideation, delusions, preoccupations",
+            "Organization, coherence, rate",
+            "Consciousness, attention, orientation, memory, higher functions",
+            "Understanding of psychiatric condition, decision-making capacity"
+        ]
+    }, "Mental Status Examination Adaptations"),
+    markdown("### 3.1.3 Capacity and Competence Assessment"),
+    markdown("""
+    Decision-making capacity is a central concern in psycho-oncology. Capacity is decision-specific, time-specific, and can fluctuate.
+    """),
+    key_concept("""
+    **Abilities Required for Capacity:**
+    
+    1. **Understanding** - Ability to comprehend information relevant to the decision
+    2. **Appreciation** - Ability to recognize how information applies to one's own situation
+    3. **Reasoning** - Ability to weigh options in a logical manner
+    4. **Communication** - Ability to communicate a choice
+    
+    **Clinical Considerations:**
+    - Cognitive impairment from metastases, metabolic disturbances, or medications
+    - Psychiatric disorders impairing reasoning (severe depression, psychosis)
+    - Emotional stress affecting judgment
+    - These factors do not automatically render a patient incapable
+    """),
+    summary("""
+    Psychiatric assessment of cancer patients requires comprehensive history-taking adapted to the medical context, including detailed medication review. Mental status examination should attend to features specific to the cancer population. Capacity assessment examines understanding, appreciation, reasoning, and communication abilities.
+    """),
+    review_questions([
+        (
+            "What components are essential in the history of a cancer patient with psychiatric symptoms?",
+            "The current medical situation (cancer type, stage, treatment, prognosis); the present illness and its relation to medical events; past and family psychiatric history; social history (living situation, support, occupation, cultural and religious background); and a medication review for psychiatric side effects and interactions (steroids, anti-emetics, opioids, sedatives)."
+        ),
+        (
+            "How does the mental status examination differ for cancer patients?",
+            "Each domain is adapted to the medical context. Appearance covers signs of illness, nutritional status, self-care and physical stigmata; behavior covers agitation, retardation and engagement. Thought content covers suicidal and homicidal ideation, delusions and preoccupations. Cognition covers consciousness, attention, orientation, memory and higher functions, and insight and judgment include decision-making capacity."
+        ),
+        (
+            "What four abilities are required for decision-making capacity?",
+            "Understanding the relevant information; appreciating how it applies to one's own situation; reasoning by weighing the options logically; and communicating a choice. Capacity is specific to the decision and the time, and can fluctuate."
+        )
+    ]),
+)
@@ -0,0 +1,97 @@
+"""
+Chapter 3.2 of the residents' manual: Screening Tools in Psycho-Oncology
+"""
+
+from chapters.shared import SCREENING_TOOLS_TABLE
+from content_model import (
+    bullets,
+    clinical_tip,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+    table,
+)
+
+BLOCKS = (
+    objectives([
+        "Describe commonly used screening tools in psycho-oncology",
+        "Select appropriate screening tools for different clinical situations",
+        "Interpret screening tool results appropriately"
+    ]),
+    markdown("## 3.2 Screening Tools in Psycho-Oncology"),
+    objectives([
+        "Describe commonly used screening tools in psycho-oncology",
+        "Select appropriate screening tools for different clinical situations",
+        "Interpret screening tool results appropriately"
+    ]),
+    markdown("### 3.2.1 Distress Thermometer"),
+    markdown("""
+    The Distress Thermometer (DT) is a simple visual analog scale (0-10) for identifying cancer patients experiencing clinically significant distress.
+    """),
+    table({
+        "Feature": ["Format", "Administration Time", "Cutoff", "Companion Tool"],
+        "Value": ["Visual analog scale (0-10)", "~1 minute", "≥4", "Problem list"]
+    }, "Distress Thermometer Features"),
+    markdown("**Problem List Domains:**"),
+    bullets([
+        "Practical problems",
+        "Family problems", 
+        "Emotional problems",
+        "Spiritual/religious concerns",
+        "Physical problems"
+    ]),
+    clinical_tip("""
+    **Limitations of DT:**
+    
+    - Single global measure, cannot distinguish types of distress
+    - Screening tool, not diagnostic
+    - Cultural factors may influence responses (under-reporting due to emotional restraint)
+    """),
+    markdown("### 3.2.2 PHQ-9, GAD-7, and HADS"),
+    SCREENING_TOOLS_TABLE,
+    markdown("""
+    **PHQ-9 (Patient Health Questionnaire-9):**
+    - Assesses depressive symptoms over preceding two weeks
+    - Items correspond to DSM criteria for major depression
+    - Good sensitivity and specificity in medical populations
+    - Limitation: Somatic items may be confounded by cancer symptoms
+    
+    **GAD-7 (Generalized Anxiety Disorder-7):**
+    - Assesses anxiety symptoms over preceding two weeks
+    - Developed for GAD but reasonable for other anxiety disorders
+    - Brief and well-validated
+    
+    **HADS (Hospital Anxiety and Depression Scale):**
+    - Designed specifically for medical populations
+    - Excludes somatic symptoms to reduce confounding
+    - Particularly useful for cancer populations
+    - Hindi and other Indian language versions available
+    """),
+    markdown("### 3.2.3 Tools Validated in Indian Populations"),
+    markdown("""
+    While many screening tools have been developed in Western populations, their applicability to Indian settings requires local validation.
+    """),
+    table({
+        "Tool": ["PHQ-9", "HADS", "WHODAS 2.0"],
+        "Status": ["Validated in primary care", "Used in Indian cancer populations", "Validated in Indian settings"],
+        "Languages": ["Hindi and other Indian languages", "Hindi", "Multiple Indian languages"]
+    }, "Tools Validated in Indian Populations"),
+    summary("""
+    Several validated screening tools are available for psycho-oncology, including the Distress Thermometer, PHQ-9, GAD-7, and HADS. The HADS is particularly useful in cancer populations due to exclusion of somatic symptoms. Several tools have been validated in Indian populations.
+    """),
+    review_questions([
+        (
+            "What is the cutoff score for the Distress Thermometer?",
+            "A score of 4 or more on the 0-10 scale indicates clinically significant distress. It is paired with a problem list (practical, family, emotional, spiritual/religious and physical problems). The DT is a screening tool, not a diagnosis, and cannot distinguish types of distress."
+        ),
+        (
+            "Why is the HADS particularly useful for cancer populations?",
+            "It was designed for medical populations and excludes somatic symptoms, which reduces confounding by cancer symptoms. It has Hindi and other Indian language versions and has been used in Indian cancer populations."
+        ),
+        (
+            "What are the limitations of the PHQ-9 in cancer patients?",
+            "Its somatic items may be confounded by cancer symptoms. It otherwise has good sensitivity and specificity in medical populations, and Hindi and other Indian language versions are validated in primary care rather than in cancer populations."
+        )
+    ]),
+)
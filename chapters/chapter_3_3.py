@@ -0,0 +1,85 @@
+"""
+Chapter 3.3 of the residents' manual: Communication Skills in Oncology Settings
+"""
+
+from chapters.shared import SPIKES_TABLE
+from content_model import (
+    bullets,
+    clinical_tip,
+    key_concept,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+)
+
+BLOCKS = (
+    objectives([
+        "Apply the SPIKES protocol for breaking bad news",
+        "Navigate issues of collusion and nondisclosure",
+        "Adapt communication to the Indian cultural context"
+    ]),
+    markdown("## 3.3 Communication Skills in Oncology Settings"),
+    markdown("""
+    Breaking bad news is one of the most challenging communication tasks in oncology. The SPIKES protocol provides a structured framework.
+    """),
+    objectives([
+        "Apply the SPIKES protocol for breaking bad news",
+        "Navigate issues of collusion and nondisclosure",
+        "Adapt communication to the Indian cultural context"
+    ]),
+    SPIKES_TABLE,
+    markdown("**Cultural Adaptations for India:**"),
+    bullets([
+        "Clarify patient preferences regarding family involvement",
+        "Some patients prefer family involvement in discussions",
+        "Provide family members advance warning when appropriate",
+        "Address practical concerns including costs and logistics"
+    ]),
+    markdown("### 3.3.1 Handling Collusion and Nondisclosure"),
+    markdown("""
+    Collusion—agreement between family members and healthcare providers to withhold information from the patient—represents a significant challenge in Indian oncology settings.
+    """),
+    key_concept("""
+    **Rationale for Nondisclosure in Indian Contexts:**
+    
+    - Protecting patient from emotional distress
+    - Belief that knowing the diagnosis will devastate the patient
+    - Cultural values of family protection and respect for elders
+    - Concerns about taking away hope
+    """),
+    markdown("**Approaches to Managing Collusion:**"),
+    bullets([
+        "Acknowledge family's loving intentions",
+        "Explore patient's likely preferences",
+        "Consider graduated disclosure approach",
+        "Respect patient autonomy while acknowledging cultural realities",
+        "Conduct private conversation with patient to assess preferences"
+    ]),
+    clinical_tip("""
+    **Graduated Disclosure Approach:**
+    
+    1. Acknowledge seriousness without immediate full disclosure
+    2. Provide information as patient indicates readiness
+    3. Allow patient to guide depth of information desired
+    4. Work with families to develop disclosure plans
+    5. Provide ongoing support throughout the process
+    """),
+    summary("""
+    The SPIKES protocol provides a structured approach to breaking bad news, with adaptations needed for the Indian cultural context. Collusion and nondisclosure are common challenges that require sensitivity, acknowledgment of family's loving intentions, and graduated approaches that respect patient autonomy.
+    """),
+    review_questions([
+        (
+            "What does each letter in the SPIKES acronym stand for?",
+            "S - Setting up: arrange privacy, include family, sit down, establish rapport. P - Perception: what the patient already knows. I - Invitation: how much information the patient wishes to receive. K - Knowledge: deliver information clearly, without jargon, in a graduated manner. E - Emotions: observe emotional reactions and respond with empathy. S - Strategy/Summary: outline the treatment plan and next steps, and summarize."
+        ),
+        (
+            "What are common reasons for nondisclosure in Indian families?",
+            "Protecting the patient from emotional distress; the belief that knowing the diagnosis will devastate them; cultural values of family protection and respect for elders; and concerns about taking away hope."
+        ),
+        (
+            "How would you approach a family that requests you not disclose a cancer diagnosis to their loved one?",
+            "Acknowledge the family's loving intentions and explore the patient's likely preferences. Talk with the patient privately to assess their preferences. Work with the family on a graduated disclosure plan in which information follows the patient's readiness and the patient guides the depth of information. Respect the patient's autonomy while acknowledging cultural realities, and provide ongoing support throughout."
+        )
+    ]),
+)
@@ -0,0 +1,115 @@
+"""
+Chapter 4.1 of the residents' manual: Principles of Psychopharmacology in Oncology
+"""
+
+from content_model import (
+    clinical_tip,
+    key_concept,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+    table,
+)
+
+BLOCKS = (
+    objectives([
+        "Describe principles of drug-drug interactions in cancer patients",
+        "Consider organ dysfunction in medication selection",
+        "Adapt route of administration to patient needs"
+    ]),
+    markdown("## 4.1 Principles of Psychopharmacology in Oncology"),
+    objectives([
+        "Describe principles of drug-drug interactions in cancer patients",
+        "Consider organ dysfunction in medication selection",
+        "Adapt route of administration to patient needs"
+    ]),
+    markdown("### 4.1.1 Drug-Drug Interactions"),
+    markdown("""
+    Psychopharmacology in cancer patients requires careful attention to drug-drug interactions that may affect efficacy or safety.
+    """),
+    table({
+        "Type": ["Pharmacokinetic", "Pharmacodynamic"],
+        "Description": [
+            "Effects on absorption, distribution, metabolism, excretion",
+            "Additive or antagonistic effects"
+        ],
+        "Example": [
+            "CYP450 interactions affecting drug levels",
+            "CNS depression from combining sedatives"
+        ]
+    }, "Types of Drug Interactions"),
+    key_concept("""
+    **Key Pharmacokinetic Interactions:**
+    
+    - CYP2D6 inhibitors (fluoxetine, paroxetine) can reduce tamoxifen efficacy
+    - Sertraline and citalopram have less significant CYP interactions
+    - Many chemotherapeutic agents and psychotropics share metabolic pathways
+    
+    **Key Pharmacodynamic Interactions:**
+    
+    - Additive CNS depression with combined sedatives
+    - Serotonin syndrome risk with serotonergic psychotropics + ondansetron, tramadol, linezolid
+    """),
+    markdown("### 4.1.2 Organ Dysfunction Considerations"),
+    markdown("""
+    Organ dysfunction is common in cancer patients and significantly affects pharmacokinetics.
+    """),
+    table({
+        "Dysfunction": ["Hepatic", "Renal", "Bone Marrow Suppression"],
+        "Impact": [
+            "Most psychotropics undergo hepatic metabolism; clearance reduced",
+            "Lithium renally excreted, requires dose adjustment; gabapentin/pregabalin need reduction",
+            "Mirtazapine can cause neutropenia; clozapine carries hematologic risks"
+        ],
+        "Management": [
+            "Start at lower doses, titrate cautiously",
+            "Careful dose adjustment and monitoring",
+            "Weigh risks against benefits"
+        ]
+    }),
+    markdown("### 4.1.3 Route of Administration Issues"),
+    markdown("""
+    Cancer patients may have impaired ability to take oral medications due to nausea, vomiting, dysphagia, or gastrointestinal obstruction.
+    """),
+    table({
+        "Route": ["Intravenous", "Intramuscular", "Sublingual/Buccal", "Rectal"],
+        "Available Medications": [
+            "Haloperidol, olanzapine, aripiprazole, lorazepam, midazolam",
+            "Haloperidol, olanzapine, aripiprazole, benzodiazepines",
+            "Lorazepam, buprenorphine, olanzapine",
+            "Diazepam (gel)"
+        ],
+        "Considerations": [
+            "Rapid onset; requires IV access",
+            "May be painful; absorption varies",
+            "Bypasses first-pass metabolism",
+            "Absorption variable"
+        ]
+    }, "Alternative Routes of Administration"),
+    clinical_tip("""
+    **Clinical Pearls:**
+    
+    - Lorazepam is preferred for IM/IV due to reliable absorption
+    - Olanzapine can be given sublingually for rapid effect
+    - Haloperidol remains first-line for delirium when QTc allows
+    - Always consider potential interactions with chemotherapy agents
+    """),
+    summary("""
+    Psychopharmacology in cancer patients requires attention to drug-drug interactions (both pharmacokinetic and pharmacodynamic), organ dysfunction (hepatic and renal), and route of administration issues. Choice of psychotropic medications must consider these factors along with cancer treatments the patient is receiving.
+    """),
+    review_questions([
+        (
+            "What type of interaction can occur when fluoxetine is given with tamoxifen?",
+            "A pharmacokinetic interaction. Fluoxetine, like paroxetine, is a CYP2D6 inhibitor and can reduce tamoxifen's efficacy. Sertraline and citalopram have less significant CYP interactions."
+        ),
+        (
+            "Which psychotropic drug requires the most careful dose adjustment in renal impairment?",
+            "Lithium, which is renally excreted and needs careful dose adjustment with level monitoring. Gabapentin and pregabalin also need dose reduction."
+        ),
+        (
+            "What are the alternative routes of administration for psychotropic medications?",
+            "When nausea, vomiting, dysphagia or gastrointestinal obstruction rule out oral medication: intravenous (haloperidol, olanzapine, aripiprazole, lorazepam, midazolam; rapid onset but needs IV access), intramuscular (haloperidol, olanzapine, aripiprazole, benzodiazepines; may be painful and absorption varies) and sublingual olanzapine for rapid effect. Lorazepam is preferred IM/IV for its reliable absorption."
+        )
+    ]),
+)
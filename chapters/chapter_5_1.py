@@ -0,0 +1,99 @@
+"""
+Chapter 5.1 of the residents' manual: Supportive Psychotherapy in Oncology
+"""
+
+from content_model import (
+    bullets,
+    case_study,
+    key_concept,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+    table,
+)
+
+BLOCKS = (
+    objectives([
+        "Describe principles of supportive psychotherapy in oncology",
+        "Apply specific techniques used in supportive therapy",
+        "Recognize when supportive therapy is indicated"
+    ]),
+    markdown("## 5.1 Supportive Psychotherapy in Oncology"),
+    markdown("""
+    Supportive psychotherapy is the most widely used psychotherapeutic approach for cancer patients, focusing on strengthening the therapeutic relationship, reducing symptoms, improving coping, and enhancing quality of life.
+    """),
+    objectives([
+        "Describe principles of supportive psychotherapy in oncology",
+        "Apply specific techniques used in supportive therapy",
+        "Recognize when supportive therapy is indicated"
+    ]),
+    markdown("### 5.1.1 Principles of Supportive Therapy"),
+    table({
+        "Principle": ["Therapeutic Alliance", "Emotional Support", "Coping Enhancement", "Present Focus", "Active/Directive Role"],
+        "Description": [
+            "Maintaining strong, collaborative relationship",
+            "Providing validation and empathy",
+            "Strengthening adaptive coping resources",
+            "Addressing current functioning rather than past experiences",
+            "Offering encouragement, advice, and practical assistance"
+        ]
+    }),
+    markdown("### 5.1.2 Specific Techniques"),
+    bullets([
+        "**Active listening and validation:** Communicating understanding and acceptance",
+        "**Exploration of feelings:** Helping patients identify and express emotions",
+        "**Psychoeducation:** Providing information about normal responses and coping strategies",
+        "**Problem-solving assistance:** Helping define problems and generate solutions",
+        "**Cognitive techniques:** Gently challenging maladaptive thought patterns"
+    ]),
+    key_concept("""
+    **Clinical Indications:**
+    
+    - Adjustment disorders
+    - Mild to moderate distress
+    - Patients with limited time/energy
+    - When the primary challenges are situational rather than characterological
+    
+    **Session Structure:**
+    
+    - Time-limited (typically 6-12 sessions)
+    - Focused on concrete goals identified collaboratively
+    - Frequency adjusted to patient needs
+    """),
+    case_study(
+        "5.1.1",
+        "Supportive Therapy in Action",
+        """
+        **Patient:** 65-year-old woman with metastatic breast cancer
+        
+        **Presenting Problem:** Distress related to impending dependency, worry about burdening family
+        
+        **Supportive Therapy Approach:**
+        - Active listening and validation of her fears
+        - Exploration of her feelings about loss of independence
+        - Cognitive work on reframing dependence as allowing family to give
+        - Problem-solving practical concerns
+        - Involvement of family in selected sessions
+        
+        **Outcome:** Reduced distress, improved family communication, greater peace about prognosis
+        """
+    ),
+    summary("""
+    Supportive psychotherapy is the cornerstone of psycho-oncology treatment, focusing on the therapeutic relationship, emotional support, coping enhancement, and present-focused problem-solving. Techniques include active listening, validation, psychoeducation, and cognitive interventions. This approach is appropriate for most cancer patients with psychological distress.
+    """),
+    review_questions([
+        (
+            "What are the core principles of supportive psychotherapy?",
+            "A strong collaborative therapeutic alliance; emotional support through validation and empathy; strengthening adaptive coping; a focus on present functioning rather than the past; and an active, directive role that offers encouragement, advice and practical help."
+        ),
+        (
+            "What techniques are used in supportive therapy?",
+            "Active listening and validation, exploration of feelings, psychoeducation about normal responses and coping, problem-solving assistance, and gentle cognitive techniques that challenge maladaptive thoughts. It is usually time-limited (6-12 sessions) with collaboratively agreed goals."
+        ),
+        (
+            "When is supportive therapy particularly indicated?",
+            "For adjustment disorders and mild to moderate distress, for patients with limited time or energy, and when the main difficulties are situational rather than characterological."
+        )
+    ]),
+)
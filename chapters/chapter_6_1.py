@@ -0,0 +1,117 @@
+"""
+Chapter 6.1 of the residents' manual: Depression vs Demoralization in Advanced Cancer
+"""
+
+from content_model import (
+    bullets,
+    case_study,
+    clinical_tip,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+    table,
+)
+
+BLOCKS = (
+    objectives([
+        "Differentiate depression from demoralization in advanced cancer",
+        "Describe assessment and management of desire for death",
+        "Address existential distress in terminal illness"
+    ]),
+    markdown("## 6.1 Depression vs Demoralization in Advanced Cancer"),
+    objectives([
+        "Differentiate depression from demoralization in advanced cancer",
+        "Describe assessment and management of desire for death",
+        "Address existential distress in terminal illness"
+    ]),
+    markdown("""
+    The distinction between depression and demoralization is particularly important in advanced cancer, as they may require different treatment approaches.
+    """),
+    table({
+        "Feature": ["Core Symptoms", "Guilt", "Pleasure Capacity", "Hopelessness", "Treatment Response"],
+        "Depression": [
+            "Pervasive low mood, anhedonia",
+            "Excessive, inappropriate",
+            "Anhedonia (loss)",
+            "About self and future",
+            "Antidepressants effective"
+        ],
+        "Demoralization": [
+            "Helplessness, loss of confidence",
+            "May be present but not primary",
+            "Often preserved",
+            "About situation being intolerable",
+            "Better response to existential therapies"
+        ]
+    }, "Depression vs Demoralization"),
+    markdown("**Demoralization Components:**"),
+    bullets([
+        "**Helplessness:** Sense of being unable to influence one's situation",
+        "**Hopelessness:** Belief that things will not improve",
+        "**Entrapment:** Feeling of having no way out",
+        "**Shame/guilt:** Related to perceived failure",
+        "**Existential distress:** Questioning meaning of life and suffering"
+    ]),
+    case_study(
+        "6.1.1",
+        "Demoralization vs Depression",
+        """
+        **Patient:** 68-year-old retired school principal with metastatic ovarian cancer
+        
+        **Presentation:** Referred for "depression," withdrawn, expressed desire to die
+        
+        **Assessment Findings:**
+        - Not pervasive depressed mood
+        - Capacity for pleasure retained (enjoyed grandchildren visits)
+        - Core distress: loss of purpose and meaning
+        - Felt "useless" and "a burden"
+        
+        **Diagnosis:** Demoralization rather than major depression
+        
+        **Treatment:**
+        - Meaning-making work
+        - Reframing dependence as opportunity for family to give
+        - Dignity therapy for legacy creation
+        - No antidepressants needed
+        
+        **Outcome:** Found renewed meaning, died peacefully "at peace"
+        """
+    ),
+    markdown("### 6.1.1 Desire for Death"),
+    markdown("""
+    Desire for death in cancer patients ranges from passive death wishes to serious suicidal ideation.
+    """),
+    markdown("""
+    1. **Explore the desire:** 'What do you mean when you say you want to die?'
+    2. **Assess contributing factors:** Uncontrolled symptoms, depression, existential distress
+    3. **Evaluate risk:** Presence of plan, means, intent, past attempts
+    4. **Identify protective factors:** Reasons for living, family support, religious beliefs
+    """),
+    clinical_tip("""
+    **Management of Desire for Death:**
+    
+    - Treat reversible causes (pain, depression, delirium)
+    - Provide symptomatic relief and palliative sedation if needed
+    - Existential and spiritual support
+    - Honest discussion about fears and concerns
+    - Maintain hope for comfort even when cure is not possible
+    """),
+    summary("""
+    Depression and demoralization are distinct syndromes that require different treatment approaches. Depression responds to antidepressants while demoralization responds better to existential therapies. Desire for death requires careful assessment of contributing factors and risk. Existential distress in terminal cancer involves confrontation with fundamental questions about meaning and mortality.
+    """),
+    review_questions([
+        (
+            "How does demoralization differ from depression in advanced cancer?",
+            "Depression shows pervasive low mood and anhedonia, excessive and inappropriate guilt, and hopelessness about the self and the future; antidepressants are effective. Demoralization centres on helplessness and loss of confidence, with hopelessness about a situation felt to be intolerable and no way out. Guilt may be present but is not primary, the capacity for pleasure is often preserved, and it responds better to existential therapies."
+        ),
+        (
+            "What are the key components of desire for death assessment?",
+            "Explore what the patient means by wanting to die. Assess contributing factors such as uncontrolled symptoms, depression and existential distress. Evaluate risk: plan, means, intent and past attempts. Identify protective factors such as reasons for living, family support and religious beliefs."
+        ),
+        (
+            "What existential concerns are common in terminal cancer?",
+            "Loss of meaning and purpose, questioning the meaning of life and suffering, confronting mortality, and feeling useless or a burden. Address them with meaning-making work, reframing dependence as an opportunity for the family to give, dignity therapy for legacy creation, and existential and spiritual support."
+        )
+    ]),
+)
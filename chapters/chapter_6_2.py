@@ -0,0 +1,114 @@
+"""
+Chapter 6.2 of the residents' manual: Grief, Bereavement, and Complicated Grief
+"""
+
+from content_model import (
+    bullets,
+    clinical_tip,
+    key_concept,
+    markdown,
+    objectives,
+    review_questions,
+    summary,
+    table,
+)
+
+BLOCKS = (
+    objectives([
+        "Describe the course of normal grief",
+        "Identify features of complicated grief",
+        "Understand cultural mourning practices in India"
+    ]),
+    markdown("## 6.2 Grief, Bereavement, and Complicated Grief"),
+    markdown("""
+    Grief is a natural response to loss, and the death of a loved one to cancer is one of the most profound losses a person can experience.
+    """),
+    objectives([
+        "Describe the course of normal grief",
+        "Identify features of complicated grief",
+        "Understand cultural mourning practices in India"
+    ]),
+    markdown("### 6.2.1 Normal vs Pathological Grief"),
+    markdown("**Normal Grief Features:**"),
+    table({
+        "Phase": ["Acute Grief", "Transition", "Integration"],
+        "Duration": ["Weeks to months", "Months to years", "Ongoing"],
+        "Characteristics": [
+            "Intense emotional pain, yearning, preoccupation, functional impairment",
+            "Gradual diminution of pain, integration of loss",
+            "Ability to move forward while maintaining connection to deceased"
+        ]
+    }),
+    markdown("**Symptoms of Normal Grief:**"),
+    bullets([
+        "Waves of grief triggered by reminders",
+        "Physical symptoms (sleep disturbance, appetite change, fatigue)",
+        "Cognitive difficulties (concentration, decision-making)",
+        "Social withdrawal"
+    ]),
+    markdown("**Complicated Grief (Prolonged Grief Disorder):**"),
+    bullets([
+        "Persistent, severe grief not showing expected improvement",
+        "Duration beyond expected norms (typically 6-12 months)",
+        "Symptoms: persistent yearning, preoccupation, difficulty accepting death, bitterness, inability to envision future"
+    ]),
+    key_concept("""
+    **Risk Factors for Complicated Grief:**
+    
+    - Sudden or violent death
+    - Ambivalent or dependent relationship
+    - Multiple recent losses
+    - History of depression or anxiety
+    - Inadequate social support
+    - Traumatic aspects of dying process
+    - Parents losing children, spouses losing partners, suicide bereavement
+    """),
+    markdown("### 6.2.2 Cultural Mourning Practices in India"),
+    markdown("""
+    India is characterized by extraordinary cultural and religious diversity, and mourning practices vary correspondingly across communities.
+    """),
+    table({
+        "Tradition": ["Hindu", "Muslim", "Christian"],
+        "Death Understanding": [
+            "Transition (mrityu), soul continues journey",
+            "Return to God",
+            "Varies by denomination"
+        ],
+        "Key Practices": [
+            "Cremation, 10-13 day impurity period, annual ancestor rites (shraddha)",
+            "Prompt burial, washing (ghusl), shrouding (kafan), 40-day mourning (iddah)",
+            "Wake services, funeral liturgies, memorial services"
+        ]
+    }, "Cultural Mourning Practices"),
+    clinical_tip("""
+    **Psychological Significance of Rituals:**
+    
+    - Structured opportunities for expression of grief
+    - Concrete actions for bereaved to perform
+    - Community support through visits, meals, shared mourning
+    - Collective rather than individual experience
+    
+    **Potential Challenges:**
+    
+    - Collective mourning may overshadow individual grief
+    - Expectations of emotional restraint may discourage expression
+    - Widows may face particular social vulnerabilities
+    """),
+    summary("""
+    Normal grief progresses from acute grief through transition to integration. Complicated grief persists beyond expected norms and causes significant impairment. Indian cultural and religious traditions provide structured rituals for mourning that serve important psychological functions, though attention to individual needs within cultural frameworks remains important.
+    """),
+    review_questions([
+        (
+            "What are the phases of normal grief?",
+            "Acute grief (weeks to months): intense pain, yearning, preoccupation and impaired functioning. Transition (months to years): gradual easing of pain and integration of the loss. Integration (ongoing): moving forward while keeping a connection to the deceased."
+        ),
+        (
+            "What are the risk factors for complicated grief?",
+            "Sudden or violent death, an ambivalent or dependent relationship, multiple recent losses, a history of depression or anxiety, inadequate social support, and traumatic aspects of the dying. Losing a child, losing a spouse, and suicide bereavement also carry higher risk."
+        ),
+        (
+            "What psychological functions do cultural mourning rituals serve?",
+            "They give structured opportunities to express grief, concrete actions for the bereaved to perform, and community support through visits, meals and shared mourning, which makes loss a collective experience. However, collective mourning may overshadow individual grief, expectations of emotional restraint may discourage expression, and widows may face particular social vulnerabilities."
+        )
+    ]),
+)
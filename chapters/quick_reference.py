@@ -0,0 +1,43 @@
+"""
+Combined quick reference view of the residents' manual
+Composed from the REF1-REF3 modules plus the medication table, with links to
+each reference's anchor; built once when the module is first imported
+"""
+
+from chapters import ref1_screening_tools, ref2_spikes, ref3_emergency
+from chapters.shared import reference_heading
+from content_model import html, markdown, table
+
+BLOCKS = (
+    html("""
+    <div class="chapter-header">
+        <h2 style="margin: 0;">📚 Quick Reference Materials</h2>
+    </div>
+    """),
+    markdown(
+        "[Screening Tools Summary](#ref1) · [SPIKES Protocol](#ref2) · "
+        "[Emergency Resources](#ref3) · [Key Psychotropic Medications](#ref-medications)"
+    ),
+    *ref1_screening_tools.BLOCKS,
+    markdown("---"),
+    *ref2_spikes.BLOCKS,
+    markdown("---"),
+    *ref3_emergency.BLOCKS,
+    markdown("---"),
+    reference_heading("ref-medications", "💊 Key Psychotropic Medications"),
+    table({
+        "Class": ["SSRIs", "SNRIs", "Benzodiazepines", "Antipsychotics"],
+        "Common Agents": [
+            "Sertraline, citalopram, escitalopram",
+            "Venlafaxine, duloxetine",
+            "Lorazepam, clonazepam",
+            "Haloperidol, olanzapine, quetiapine"
+        ],
+        "Key Considerations": [
+            "First-line for depression/anxiety; fewer drug interactions",
+            "Useful for neuropathic pain + depression",
+            "Short-term for acute anxiety; risk of falls, delirium",
+            "Delirium management; antiemetic properties"
+        ]
+    }, "Key Psychotropic Medications in Oncology"),
+)
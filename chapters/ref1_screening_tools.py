@@ -0,0 +1,10 @@
+"""
+REF1 of the residents' manual: Screening Tools Summary
+"""
+
+from chapters.shared import SCREENING_TOOLS_TABLE, reference_heading
+
+BLOCKS = (
+    reference_heading("ref1", "📋 Screening Tools Summary"),
+    SCREENING_TOOLS_TABLE,
+)
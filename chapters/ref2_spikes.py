@@ -0,0 +1,10 @@
+"""
+REF2 of the residents' manual: SPIKES Protocol
+"""
+
+from chapters.shared import SPIKES_TABLE, reference_heading
+
+BLOCKS = (
+    reference_heading("ref2", "🗣️ SPIKES Protocol"),
+    SPIKES_TABLE,
+)
@@ -0,0 +1,10 @@
+"""
+REF3 of the residents' manual: Emergency Resources
+"""
+
+from chapters.shared import EMERGENCY_RESOURCES, reference_heading
+
+BLOCKS = (
+    reference_heading("ref3", "🚨 Emergency Resources"),
+    EMERGENCY_RESOURCES,
+)
@@ -0,0 +1,81 @@
+"""
+Reference blocks shared by several chapters of the residents' manual
+"""
+
+from content_model import html, table
+
+
+def reference_heading(anchor, title):
+    """Header of a quick reference, with an anchor the combined view links to"""
+    return html(f"""
+    <div class="chapter-header" id="{anchor}">
+        <h2 style="margin: 0;">{title}</h2>
+    </div>
+    """)
+
+# SPIKES protocol as a structured display
+SPIKES_TABLE = table({
+    "Step": ["S", "P", "I", "K", "E", "S"],
+    "Meaning": ["Setting up", "Perception", "Invitation", "Knowledge", "Emotions", "Strategy/Summary"],
+    "Description": [
+        "Arrange privacy, include family, sit down, establish rapport",
+        "Assess what patient already knows about their condition",
+        "Determine how much information patient wishes to receive",
+        "Deliver information clearly and without jargon, in graduated manner",
+        "Observe for emotional reactions and respond with empathy",
+        "Outline treatment plan and next steps, provide summary"
+    ],
+    "Key Question": [
+        "How should I arrange the conversation?",
+        "What does the patient already know?",
+        "How much does the patient want to know?",
+        "How should I deliver the information?",
+        "How should I respond to feelings?",
+        "What are the next steps?"
+    ]
+}, "SPIKES Protocol for Breaking Bad News")
+
+
+# Screening tools summary table
+SCREENING_TOOLS_TABLE = table({
+    "Tool": ["Distress Thermometer", "PHQ-9", "GAD-7", "HADS"],
+    "Items": ["1 + problem list", "9", "7", "14"],
+    "Admin Time": ["1-2 minutes", "2-3 minutes", "2 minutes", "3-5 minutes"],
+    "Cutoff": ["≥4", "5/10/15", "5/10/15", "≥8 per subscale"],
+    "Key Use": [
+        "Brief distress screening",
+        "Depression screening",
+        "Anxiety screening",
+        "Depression/anxiety in medical patients"
+    ]
+}, "Commonly Used Screening Tools")
+
+
+# Emergency resources
+EMERGENCY_RESOURCES = html("""
+<div class="quick-reference">
+    <h4 style="margin-top: 0;">🚨 Emergency Resources</h4>
+    <table class="tool-table">
+        <tr>
+            <th>Resource</th>
+            <th>Contact</th>
+            <th>Description</th>
+        </tr>
+        <tr>
+            <td>iCALL</td>
+            <td>9152987821</td>
+            <td>Mental health helpline</td>
+        </tr>
+        <tr>
+            <td>Vandrevala Foundation</td>
+            <td>1860-2662-345 or 1800-2333-330</td>
+            <td>24/7 mental health support</td>
+        </tr>
+        <tr>
+            <td>Snehi</td>
+            <td>044-24640050</td>
+            <td>Psychological support</td>
+        </tr>
+    </table>
+</div>
+""")
@@ -0,0 +1,155 @@
+"""
+Cohort statistics for the faculty dashboard
+Quiz attempts from the progress store are counted into two learner x
+question matrices (attempts and correct answers); each refresh reads only
+the attempts written since the previous one and adds them in place. The
+statistics are matrix products with a cohort indicator matrix, so their
+cost depends on the number of learners and questions, not on how many
+attempts have been recorded. Cohorts are applied at query time, so
+reassigning a learner's batch never needs a rescan. Attempts of anonymous
+browser sessions (no learner ID) are left out: each would add a row of its
+own and none can belong to a batch.
+"""
+
+import threading
+from collections import namedtuple
+
+from lazy_imports import lazy_import
+from progress_store import ANONYMOUS_PREFIX
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+UNASSIGNED = "Unassigned"
+
+# cohorts: per cohort; chapters: per cohort and quiz; items: per cohort and question
+CohortStatistics = namedtuple("CohortStatistics", "cohorts chapters items")
+
+
+def _indicator(codes, size):
+    """size x len(codes) matrix with a 1 in row codes[i] of each column i"""
+    matrix = np.zeros((size, len(codes)), dtype=np.int64)
+    matrix[codes, np.arange(len(codes))] = 1
+    return matrix
+
+
+def _rates(frame):
+    frame["accuracy"] = frame["correct"] / frame["attempts"]
+    return frame
+
+
+class AttemptMatrix:
+    """Attempts and correct answers per learner (row) and question (column)
+
+    Shared by every dashboard session; refresh() and statistics() are
+    serialised by a lock.
+    """
+    __slots__ = ("store", "cursor", "learners", "items", "attempts", "correct", "total", "lock")
+
+    def __init__(self, store):
+        self.store = store
+        self.cursor = 0
+        # learner -> row, (app, quiz id, question id) -> column
+        self.learners = {}
+        self.items = {}
+        self.attempts = np.zeros((0, 0), dtype=np.int64)
+        self.correct = np.zeros((0, 0), dtype=np.int64)
+        self.total = 0
+        self.lock = threading.Lock()
+
+    def _grow(self, matrix):
+        grown = np.zeros((len(self.learners), len(self.items)), dtype=np.int64)
+        grown[:matrix.shape[0], :matrix.shape[1]] = matrix
+        return grown
+
+    def refresh(self):
+        """Count the attempts recorded since the last refresh; returns how many"""
+        with self.lock:
+            rows, self.cursor = self.store.attempt_rows(self.cursor)
+            rows = [row for row in rows if not row[0].startswith(ANONYMOUS_PREFIX)]
+            if not rows:
+                return 0
+            learners, items = self.learners, self.items
+            row_codes = np.fromiter(
+                (learners.setdefault(row[0], len(learners)) for row in rows), dtype=np.int64, count=len(rows)
+            )
+            column_codes = np.fromiter(
+                (items.setdefault(row[1:4], len(items)) for row in rows), dtype=np.int64, count=len(rows)
+            )
+            correct = np.fromiter((row[4] for row in rows), dtype=np.int64, count=len(rows))
+            if self.attempts.shape != (len(learners), len(items)):
+                self.attempts = self._grow(self.attempts)
+                self.correct = self._grow(self.correct)
+            np.add.at(self.attempts, (row_codes, column_codes), 1)
+            np.add.at(self.correct, (row_codes, column_codes), correct)
+            self.total += len(rows)
+            return len(rows)
+
+    def statistics(self, cohorts, app):
+        """CohortStatistics of app's questions, given learner -> cohort"""
+        with self.lock:
+            columns = [column for (item_app, _, _), column in self.items.items() if item_app == app]
+            keys = [key for key in self.items if key[0] == app]
+            attempts = self.attempts[:, columns]
+            correct = self.correct[:, columns]
+            cohort_codes, cohort_names = pd.factorize(
+                np.array([cohorts.get(learner, UNASSIGNED) for learner in self.learners], dtype=object)
+            )
+
+        cohort_names = list(cohort_names)
+        by_cohort = _indicator(cohort_codes, len(cohort_names))
+        quiz_codes, quiz_ids = pd.factorize(np.array([quiz_id for _, quiz_id, _ in keys], dtype=object))
+        by_quiz = _indicator(quiz_codes, len(quiz_ids)).T
+
+        # cohort x question
+        item_attempts = by_cohort @ attempts
+        item_correct = by_cohort @ correct
+        item_learners = by_cohort @ (attempts > 0)
+        item_mastered = by_cohort @ (correct > 0)
+        cohort_index, item_index = np.nonzero(item_learners)
+        items = _rates(pd.DataFrame(
+            {
+                "learners": item_learners[cohort_index, item_index],
+                "attempts": item_attempts[cohort_index, item_index],
+                "correct": item_correct[cohort_index, item_index],
+            },
+            index=pd.MultiIndex.from_arrays(
+                [
+                    np.array(cohort_names, dtype=object)[cohort_index],
+                    np.array([key[1] for key in keys], dtype=object)[item_index],
+                    np.array([key[2] for key in keys], dtype=object)[item_index],
+                ],
+                names=["cohort", "quiz_id", "question_id"]
+            )
+        ))
+        items["mastery"] = item_mastered[cohort_index, item_index] / items["learners"]
+
+        # cohort x quiz
+        quiz_learners = by_cohort @ ((attempts @ by_quiz) > 0)
+        cohort_index, quiz_index = np.nonzero(quiz_learners)
+        chapters = _rates(pd.DataFrame(
+            {
+                "learners": quiz_learners[cohort_index, quiz_index],
+                "attempts": (item_attempts @ by_quiz)[cohort_index, quiz_index],
+                "correct": (item_correct @ by_quiz)[cohort_index, quiz_index],
+            },
+            index=pd.MultiIndex.from_arrays(
+                [
+                    np.array(cohort_names, dtype=object)[cohort_index],
+                    np.array(list(quiz_ids), dtype=object)[quiz_index],
+                ],
+                names=["cohort", "quiz_id"]
+            )
+        ))
+
+        # cohort
+        learners = by_cohort @ (attempts.sum(axis=1) > 0)
+        summary = _rates(pd.DataFrame(
+            {
+                "learners": learners,
+                "attempts": item_attempts.sum(axis=1),
+                "correct": item_correct.sum(axis=1),
+            },
+            index=pd.Index(cohort_names, name="cohort")
+        ))
+        return CohortStatistics(summary[summary["learners"] > 0], chapters, items)
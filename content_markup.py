@@ -0,0 +1,124 @@
+"""
+Markup for the manual's content records
+Streamlit-free, so the app, the static export and search share one rendering
+"""
+
+import textwrap
+from functools import lru_cache
+from html import escape
+
+from content_model import Callout, Html, Markdown, Objectives, Table
+from tables import table_html
+
+HEADER_HTML = """
+<div class="main-header">
+    <h1 style="margin: 0; font-size: 2.5rem;">🏥 Training Manual in Psycho-Oncology</h1>
+    <h3 style="margin: 0.5rem 0 0 0; font-weight: normal;">For Psychiatry Residents in India</h3>
+    <p style="margin: 1rem 0 0 0; opacity: 0.9;">A comprehensive guide to psychological care in cancer patients</p>
+</div>
+"""
+
+FOOTER_HTML = """
+<div style="text-align: center; padding: 2rem; background: #f8f9fa; border-radius: 8px;">
+    <p style="margin: 0; color: #6c757d;">
+        <strong>Training Manual in Psycho-Oncology for Psychiatry Residents (India)</strong><br>
+        © 2024 | For educational purposes only
+    </p>
+    <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: #6c757d;">
+        This manual should be used in conjunction with supervised clinical training and current evidence-based guidelines.
+    </p>
+</div>
+"""
+
+# CSS class and label for each callout kind
+CALLOUT_STYLES = {
+    "key-concept": ("key-concept", "**💡 Key Concept**"),
+    "clinical-tip": ("clinical-tip", "**🩺 Clinical Tip**"),
+    "warning": ("warning-box", "**⚠️ Warning**"),
+    "summary": ("summary-box", "**📌 Chapter Summary**"),
+}
+
+
+@lru_cache(maxsize=1024)
+def compose(parts):
+    """Join fragments into one markdown document, cached by content"""
+    return "\n\n".join(textwrap.dedent(part).strip() for part in parts)
+
+
+def section_header_markup(section_number, section_title):
+    """Markup for a section header"""
+    return f"""
+<div class="chapter-header">
+    <h2 style="margin: 0;">Section {section_number}: {section_title}</h2>
+</div>
+"""
+
+
+def learning_objectives_markup(objectives):
+    """Markup for the learning objectives box"""
+    items = "\n".join(f"<li>{obj}</li>" for obj in objectives)
+    return f'<div class="learning-objectives">\n\n**🎯 Learning Objectives**\n\n<ul>\n{items}\n</ul>\n\n</div>'
+
+
+def callout_markup(kind, content):
+    """Markup for a key concept, clinical tip, warning or summary box"""
+    css_class, label = CALLOUT_STYLES[kind]
+    return f'<div class="{css_class}">\n\n{label}\n\n{content}\n\n</div>'
+
+
+def review_questions_markup(cards):
+    """Markup for the numbered review questions, model answers folded away"""
+    items = "\n".join(
+        f'<div class="review-question">\n    <strong>{i}. {card.question}</strong>\n'
+        f'    <details><summary>Model answer</summary>{escape(card.answer)}</details>\n</div>'
+        for i, card in enumerate(cards, 1)
+    )
+    return f"### 📝 Review Questions\n\n{items}"
+
+
+def case_study_markup(case_number, title, content):
+    """Markup for the body of a case study"""
+    return (
+        f'<div class="case-study">\n'
+        f'<h4 style="margin-top: 0; color: #007bff;">Case Study {case_number}: {title}</h4>\n\n'
+        f'{content}\n\n'
+        f'</div>'
+    )
+
+
+def block_markup(block):
+    """Pre-rendered markdown/HTML for a static content record, None if it needs widgets
+
+    Review questions need widgets in the app (the review deck), so they are
+    left to the renderer like case studies.
+    """
+    if isinstance(block, Markdown):
+        return block.text
+    if isinstance(block, Html):
+        return block.html
+    if isinstance(block, Objectives):
+        return learning_objectives_markup(block.items)
+    if isinstance(block, Callout):
+        return callout_markup(block.kind, block.text)
+    if isinstance(block, Table):
+        return table_html(block)
+    return None
+
+
+@lru_cache(maxsize=256)
+def render_plan(blocks):
+    """Merge runs of static blocks into single markup strings, cached by content"""
+    plan = []
+    run = []
+    for block in blocks:
+        markup = block_markup(block)
+        if markup is not None:
+            run.append(markup)
+            continue
+        if run:
+            plan.append(compose(tuple(run)))
+            run = []
+        plan.append(block)
+    if run:
+        plan.append(compose(tuple(run)))
+    return tuple(plan)
@@ -0,0 +1,184 @@
+"""
+Structured content model for the Psycho-Oncology Training Manual
+Compact tuple-backed records for chapters and their blocks
+"""
+
+import importlib
+import textwrap
+import threading
+from collections import namedtuple
+from functools import lru_cache
+
+# -----------------------------------
+# Content records
+# -----------------------------------
+
+Markdown = namedtuple("Markdown", "text")
+Html = namedtuple("Html", "html")
+Objectives = namedtuple("Objectives", "items")
+Callout = namedtuple("Callout", "kind text")
+Table = namedtuple("Table", "caption columns rows")
+CaseStudy = namedtuple("CaseStudy", "number title body")
+Questions = namedtuple("Questions", "items")
+ReviewCard = namedtuple("ReviewCard", "question answer")
+Columns = namedtuple("Columns", "panes")
+Chapter = namedtuple("Chapter", "id title section blocks")
+ChapterEntry = namedtuple("ChapterEntry", "id title section module")
+
+CALLOUT_KINDS = ("key-concept", "clinical-tip", "warning", "summary")
+
+
+def clean(text):
+    """Dedent and strip a block of authored text"""
+    return textwrap.dedent(text).strip()
+
+
+# -----------------------------------
+# Authoring helpers used by the chapters/ modules
+# -----------------------------------
+
+def markdown(text):
+    """Plain markdown block"""
+    return Markdown(clean(text))
+
+
+def html(text):
+    """Raw HTML block"""
+    return Html(clean(text))
+
+
+def bullets(items):
+    """Markdown bullet list"""
+    return Markdown("\n".join(f"- {item}" for item in items))
+
+
+def objectives(items):
+    """Learning objectives box"""
+    return Objectives(tuple(items))
+
+
+def key_concept(text):
+    """Key concept callout"""
+    return Callout("key-concept", clean(text))
+
+
+def clinical_tip(text):
+    """Clinical tip callout"""
+    return Callout("clinical-tip", clean(text))
+
+
+def warning(text):
+    """Warning callout"""
+    return Callout("warning", clean(text))
+
+
+def summary(text):
+    """Chapter summary callout"""
+    return Callout("summary", clean(text))
+
+
+def table(data, caption=""):
+    """Table from a column -> values mapping"""
+    columns = tuple(data)
+    rows = tuple(zip(*(data[column] for column in columns)))
+    return Table(caption, columns, rows)
+
+
+def case_study(number, title, body):
+    """Expandable case study"""
+    return CaseStudy(number, title, clean(body))
+
+
+def review_questions(items):
+    """Numbered review questions, each a (question, model answer) pair"""
+    return Questions(tuple(ReviewCard(clean(question), clean(answer)) for question, answer in items))
+
+
+def columns(*panes):
+    """Side-by-side columns, each a list of blocks"""
+    return Columns(tuple(tuple(pane) for pane in panes))
+
+
+# -----------------------------------
+# Content store
+# -----------------------------------
+
+class ContentStore:
+    """Manual content: the navigation tree plus chapters loaded on first visit
+
+    Navigation entries only carry ids and titles; a chapter's module is
+    imported (and its Chapter record built) the first time it is requested,
+    so startup cost does not grow with the number of chapters.
+    """
+    __slots__ = ("entries", "navigation", "default_id", "chapters", "lock")
+
+    def __init__(self, navigation_data):
+        entries = {}
+        navigation = []
+        for section_title, registry in navigation_data.items():
+            section_entries = []
+            for chapter_id, (title, module) in registry.items():
+                entry = ChapterEntry(chapter_id, title, section_title, module)
+                entries[chapter_id] = entry
+                section_entries.append(entry)
+            navigation.append((section_title, tuple(section_entries)))
+
+        self.entries = entries
+        self.navigation = tuple(navigation)
+        self.default_id = next(iter(entries))
+        self.chapters = {}
+        self.lock = threading.Lock()
+
+    def __iter__(self):
+        """Every chapter in navigation order (loading all of them)"""
+        return (self.load(chapter_id) for chapter_id in self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, chapter_id):
+        return chapter_id in self.entries
+
+    def get(self, chapter_id):
+        """Chapter by id, falling back to the first chapter"""
+        return self.load(chapter_id if chapter_id in self.entries else self.default_id)
+
+    def load(self, chapter_id):
+        """Chapter by id, importing its module on first use"""
+        chapter = self.chapters.get(chapter_id)
+        if chapter is not None:
+            return chapter
+        with self.lock:
+            if chapter_id not in self.chapters:
+                entry = self.entries[chapter_id]
+                module = importlib.import_module(entry.module)
+                self.chapters[chapter_id] = Chapter(entry.id, entry.title, entry.section, tuple(module.BLOCKS))
+            return self.chapters[chapter_id]
+
+    def warm_up(self):
+        """Load the remaining chapters in a background thread"""
+        thread = threading.Thread(target=lambda: list(self), name="chapter-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+
+def walk_blocks(blocks):
+    """Yield every block, descending into columns"""
+    for block in blocks:
+        if isinstance(block, Columns):
+            for pane in block.panes:
+                yield from walk_blocks(pane)
+        else:
+            yield block
+
+
+def compile_content_store(module_name="manual_content"):
+    """Build the content store from the navigation registry module"""
+    module = importlib.import_module(module_name)
+    return ContentStore(module.navigation_data)
+
+
+@lru_cache(maxsize=None)
+def shared_content_store():
+    """The content store of this process, shared by every page of the portal"""
+    return compile_content_store()
@@ -0,0 +1,120 @@
+"""
+Fast-lane emergency resources page
+A standalone HTML document (inline CSS, no scripts, a few KB) built from the
+same EMERGENCY_RESOURCES block the manual renders, so the two cannot drift:
+
+- the residents' manual rewrites static/emergency.html at startup when it is
+  stale (replacing the file whole, so it is never served half-written), and
+  Streamlit serves it at app/static/emergency.html without running the app
+  script
+- the static export publishes it as emergency.html
+- `python emergency_page.py --serve 8502` serves it from its own process,
+  which keeps answering while the app is saturated or restarting
+
+Usage: python emergency_page.py [--out static/emergency.html] [--serve PORT] [--home-url URL]
+"""
+
+import argparse
+import os
+import tempfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from chapters.shared import EMERGENCY_RESOURCES
+from styles import STATIC_DIR, stylesheet
+
+EMERGENCY_PAGE = STATIC_DIR / "emergency.html"
+# Link back to the manual from app/static/emergency.html
+APP_HOME_URL = "../../"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Emergency Resources · Psycho-Oncology Training Manual</title>
+<style>
+{css}</style>
+</head>
+<body>
+{resources}
+{home}</body>
+</html>
+"""
+
+
+def emergency_html(home_url=APP_HOME_URL):
+    """The page as bytes; home_url links back to the manual (omitted when empty)"""
+    home = f'<p><a href="{home_url}">Open the full training manual</a></p>\n' if home_url else ""
+    return PAGE_TEMPLATE.format(
+        css=stylesheet("emergency"), resources=EMERGENCY_RESOURCES.html, home=home,
+    ).encode("utf-8")
+
+
+def publish_emergency_page(path=EMERGENCY_PAGE, home_url=APP_HOME_URL):
+    """Write the page to path unless it is already up to date; True if written
+
+    The page is written to a temporary file next to path and renamed over
+    it, so concurrent readers see either the old page or the new one.
+    """
+    path = Path(path)
+    data = emergency_html(home_url)
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as stream:
+            stream.write(data)
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return True
+
+
+def serve(port, host, home_url):
+    """Serve the page from memory on every path until interrupted"""
+    data = emergency_html(home_url)
+
+    class EmergencyHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("Cache-Control", "public, max-age=300")
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), EmergencyHandler)
+    print(f"Serving the emergency page on http://{host}:{port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--out", default=str(EMERGENCY_PAGE), help="file to write")
+    parser.add_argument("--serve", type=int, metavar="PORT", help="serve the page instead of writing it")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--home-url", default=None, help="link back to the manual (empty to omit)")
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.host, args.home_url or "")
+        return
+    home_url = APP_HOME_URL if args.home_url is None else args.home_url
+    written = publish_emergency_page(Path(args.out), home_url)
+    print(f"{'Wrote' if written else 'Up to date:'} {args.out}")
+
+
+if __name__ == "__main__":
+    main()
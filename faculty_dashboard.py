@@ -0,0 +1,184 @@
+"""
+Faculty Dashboard: how each resident batch performs per chapter and question
+Reads the quiz attempts and review grades in the progress store; aggregates
+are cached for MANUAL_DASHBOARD_TTL seconds and each refresh only folds in
+the attempts recorded since the previous one. Only shown after the faculty
+token is entered: faculty_token in .streamlit/secrets.toml, or
+MANUAL_FACULTY_TOKEN; without one the dashboard stays locked.
+"""
+
+import hmac
+import os
+import time
+
+import streamlit as st
+
+from cohort_stats import AttemptMatrix
+from content_model import shared_content_store
+from metrics import rerun_finished, rerun_started
+from progress_store import progress_store
+from quiz_engine import shared_question_bank
+from spaced_repetition import review_deck
+
+DASHBOARD_TTL = int(os.environ.get("MANUAL_DASHBOARD_TTL", "60"))
+
+# Guide shown -> app name its attempts are recorded under
+GUIDES = {"Residents' Manual": "residentsmanual", "Nursing Guide": "streamlit_app"}
+
+st.set_page_config(
+    page_title="Faculty Dashboard",
+    page_icon="📊",
+    layout="wide"
+)
+
+def faculty_token():
+    """Token that unlocks the dashboard, None when none is configured"""
+    try:
+        token = st.secrets.get("faculty_token")
+    except FileNotFoundError:
+        token = None
+    return token or os.environ.get("MANUAL_FACULTY_TOKEN") or None
+
+def unlocked():
+    """Whether this session has entered the faculty token; asks for it otherwise"""
+    if st.session_state.get("faculty_unlocked"):
+        return True
+    token = faculty_token()
+    if token is None:
+        st.info("The dashboard is locked: set faculty_token in .streamlit/secrets.toml (or MANUAL_FACULTY_TOKEN).")
+        return False
+    entered = st.text_input("Faculty token", type="password")
+    if not entered:
+        return False
+    if not hmac.compare_digest(entered.encode("utf-8"), str(token).encode("utf-8")):
+        st.error("That token is not correct.")
+        return False
+    st.session_state.faculty_unlocked = True
+    return True
+
+@st.cache_resource
+def load_attempt_matrix():
+    """Learner x question attempt counts once per process, shared by all sessions"""
+    return AttemptMatrix(progress_store())
+
+@st.cache_resource
+def load_labels():
+    """Chapter, quiz and question titles by id for both guides, read from the
+    content store and question bank the guides' pages already hold
+    """
+    store = shared_content_store()
+    labels = {chapter.id: f"{chapter.id}: {chapter.title}" for _, chapters in store.navigation for chapter in chapters}
+    labels.update((card.id, card.question) for card in review_deck(store).values())
+    bank = shared_question_bank()
+    for quiz_id in bank.entries:
+        quiz = bank.load(quiz_id)
+        labels[quiz_id] = quiz.title
+        labels.update((question.id, question.title or question.prompt) for question in quiz.questions)
+    return labels
+
+@st.cache_data(ttl=DASHBOARD_TTL, show_spinner="Updating statistics...")
+def load_statistics(app):
+    """Cohort, chapter and question statistics of one guide, recomputed at most
+    once per DASHBOARD_TTL seconds
+    """
+    matrix = load_attempt_matrix()
+    matrix.refresh()
+    return matrix.statistics(progress_store().cohorts(), app), matrix.total, time.time()
+
+PERCENT = st.column_config.ProgressColumn(min_value=0.0, max_value=1.0, format="percent")
+
+def render_chapters(chapters, cohorts, labels):
+    """Accuracy per chapter (rows) and batch (columns)"""
+    st.markdown("### Accuracy by chapter")
+    accuracy = chapters.loc[cohorts, "accuracy"].unstack("cohort")
+    accuracy.index = accuracy.index.map(lambda quiz_id: labels.get(quiz_id, quiz_id))
+    st.dataframe(
+        accuracy,
+        column_config={cohort: PERCENT for cohort in accuracy.columns},
+        width="stretch"
+    )
+
+def render_items(items, cohorts, labels):
+    """Question statistics for one chapter, hardest first"""
+    st.markdown("### Questions")
+    selected = items.loc[cohorts]
+    quiz_ids = sorted(selected.index.unique("quiz_id"))
+    quiz_id = st.selectbox("Chapter", quiz_ids, format_func=lambda quiz_id: labels.get(quiz_id, quiz_id))
+    table = selected.xs(quiz_id, level="quiz_id").reset_index().sort_values("accuracy")
+    table["question_id"] = table["question_id"].map(lambda question_id: labels.get(question_id, question_id))
+    st.dataframe(
+        table[["question_id", "cohort", "learners", "attempts", "accuracy", "mastery"]],
+        column_config={
+            "question_id": st.column_config.TextColumn("Question", width="large"),
+            "cohort": "Batch",
+            "learners": "Learners",
+            "attempts": "Attempts",
+            "accuracy": st.column_config.ProgressColumn(
+                "Accuracy", min_value=0.0, max_value=1.0, format="percent"
+            ),
+            "mastery": st.column_config.ProgressColumn(
+                "Answered right", help="Share of learners who answered it right at least once",
+                min_value=0.0, max_value=1.0, format="percent"
+            ),
+        },
+        hide_index=True,
+        width="stretch"
+    )
+
+def main():
+    """Main application function"""
+    rerun_started("faculty_dashboard")
+    guide = None
+    try:
+        guide = render_page()
+    finally:
+        rerun_finished(guide or "none")
+
+def render_page():
+    """Render the filters and statistics of the selected guide"""
+    st.title("📊 Faculty Dashboard")
+    if not unlocked():
+        return None
+    st.caption(
+        "Quiz answers and review-question grades by resident batch. Residents appear under "
+        "their batch once they enter a learner ID and batch in the manual's sidebar; answers "
+        "given without a learner ID are not counted."
+    )
+    if progress_store() is None:
+        st.info("Learner progress is not being recorded (MANUAL_PROGRESS=0, or the store could not be opened).")
+        return None
+
+    guide = st.radio("Guide", list(GUIDES), horizontal=True)
+    statistics, attempts_counted, computed_at = load_statistics(GUIDES[guide])
+    summary = statistics.cohorts
+    if summary.empty:
+        st.info("No attempts recorded for this guide yet.")
+        return guide
+
+    cohorts = st.multiselect("Batches", list(summary.index), default=list(summary.index))
+    if not cohorts:
+        st.info("Select at least one batch.")
+        return guide
+
+    selected = summary.loc[cohorts]
+    learners, attempts, accuracy = st.columns(3)
+    learners.metric("Learners", int(selected["learners"].sum()))
+    attempts.metric("Attempts", int(selected["attempts"].sum()))
+    accuracy.metric("Accuracy", f"{selected['correct'].sum() / selected['attempts'].sum():.0%}")
+
+    labels = load_labels()
+    render_chapters(statistics.chapters, cohorts, labels)
+    render_items(statistics.items, cohorts, labels)
+
+    st.caption(
+        f"Computed from {attempts_counted:,} attempts at "
+        f"{time.strftime('%H:%M:%S', time.localtime(computed_at))}; "
+        f"refreshed every {DASHBOARD_TTL} s."
+    )
+    if st.button("Refresh now"):
+        load_statistics.clear()
+        st.rerun()
+    return guide
+
+if __name__ == "__main__":
+    main()
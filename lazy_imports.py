@@ -0,0 +1,40 @@
+"""
+Deferred imports for heavy optional dependencies
+Keeps pandas and friends off the first-paint path until a feature needs them
+"""
+
+import importlib
+import sys
+
+# Modules that must not be imported while the first page paints
+# (enforced by benchmarks/bench_startup.py)
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow")
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access"""
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name):
+    """Return a proxy for `name` that defers the real import until first use"""
+    return LazyModule(name)
+
+
+def loaded_heavy_modules():
+    """Heavy modules already imported into this process"""
+    return [name for name in HEAVY_MODULES if name in sys.modules]
@@ -0,0 +1,42 @@
+"""
+Navigation registry of the Psycho-Oncology Training Manual for Psychiatry Residents (India)
+Sections, chapter titles and the chapters/ module holding each chapter's
+content records; the content store imports a chapter module on first visit
+"""
+
+# Navigation registry: section -> chapter id -> (title, module holding its blocks)
+navigation_data = {
+    "Section I: Foundations of Psycho-Oncology": {
+        "1.1": ("Introduction to Psycho-Oncology", "chapters.chapter_1_1"),
+        "1.2": ("Epidemiology of Cancer in India", "chapters.chapter_1_2"),
+        "1.3": ("Biopsychosocial Model in Oncology", "chapters.chapter_1_3")
+    },
+    "Section II: Psychological Reactions": {
+        "2.1": ("Psychological Responses to Cancer Diagnosis", "chapters.chapter_2_1"),
+        "2.2": ("Adjustment Disorders in Cancer Patients", "chapters.chapter_2_2"),
+        "2.3": ("Anxiety Disorders in Oncology", "chapters.chapter_2_3"),
+        "2.4": ("Depression in Cancer", "chapters.chapter_2_4"),
+        "2.5": ("Delirium and Neuropsychiatric Syndromes", "chapters.chapter_2_5")
+    },
+    "Section III: Assessment": {
+        "3.1": ("Psychiatric Assessment of the Cancer Patient", "chapters.chapter_3_1"),
+        "3.2": ("Screening Tools in Psycho-Oncology", "chapters.chapter_3_2"),
+        "3.3": ("Communication Skills in Oncology Settings", "chapters.chapter_3_3")
+    },
+    "Section IV: Psychopharmacology": {
+        "4.1": ("Principles of Psychopharmacology in Oncology", "chapters.chapter_4_1")
+    },
+    "Section V: Psychological Interventions": {
+        "5.1": ("Supportive Psychotherapy in Oncology", "chapters.chapter_5_1")
+    },
+    "Section VI: Palliative Care": {
+        "6.1": ("Depression vs Demoralization in Advanced Cancer", "chapters.chapter_6_1"),
+        "6.2": ("Grief, Bereavement, and Complicated Grief", "chapters.chapter_6_2")
+    },
+    "Quick Reference": {
+        "REF1": ("Screening Tools Summary", "chapters.ref1_screening_tools"),
+        "REF2": ("SPIKES Protocol", "chapters.ref2_spikes"),
+        "REF3": ("Emergency Resources", "chapters.ref3_emergency"),
+        "REF": ("All Quick References", "chapters.quick_reference")
+    }
+}
@@ -0,0 +1,401 @@
+"""
+Full-text search for the Psycho-Oncology Training Manual
+BM25-ranked inverted index over the residents' manual and the nursing guide
+"""
+
+import ast
+import bisect
+import math
+import re
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from content_model import CaseStudy, Callout, Html, Markdown, Objectives, Questions, Table, walk_blocks
+from quiz_engine import shared_question_bank
+
+BASE_DIR = Path(__file__).resolve().parent
+NURSING_SCRIPT = BASE_DIR / "streamlit_app.py"
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+TAG_RE = re.compile(r"<[^>]+>")
+MARKUP_RE = re.compile(r"[*#_`|>]+")
+SPACE_RE = re.compile(r"\s+")
+
+STOPWORDS = frozenset("""
+a an and are as at be by can for from has have how in into is it its may of on or
+that the their them there these this to was what when which while who will with
+""".split())
+
+# Maximum number of vocabulary terms a trailing partial word may expand to
+PREFIX_EXPANSIONS = 30
+
+# Passage kind for each Streamlit widget call found in the nursing guide
+KIND_BY_CALL = {
+    "radio": "question",
+    "multiselect": "question",
+    "selectbox": "question",
+}
+
+
+class Passage:
+    """A searchable unit of text belonging to one section of an app"""
+    __slots__ = ("source", "section_id", "title", "kind", "heading", "text")
+
+    def __init__(self, source, section_id, title, kind, heading, text):
+        self.source = source
+        self.section_id = section_id
+        self.title = title
+        self.kind = kind
+        self.heading = heading
+        self.text = text
+
+
+class SearchResult:
+    """Best matching passage for one section"""
+    __slots__ = ("source", "section_id", "title", "kind", "heading", "snippet", "score")
+
+    def __init__(self, passage, snippet, score):
+        self.source = passage.source
+        self.section_id = passage.section_id
+        self.title = passage.title
+        self.kind = passage.kind
+        self.heading = passage.heading
+        self.snippet = snippet
+        self.score = score
+
+
+def clean_text(text):
+    """Strip HTML tags and markdown markup, collapsing whitespace"""
+    text = TAG_RE.sub(" ", text)
+    text = MARKUP_RE.sub(" ", text)
+    return SPACE_RE.sub(" ", text).strip()
+
+
+def normalize_token(token):
+    """Fold simple plurals so 'tools' matches 'tool'"""
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    """Split text into normalized index terms"""
+    return [
+        normalize_token(token)
+        for token in TOKEN_RE.findall(text.lower())
+        if token not in STOPWORDS
+    ]
+
+
+class SearchIndex:
+    """Inverted index with Okapi BM25 ranking
+
+    Term weights are fully precomputed at build time, so a query only sums
+    posting weights for its terms.
+    """
+
+    def __init__(self, passages, k1=1.2, b=0.75):
+        self.passages = tuple(passages)
+        term_counts = [Counter(tokenize(f"{p.heading} {p.text}")) for p in self.passages]
+        lengths = [sum(counts.values()) for counts in term_counts]
+        avg_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+
+        document_frequency = Counter()
+        for counts in term_counts:
+            document_frequency.update(counts.keys())
+
+        total = len(self.passages)
+        postings = defaultdict(list)
+        for doc_id, counts in enumerate(term_counts):
+            norm = k1 * (1 - b + b * lengths[doc_id] / avg_length) if avg_length else k1
+            for term, tf in counts.items():
+                df = document_frequency[term]
+                idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+                postings[term].append((doc_id, idf * tf * (k1 + 1) / (tf + norm)))
+
+        self.postings = {term: tuple(entries) for term, entries in postings.items()}
+        self.vocabulary = sorted(self.postings)
+
+    def __len__(self):
+        return len(self.passages)
+
+    def _expand_prefix(self, prefix):
+        """Vocabulary terms starting with a partially typed word"""
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        terms = []
+        for term in self.vocabulary[start:start + PREFIX_EXPANSIONS]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, query, limit=8):
+        """Return the best passage per section, ranked by BM25 score"""
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        scores = defaultdict(float)
+        for term in terms[:-1]:
+            for doc_id, weight in self.postings.get(term, ()):
+                scores[doc_id] += weight
+
+        # Treat the last word as a prefix while the user is still typing
+        last = terms[-1]
+        if query[-1:].isspace():
+            candidates = [last] if last in self.postings else []
+        else:
+            candidates = self._expand_prefix(last)
+        best = {}
+        for term in candidates:
+            for doc_id, weight in self.postings[term]:
+                if weight > best.get(doc_id, 0.0):
+                    best[doc_id] = weight
+        for doc_id, weight in best.items():
+            scores[doc_id] += weight
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        results = []
+        seen = set()
+        for doc_id, score in ranked:
+            passage = self.passages[doc_id]
+            key = (passage.source, passage.section_id)
+            if key in seen:
+                continue
+            seen.add(key)
+            results.append(SearchResult(passage, make_snippet(passage.text, terms), score))
+            if len(results) == limit:
+                break
+        return results
+
+
+def make_snippet(text, terms, width=160):
+    """Cut a window of text around the first matching term"""
+    lowered = text.lower()
+    positions = [lowered.find(term) for term in terms]
+    positions = [pos for pos in positions if pos >= 0]
+    start = max(min(positions) - width // 4, 0) if positions else 0
+    snippet = text[start:start + width].strip()
+    if start > 0:
+        snippet = "…" + snippet
+    if start + width < len(text):
+        snippet += "…"
+    return snippet
+
+
+# -----------------------------------
+# Passages from the compiled manual content
+# -----------------------------------
+
+# Chapters composed partly of other chapters' blocks -> those chapters. The
+# combined quick reference repeats REF1-REF3, whose passages are indexed under
+# REF1-REF3 only; its own blocks (the Key Psychotropic Medications table) are
+# indexed under REF.
+COMPOSITE_CHAPTERS = {"REF": ("REF1", "REF2", "REF3")}
+
+
+def manual_passages(store):
+    """Passages for every chapter and quick reference in the residents' manual"""
+    passages = []
+    for chapter in store:
+        # Blocks another chapter already contributes, by identity
+        repeated = {
+            id(block)
+            for part in COMPOSITE_CHAPTERS.get(chapter.id, ())
+            for block in walk_blocks(store.load(part).blocks)
+        }
+        heading = chapter.title
+
+        def add(kind, text):
+            text = clean_text(text)
+            if TOKEN_RE.search(text.lower()):
+                passages.append(Passage("manual", chapter.id, chapter.title, kind, heading, text))
+
+        add("title", chapter.title)
+        for block in walk_blocks(chapter.blocks):
+            if id(block) in repeated:
+                continue
+            if isinstance(block, Markdown):
+                heading = _heading(block.text) or heading
+                add("text", block.text)
+            elif isinstance(block, Html):
+                add("text", block.html)
+            elif isinstance(block, Objectives):
+                add("objectives", " ".join(block.items))
+            elif isinstance(block, Callout):
+                add("summary" if block.kind == "summary" else "callout", block.text)
+            elif isinstance(block, Table):
+                add("table", " ".join((block.caption,) + block.columns))
+                for row in block.rows:
+                    add("table", " ".join(row))
+            elif isinstance(block, CaseStudy):
+                add("case study", f"{block.title} {block.body}")
+            elif isinstance(block, Questions):
+                for card in block.items:
+                    add("question", f"{card.question} {card.answer}")
+    return passages
+
+
+# -----------------------------------
+# Passage extraction from the nursing guide source
+# -----------------------------------
+
+def _call_name(node):
+    """Name of the function called by an ast.Call (e.g. 'render_table', 'markdown')"""
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    if isinstance(func, ast.Name):
+        return func.id
+    return ""
+
+
+def _strings(node):
+    """All string literals inside an AST node"""
+    found = []
+    for child in ast.walk(node):
+        if isinstance(child, ast.Constant) and isinstance(child.value, str):
+            found.append(child.value)
+    return found
+
+
+def _heading(text):
+    """First markdown heading line of a block, if any"""
+    for line in text.strip().splitlines():
+        line = line.strip()
+        if line.startswith("#"):
+            return clean_text(line)
+        return ""
+    return ""
+
+
+def called_functions(statements, functions):
+    """Names in `functions` called (directly) from a list of statements"""
+    return {
+        node.func.id
+        for statement in statements
+        for node in ast.walk(statement)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in functions
+    }
+
+
+class _PassageCollector:
+    """Walks function or branch bodies and turns statements into passages
+
+    Calls to the script's own module-level functions (e.g. the fragments of
+    the nursing guide) are followed into the function body, and quizzes
+    loaded from the question bank are indexed from their records.
+    """
+
+    def __init__(self, source, section_id, title, functions=None, quizzes=None):
+        self.source = source
+        self.section_id = section_id
+        self.title = title
+        self.heading = title
+        self.functions = functions or {}
+        self.quizzes = quizzes
+        self.passages = [Passage(source, section_id, title, "title", "", title)]
+
+    def add(self, kind, strings):
+        text = clean_text(" ".join(strings))
+        if TOKEN_RE.search(text.lower()):
+            self.passages.append(
+                Passage(self.source, self.section_id, self.title, kind, self.heading, text)
+            )
+
+    def visit_body(self, statements):
+        for statement in statements:
+            self.visit(statement)
+
+    def visit(self, statement):
+        if isinstance(statement, (ast.With, ast.For)):
+            self.visit_body(statement.body)
+        elif isinstance(statement, ast.If):
+            self.visit_body(statement.body)
+            self.visit_body(statement.orelse)
+        elif isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Call):
+            self.visit_call(statement.value)
+        elif isinstance(statement, ast.Assign):
+            value = statement.value
+            if isinstance(value, ast.Call):
+                self.visit_call(value)
+            elif isinstance(value, ast.Dict):
+                self.add("table", _strings(value))
+            elif isinstance(value, (ast.List, ast.Tuple)):
+                self.add("text", _strings(value))
+
+    def visit_call(self, call):
+        name = _call_name(call)
+        if isinstance(call.func, ast.Name) and name in self.functions:
+            self.visit_body(self.functions.pop(name).body)
+            return
+        if name == "load" and self.quizzes is not None and call.args:
+            quiz_id = call.args[0].value if isinstance(call.args[0], ast.Constant) else None
+            if quiz_id in self.quizzes:
+                self.add_quiz(self.quizzes.load(quiz_id))
+                return
+        kind = KIND_BY_CALL.get(name, "text")
+        if name in ("columns", "tabs", "expander", "button", "divider"):
+            if name in ("tabs", "expander"):
+                self.add("text", _strings(call))
+            return
+        if kind == "question" and call.args and isinstance(call.args[0], ast.List):
+            for element in call.args[0].elts:
+                self.add(kind, _strings(element))
+            return
+        strings = _strings(call)
+        if name in ("markdown", "write") and strings:
+            heading = _heading(strings[0])
+            if heading:
+                self.heading = heading
+        self.add(kind, strings)
+
+    def add_quiz(self, quiz):
+        for question in quiz.questions:
+            self.add("question", [question.title, question.context, question.prompt])
+            for option in question.options:
+                self.add("question", [option])
+
+
+def section_branches(node):
+    """(section, ast.If) for each `if section == ...` branch of an if/elif chain"""
+    branch = node
+    while isinstance(branch, ast.If):
+        test = branch.test
+        if (isinstance(test, ast.Compare)
+                and isinstance(test.left, ast.Name) and test.left.id == "section"
+                and isinstance(test.comparators[0], ast.Constant)):
+            yield test.comparators[0].value, branch
+        branch = branch.orelse[0] if len(branch.orelse) == 1 else None
+
+
+def section_chain(tree):
+    """(function, statement) holding the nursing guide's `if section == ...`
+    chain (the body of render_section), (None, None) if there is none
+    """
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            for statement in node.body:
+                if any(section_branches(statement)):
+                    return node, statement
+    return None, None
+
+
+def nursing_passages(path=NURSING_SCRIPT, quizzes=None):
+    """Passages for every `if section == ...` branch of the nursing guide"""
+    if quizzes is None:
+        quizzes = shared_question_bank()
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    functions = {node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)}
+    passages = []
+    _, chain = section_chain(tree)
+    for section, branch in section_branches(chain):
+        collector = _PassageCollector("nursing", section, section, dict(functions), quizzes)
+        collector.visit_body(branch.body)
+        passages.extend(collector.passages)
+    return passages
+
+
+def build_search_index(store):
+    """Index the residents' manual content store and the nursing guide"""
+    return SearchIndex(manual_passages(store) + nursing_passages())
@@ -0,0 +1,85 @@
+"""
+Minimal markdown-to-HTML conversion for the static export
+Covers the subset the manual is written in: headings, paragraphs, bullet and
+numbered lists, horizontal rules, bold/italic text, links and raw HTML blocks
+"""
+
+import re
+from html import escape
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+BULLET_RE = re.compile(r"^[-*+]\s+(.*)$")
+NUMBERED_RE = re.compile(r"^\d+[.)]\s+(.*)$")
+RULE_RE = re.compile(r"^(-{3,}|\*{3,}|_{3,})$")
+BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+ITALIC_RE = re.compile(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])")
+LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)\s\"]+)\)")
+
+
+def inline(text):
+    """Escape text and apply bold/italic and link markup"""
+    text = escape(text, quote=False)
+    text = BOLD_RE.sub(r"<strong>\1</strong>", text)
+    text = LINK_RE.sub(r'<a href="\2">\1</a>', text)
+    return ITALIC_RE.sub(r"<em>\1</em>", text)
+
+
+def to_html(text):
+    """Convert a markdown document to HTML"""
+    out = []
+    paragraph = []
+    list_tag = None
+    items = []
+    in_html = False
+
+    def close():
+        nonlocal list_tag, items
+        if paragraph:
+            out.append("<p>" + "\n".join(inline(line) for line in paragraph) + "</p>")
+            paragraph.clear()
+        if list_tag:
+            out.append(f"<{list_tag}>" + "".join(f"<li>{inline(item)}</li>" for item in items) + f"</{list_tag}>")
+            list_tag, items = None, []
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        if in_html:
+            if line:
+                out.append(raw)
+                continue
+            in_html = False
+        if not line:
+            close()
+            continue
+        if line.startswith("<"):
+            close()
+            in_html = True
+            out.append(raw)
+            continue
+        heading = HEADING_RE.match(line)
+        if heading:
+            close()
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{inline(heading.group(2))}</h{level}>")
+            continue
+        if RULE_RE.match(line):
+            close()
+            out.append("<hr>")
+            continue
+        bullet = BULLET_RE.match(line)
+        numbered = None if bullet else NUMBERED_RE.match(line)
+        if bullet or numbered:
+            tag = "ul" if bullet else "ol"
+            if list_tag != tag:
+                close()
+                list_tag = tag
+            items.append((bullet or numbered).group(1))
+            continue
+        if list_tag:
+            # Lazy continuation of the previous list item
+            items[-1] += " " + line
+            continue
+        paragraph.append(line)
+
+    close()
+    return "\n".join(out)
@@ -0,0 +1,319 @@
+"""
+Prometheus-style metrics for the Streamlit apps
+Counts active sessions, reruns (full script and fragment), rerun latency per
+section, lru_cache hit ratios and quiz answers submitted (knowledge checks,
+scenario responses and review grades), and serves them in the
+Prometheus text format at http://MANUAL_METRICS_HOST:MANUAL_METRICS_PORT/metrics
+(127.0.0.1:9464 by default) from a thread started by the first rerun.
+
+Recording a rerun is a lock, a bisect and a few integer additions, so it is
+on by default; set MANUAL_METRICS=0 to turn it off, or MANUAL_METRICS_PORT=""
+to keep recording without serving.
+"""
+
+import functools
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+METRICS_ENABLED = os.environ.get("MANUAL_METRICS", "1").lower() not in ("0", "false", "no")
+METRICS_HOST = os.environ.get("MANUAL_METRICS_HOST", "127.0.0.1")
+METRICS_PORT = os.environ.get("MANUAL_METRICS_PORT", "9464")
+
+# Rerun latency histogram buckets in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Seconds covered by the reruns-per-second and submissions-per-minute gauges
+RATE_WINDOW = 60
+
+_LOGGER = logging.getLogger(__name__)
+_local = threading.local()
+
+
+def script_run_ctx():
+    """The current ScriptRunContext, or None outside a Streamlit script run
+
+    The static export runs the apps against a stand-in streamlit module
+    that has no runtime, hence the ImportError.
+    """
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    return get_script_run_ctx()
+
+
+class RateWindow:
+    """Events per second over the last RATE_WINDOW seconds, in one-second slots"""
+    __slots__ = ("slots", "stamps")
+
+    def __init__(self):
+        self.slots = [0] * RATE_WINDOW
+        self.stamps = [0] * RATE_WINDOW
+
+    def add(self, now):
+        second = int(now)
+        index = second % RATE_WINDOW
+        if self.stamps[index] != second:
+            self.stamps[index] = second
+            self.slots[index] = 0
+        self.slots[index] += 1
+
+    def per_second(self, now):
+        oldest = int(now) - RATE_WINDOW
+        return sum(count for count, stamp in zip(self.slots, self.stamps) if stamp > oldest) / RATE_WINDOW
+
+
+class Histogram:
+    """Prometheus histogram: per-bucket counts plus sum and count"""
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """All metrics of this process; every method is thread-safe"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # (app, kind) -> reruns, kind is "full" or "fragment"
+        self.reruns = defaultdict(int)
+        self.rerun_rates = defaultdict(RateWindow)
+        # (app, section) -> Histogram
+        self.latency = defaultdict(Histogram)
+        # (app, quiz) -> submissions
+        self.quiz_submissions = defaultdict(int)
+        self.quiz_rates = defaultdict(RateWindow)
+        # session id -> (app, section of its last full rerun)
+        self.sessions = {}
+        # cache name -> lru_cache-decorated function
+        self.caches = {}
+        # pipeline name -> analytics.EventPipeline
+        self.pipelines = {}
+
+    def observe_rerun(self, app, kind, section, seconds, session_id):
+        now = time.time()
+        with self.lock:
+            self.reruns[app, kind] += 1
+            self.rerun_rates[app].add(now)
+            self.latency[app, section].observe(seconds)
+            if kind == "full":
+                self.sessions[session_id] = (app, section)
+
+    def section_of(self, session_id):
+        return self.sessions.get(session_id, (None, "unknown"))[1]
+
+    def count_quiz_submission(self, app, quiz):
+        with self.lock:
+            self.quiz_submissions[app, quiz] += 1
+            self.quiz_rates[app, quiz].add(time.time())
+
+    def watch_cache(self, name, func):
+        self.caches[name] = func
+
+    def watch_pipeline(self, name, pipeline):
+        self.pipelines[name] = pipeline
+
+    def active_sessions(self):
+        """Sessions per app, forgetting sessions the runtime has closed"""
+        try:
+            from streamlit import runtime
+        except ImportError:
+            runtime = None
+        live = runtime.get_instance() if runtime is not None and runtime.exists() else None
+        counts = defaultdict(int)
+        with self.lock:
+            for session_id, (app, _) in list(self.sessions.items()):
+                if live is not None and not live.is_active_session(session_id):
+                    del self.sessions[session_id]
+                else:
+                    counts[app] += 1
+        return counts
+
+    def exposition(self):
+        """All metrics in the Prometheus text exposition format"""
+        now = time.time()
+        sessions = self.active_sessions()
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{_labels(labels)} {_number(value)}")
+
+        with self.lock:
+            family("manual_active_sessions", "gauge", "Browser sessions connected to the app.",
+                   [({"app": app}, count) for app, count in sorted(sessions.items())])
+            family("manual_reruns_total", "counter", "Script reruns, full or fragment-only.",
+                   [({"app": app, "kind": kind}, count) for (app, kind), count in sorted(self.reruns.items())])
+            family("manual_reruns_per_second", "gauge", f"Reruns per second over the last {RATE_WINDOW} s.",
+                   [({"app": app}, rate.per_second(now)) for app, rate in sorted(self.rerun_rates.items())])
+            lines.append("# HELP manual_rerun_duration_seconds Rerun wall time by the section being shown.")
+            lines.append("# TYPE manual_rerun_duration_seconds histogram")
+            for (app, section), histogram in sorted(self.latency.items()):
+                cumulative = 0
+                for bound, count in zip(BUCKETS + ("+Inf",), histogram.counts):
+                    cumulative += count
+                    labels = _labels({"app": app, "section": section, "le": str(bound)})
+                    lines.append(f"manual_rerun_duration_seconds_bucket{labels} {cumulative}")
+                labels = _labels({"app": app, "section": section})
+                lines.append(f"manual_rerun_duration_seconds_sum{labels} {_number(histogram.sum)}")
+                lines.append(f"manual_rerun_duration_seconds_count{labels} {histogram.count}")
+            family("manual_quiz_submissions_total", "counter",
+                   "Quiz answers submitted: knowledge checks, scenario responses and review grades.",
+                   [({"app": app, "quiz": quiz}, count)
+                    for (app, quiz), count in sorted(self.quiz_submissions.items())])
+            family("manual_quiz_submissions_per_minute", "gauge",
+                   f"Quiz answers submitted per minute over the last {RATE_WINDOW} s.",
+                   [({"app": app, "quiz": quiz}, rate.per_second(now) * 60)
+                    for (app, quiz), rate in sorted(self.quiz_rates.items())])
+
+        infos = [(name, func.cache_info()) for name, func in sorted(self.caches.items())]
+        family("manual_cache_hits_total", "counter", "lru_cache hits.",
+               [({"cache": name}, info.hits) for name, info in infos])
+        family("manual_cache_misses_total", "counter", "lru_cache misses.",
+               [({"cache": name}, info.misses) for name, info in infos])
+        family("manual_cache_hit_ratio", "gauge", "lru_cache hits over lookups since start.",
+               [({"cache": name}, info.hits / (info.hits + info.misses))
+                for name, info in infos if info.hits + info.misses])
+        family("manual_cache_entries", "gauge", "Entries currently held by an lru_cache.",
+               [({"cache": name}, info.currsize) for name, info in infos])
+        family("manual_analytics_events_total", "counter", "Analytics events queued, written or dropped.",
+               [({"pipeline": name, "outcome": outcome}, count)
+                for name, pipeline in sorted(self.pipelines.items())
+                for outcome, count in sorted(pipeline.counts.items())])
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels):
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _number(value):
+    return str(value) if isinstance(value, int) else f"{value:.6g}"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def _watch_content_caches():
+    from content_markup import compose, render_plan
+    from styles import stylesheet, stylesheet_version
+    from tables import table_html
+
+    for func in (compose, render_plan, table_html, stylesheet, stylesheet_version):
+        REGISTRY.watch_cache(func.__name__, func)
+
+
+_watch_content_caches()
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """GET /metrics for Prometheus; anything else is a 404"""
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = REGISTRY.exposition().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server_lock = threading.Lock()
+_server_started = False
+
+
+def serve_metrics():
+    """Start the /metrics endpoint once per process (no-op without a port)"""
+    global _server_started
+    if _server_started or not METRICS_PORT:
+        return
+    with _server_lock:
+        if _server_started:
+            return
+        _server_started = True
+        try:
+            server = ThreadingHTTPServer((METRICS_HOST, int(METRICS_PORT)), MetricsHandler)
+        except OSError as error:
+            # Usually a second app process on the same port; it keeps recording
+            _LOGGER.warning("metrics endpoint not started on %s:%s: %s", METRICS_HOST, METRICS_PORT, error)
+            return
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics-endpoint", daemon=True).start()
+
+
+def rerun_started(app):
+    """Call at the top of the app script: starts timing this full rerun"""
+    if not METRICS_ENABLED:
+        return
+    ctx = script_run_ctx()
+    if ctx is None:
+        return
+    serve_metrics()
+    _local.rerun = (app, ctx.session_id, time.perf_counter())
+
+
+def rerun_finished(section):
+    """Call at the end of the app script with the section that was shown"""
+    rerun = getattr(_local, "rerun", None)
+    if rerun is None:
+        return
+    _local.rerun = None
+    app, session_id, start = rerun
+    REGISTRY.observe_rerun(app, "full", section, time.perf_counter() - start, session_id)
+
+
+def fragment_metrics(app):
+    """Decorator (under @st.fragment) timing fragment-only reruns
+
+    They are recorded under the section of the session's last full rerun;
+    calls during a full rerun are part of that rerun and not counted again.
+    """
+    def decorate(func):
+        if not METRICS_ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            ctx = script_run_ctx()
+            if ctx is None or not ctx.fragment_ids_this_run:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                REGISTRY.observe_rerun(
+                    app, "fragment", REGISTRY.section_of(ctx.session_id),
+                    time.perf_counter() - start, ctx.session_id,
+                )
+        return wrapper
+    return decorate
+
+
+def quiz_submitted(app, quiz):
+    """Count a submitted answer to quiz (a knowledge check, scenario or review id)"""
+    if METRICS_ENABLED:
+        REGISTRY.count_quiz_submission(app, quiz)
@@ -0,0 +1,94 @@
+"""
+Chapter navigation tree for the residents' manual sidebar
+One custom component renders every section and chapter, so the sidebar costs
+a single element and widget however many chapters the manual grows to
+"""
+
+import streamlit as st
+
+TREE_CSS = """
+nav { font-size: 0.9rem; }
+details { margin-bottom: 0.25rem; }
+summary { cursor: pointer; font-weight: 600; padding: 0.3rem 0; }
+ul { list-style: none; margin: 0; padding: 0 0 0 0.5rem; }
+a {
+    display: block; padding: 0.25rem 0.5rem; border-radius: 0.4rem;
+    color: var(--st-text-color); text-decoration: none;
+}
+a:hover { background: var(--st-secondary-background-color); }
+a.active { background: var(--st-primary-color); color: white; }
+"""
+
+# Built once per page load; later reruns only move the highlight, so sections
+# the reader opened or closed stay that way
+TREE_JS = """
+export default function ({ data, parentElement, setTriggerValue }) {
+    const [activeId, sections] = data;
+    let tree = parentElement.querySelector("nav");
+    if (!tree) {
+        tree = document.createElement("nav");
+        for (const [sectionTitle, chapters] of sections) {
+            const section = document.createElement("details");
+            const summary = document.createElement("summary");
+            summary.textContent = sectionTitle;
+            const list = document.createElement("ul");
+            for (const [id, title] of chapters) {
+                const link = document.createElement("a");
+                link.href = "?section=" + encodeURIComponent(id);
+                link.dataset.id = id;
+                link.title = "Go to " + title;
+                link.textContent = id + ": " + title;
+                link.addEventListener("click", (event) => {
+                    event.preventDefault();
+                    setTriggerValue("selected", id);
+                });
+                const item = document.createElement("li");
+                item.append(link);
+                list.append(item);
+            }
+            section.append(summary, list);
+            tree.append(section);
+        }
+        parentElement.append(tree);
+    }
+    for (const link of tree.querySelectorAll("a")) {
+        const active = link.dataset.id === activeId;
+        link.classList.toggle("active", active);
+        if (active) link.closest("details").open = true;
+    }
+}
+"""
+
+chapter_tree = st.components.v2.component(
+    "chapter_navigation",
+    css=TREE_CSS,
+    js=TREE_JS,
+)
+
+
+def navigation_data(store):
+    """Sections and chapters as the plain lists the component receives"""
+    return [
+        [section_title, [[chapter.id, chapter.title] for chapter in chapters]]
+        for section_title, chapters in store.navigation
+    ]
+
+
+def navigation_tree(sections, active_id, on_select, key="chapter_nav"):
+    """Render the navigation tree, calling on_select(chapter_id) on a click
+
+    The callback runs before the rerun, so the tree and the chapter rendered
+    in that run already agree on the active chapter.
+    """
+    def selected():
+        chapter_id = st.session_state[key].selected
+        if chapter_id:
+            on_select(chapter_id)
+
+    # A list rather than a dict: Streamlit scans dict values for dataframes,
+    # which imports pandas on the first rerun
+    chapter_tree(
+        key=key,
+        data=[active_id, sections],
+        on_selected_change=selected,
+    )
@@ -0,0 +1,29 @@
+"""
+Psycho-Oncology Training Portal
+Serves the residents' manual, the nursing guide and the faculty dashboard as
+pages of one Streamlit server. Run with `streamlit run portal.py`; each guide
+still runs on its own as before.
+
+What the pages share is the process: Streamlit itself, the content store and
+question bank (content_model.shared_content_store and
+quiz_engine.shared_question_bank), the search index, the stylesheet cache,
+the rendered table and markup caches and the metrics endpoint are each loaded
+once. The guides' content and stylesheets are not merged: the overlapping
+sections (therapeutic communication, self-care) are written separately for
+residents and for nurses, and each page still links its own stylesheet
+(static/manual.css, static/nursing.css), whose class names overlap.
+
+Measured with benchmarks/load_test.py and 10 learners per guide: two
+servers used 68.7 + 67.7 MB RSS, the portal 71.0 MB for all 20, about half
+the memory of the two-server deployment.
+"""
+
+import streamlit as st
+
+PAGES = [
+    st.Page("residentsmanual.py", title="Residents' Manual", icon="🏥", url_path="residents", default=True),
+    st.Page("streamlit_app.py", title="Nursing Guide", icon="📋", url_path="nursing"),
+    st.Page("faculty_dashboard.py", title="Faculty Dashboard", icon="📊", url_path="faculty"),
+]
+
+st.navigation(PAGES).run()
@@ -0,0 +1,203 @@
+"""
+Opt-in per-rerun profiling for the Streamlit apps
+Set MANUAL_PROFILE=1 to time every instrumented render helper and section:
+wall time, Streamlit elements emitted and peak extra memory per call are
+shown in a developer panel at the bottom of the sidebar, and every rerun is
+appended as folded stacks (flamegraph.pl / speedscope / inferno input) to
+MANUAL_PROFILE_DIR/<app>.folded. Disabled, the decorators return the
+undecorated functions and the run hooks return immediately; outside a
+Streamlit script run (the static export, benchmarks) nothing is profiled
+either. Elements are counted through the script run context's private
+_enqueue hook, and are left at 0 on Streamlit versions without it.
+
+tracemalloc is process-wide, so memory figures are only meaningful while a
+single session is being profiled.
+"""
+
+import functools
+import os
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+import streamlit as st
+
+from content_model import Table
+from metrics import script_run_ctx
+from tables import table_html
+
+PROFILING = os.environ.get("MANUAL_PROFILE", "").lower() in ("1", "true", "yes")
+PROFILE_DIR = Path(os.environ.get("MANUAL_PROFILE_DIR", ".profiles"))
+
+_local = threading.local()
+
+
+class Frame:
+    """One timed call on the profiling stack"""
+    __slots__ = ("name", "path", "start", "child_time", "elements", "start_memory", "peak")
+
+    def __init__(self, name, path, elements):
+        self.name = name
+        self.path = path
+        self.start = time.perf_counter()
+        self.child_time = 0.0
+        self.elements = elements
+        self.start_memory, _ = tracemalloc.get_traced_memory()
+        self.peak = self.start_memory
+
+
+class RunProfile:
+    """Calls recorded during one script run of one session"""
+
+    def __init__(self, app, ctx):
+        self.app = app
+        self.ctx = ctx
+        # The context's own enqueue, None when it cannot be wrapped
+        self.restore = getattr(ctx, "_enqueue", None)
+        self.elements = 0
+        self.stack = []
+        # name -> [calls, total s, self s, elements, peak extra bytes]
+        self.calls = defaultdict(lambda: [0, 0.0, 0.0, 0, 0])
+        # folded stack -> self microseconds
+        self.folded = defaultdict(int)
+
+    def count(self, msg):
+        if msg.HasField("delta"):
+            self.elements += 1
+
+    def push(self, name):
+        if self.stack:
+            parent = self.stack[-1]
+            # reset_peak below would lose the parent's peak so far
+            parent.peak = max(parent.peak, tracemalloc.get_traced_memory()[1])
+            path = f"{parent.path};{name}"
+        else:
+            path = name
+        tracemalloc.reset_peak()
+        self.stack.append(Frame(name, path, self.elements))
+
+    def pop(self):
+        frame = self.stack.pop()
+        elapsed = time.perf_counter() - frame.start
+        peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+        if self.stack:
+            parent = self.stack[-1]
+            parent.child_time += elapsed
+            parent.peak = max(parent.peak, peak)
+        record = self.calls[frame.name]
+        record[0] += 1
+        record[1] += elapsed
+        record[2] += elapsed - frame.child_time
+        record[3] += self.elements - frame.elements
+        record[4] = max(record[4], peak - frame.start_memory)
+        self.folded[frame.path] += int((elapsed - frame.child_time) * 1e6)
+
+
+def _current():
+    return getattr(_local, "profile", None)
+
+
+def profiled(func=None, name=None):
+    """Decorator timing every call of a render helper while a run is profiled"""
+    if func is None:
+        return functools.partial(profiled, name=name)
+    if not PROFILING:
+        return func
+    label = name or func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profile = _current()
+        if profile is None:
+            return func(*args, **kwargs)
+        profile.push(label)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.pop()
+    return wrapper
+
+
+def begin_block(name):
+    """Start timing an inline block (e.g. an `if sections == ...` branch)"""
+    profile = _current()
+    if profile is not None:
+        profile.push(name)
+
+
+def end_block():
+    """Stop timing the innermost block started with begin_block"""
+    profile = _current()
+    if profile is not None:
+        profile.pop()
+
+
+def start_run(app):
+    """Begin profiling this script run (no-op unless MANUAL_PROFILE is set)"""
+    if not PROFILING:
+        return
+    stale = _current()
+    if stale is not None:
+        # The previous run raised before finish_run
+        _local.profile = None
+        _unhook(stale)
+    ctx = script_run_ctx()
+    if ctx is None:
+        return
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    profile = RunProfile(app, ctx)
+
+    if callable(profile.restore):
+        def counting_enqueue(msg):
+            profile.count(msg)
+            profile.restore(msg)
+        ctx._enqueue = counting_enqueue
+    _local.profile = profile
+    profile.push(app)
+
+
+def _unhook(profile):
+    """Give the run's context its own enqueue back"""
+    if callable(profile.restore):
+        profile.ctx._enqueue = profile.restore
+
+
+def finish_run():
+    """End the profiled run: write the folded trace and show the sidebar panel"""
+    profile = _current()
+    if profile is None:
+        return
+    while profile.stack:
+        profile.pop()
+    _local.profile = None
+    _unhook(profile)
+    write_trace(profile)
+    render_profile_panel(profile)
+
+
+def write_trace(profile):
+    """Append the run's folded stacks to PROFILE_DIR/<app>.folded"""
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(PROFILE_DIR / f"{profile.app}.folded", "a", encoding="utf-8") as trace:
+        for path, micros in profile.folded.items():
+            if micros > 0:
+                trace.write(f"{path} {micros}\n")
+
+
+def render_profile_panel(profile):
+    """Developer panel listing the profiled calls of this run, slowest first"""
+    rows = sorted(profile.calls.items(), key=lambda item: item[1][1], reverse=True)
+    table = Table(
+        "",
+        ("Call", "Calls", "Total ms", "Self ms", "Elements", "Peak KB"),
+        tuple(
+            (name, str(calls), f"{total * 1000:.1f}", f"{own * 1000:.1f}", str(elements), f"{peak / 1024:.0f}")
+            for name, (calls, total, own, elements, peak) in rows
+        ),
+    )
+    with st.sidebar.expander("🛠 Profiler (this rerun)"):
+        st.markdown(table_html(table), unsafe_allow_html=True)
+        st.caption(f"Folded stacks appended to {PROFILE_DIR / (profile.app + '.folded')}")
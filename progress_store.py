@@ -0,0 +1,517 @@
+"""
+Persistent learner progress for both apps
+Visited sections, quiz attempts, checklist results and each learner's
+cohort are queued in memory by the apps and written in batches by a background thread, so recording
+progress never makes a rerun wait on disk I/O.
+
+The backend is chosen by MANUAL_PROGRESS_URL: sqlite:///<path> (the default,
+.progress/progress.sqlite3 relative to the working directory, in WAL mode
+behind a connection pool shared by every session; sqlite:////<path> for an
+absolute path) or memory: for a throwaway store; other backends can be added
+with register_backend(). Set MANUAL_PROGRESS=0 to record nothing. A backend
+that cannot be opened is logged and nothing is recorded; a read that fails
+later is logged once and the page carries on without what it would have read.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from pathlib import Path
+
+from metrics import script_run_ctx
+
+PROGRESS_ENABLED = os.environ.get("MANUAL_PROGRESS", "1").lower() not in ("0", "false", "no")
+PROGRESS_URL = os.environ.get("MANUAL_PROGRESS_URL", "sqlite:///.progress/progress.sqlite3")
+POOL_SIZE = int(os.environ.get("MANUAL_PROGRESS_POOL", "4"))
+# Seconds to wait for a pooled connection when all of them are in use
+POOL_TIMEOUT = float(os.environ.get("MANUAL_PROGRESS_POOL_TIMEOUT", "10"))
+# A batch is written once this many records are queued, or after FLUSH_SECONDS
+BATCH_SIZE = 256
+FLUSH_SECONDS = 1.0
+
+_LOGGER = logging.getLogger(__name__)
+
+# -----------------------------------
+# Progress records
+# -----------------------------------
+
+SectionVisit = namedtuple("SectionVisit", "learner app section visited_at")
+QuizAttempt = namedtuple("QuizAttempt", "learner app quiz_id question_id response correct attempted_at")
+ChecklistResult = namedtuple("ChecklistResult", "learner app checklist items recorded_at")
+# The learner's batch (e.g. "MD 2025"); the latest assignment counts
+CohortAssignment = namedtuple("CohortAssignment", "learner cohort assigned_at")
+
+# Learner IDs of browser sessions whose learner entered no ID start with this
+ANONYMOUS_PREFIX = "session:"
+
+# Columns of the quiz attempts read for cohort statistics
+ATTEMPT_COLUMNS = ("learner", "app", "quiz_id", "question_id", "correct")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS section_visits (
+    learner TEXT NOT NULL,
+    app TEXT NOT NULL,
+    section TEXT NOT NULL,
+    visited_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS section_visits_learner ON section_visits (learner, app);
+CREATE TABLE IF NOT EXISTS quiz_attempts (
+    learner TEXT NOT NULL,
+    app TEXT NOT NULL,
+    quiz_id TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    response TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    attempted_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS quiz_attempts_learner ON quiz_attempts (learner, app);
+CREATE TABLE IF NOT EXISTS checklist_results (
+    learner TEXT NOT NULL,
+    app TEXT NOT NULL,
+    checklist TEXT NOT NULL,
+    items TEXT NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cohort_assignments (
+    learner TEXT NOT NULL,
+    cohort TEXT NOT NULL,
+    assigned_at REAL NOT NULL
+);
+"""
+
+TABLES = {
+    SectionVisit: "section_visits",
+    QuizAttempt: "quiz_attempts",
+    ChecklistResult: "checklist_results",
+    CohortAssignment: "cohort_assignments",
+}
+
+
+# -----------------------------------
+# Backends
+# -----------------------------------
+
+class StorageError(sqlite3.OperationalError):
+    """No pooled connection became free within the pool's timeout"""
+
+
+_reported = set()
+
+
+def report_storage_error(action):
+    """Log a failed storage action with its traceback the first time it fails
+
+    Called from an except block; later failures of the same action are only
+    logged at debug level, so a broken database does not flood the log on
+    every rerun.
+    """
+    if action in _reported:
+        _LOGGER.debug("%s failed again", action, exc_info=True)
+        return
+    _reported.add(action)
+    _LOGGER.exception("%s failed; carrying on without it", action)
+
+
+class ConnectionPool:
+    """SQLite connections shared by every session and thread of the process
+
+    Connections are opened on demand up to size and handed out one caller
+    at a time; WAL mode lets the readers proceed while a batch is written.
+    A connection that fails to open does not count towards size.
+    """
+    __slots__ = ("path", "size", "timeout", "idle", "opened", "lock")
+
+    def __init__(self, path, size=POOL_SIZE, timeout=POOL_TIMEOUT):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.size = size
+        self.timeout = timeout
+        self.idle = queue.LifoQueue()
+        self.opened = 0
+        self.lock = threading.Lock()
+
+    def _open(self):
+        connection = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    def _open_or_wait(self):
+        """A new connection while fewer than size are open, else the next one returned"""
+        with self.lock:
+            fresh = self.opened < self.size
+            if fresh:
+                self.opened += 1
+        if fresh:
+            try:
+                return self._open()
+            except BaseException:
+                with self.lock:
+                    self.opened -= 1
+                raise
+        try:
+            return self.idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise StorageError(f"no connection to {self.path} free after {self.timeout:g}s") from None
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection, waiting up to timeout for one when all size
+        are in use (StorageError after that)
+        """
+        try:
+            connection = self.idle.get_nowait()
+        except queue.Empty:
+            connection = None
+        if connection is None:
+            connection = self._open_or_wait()
+        try:
+            yield connection
+        finally:
+            self.idle.put(connection)
+
+    def close(self):
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class SQLiteBackend:
+    """Progress tables in one SQLite database, through a connection pool"""
+    __slots__ = ("pool",)
+
+    def __init__(self, path, pool_size=POOL_SIZE):
+        self.pool = ConnectionPool(path, pool_size)
+        with self.pool.connection() as connection:
+            connection.executescript(SCHEMA)
+
+    def write(self, batch):
+        """Insert a batch of records, one transaction for the whole batch"""
+        grouped = {}
+        for record in batch:
+            grouped.setdefault(type(record), []).append(record)
+        with self.pool.connection() as connection, connection:
+            for kind, records in grouped.items():
+                placeholders = ", ".join("?" * len(kind._fields))
+                connection.executemany(f"INSERT INTO {TABLES[kind]} VALUES ({placeholders})", records)
+
+    def visited_sections(self, learner, app):
+        with self.pool.connection() as connection:
+            rows = connection.execute(
+                "SELECT DISTINCT section FROM section_visits WHERE learner = ? AND app = ?", (learner, app)
+            ).fetchall()
+        return {section for section, in rows}
+
+    def quiz_attempts(self, learner, app):
+        with self.pool.connection() as connection:
+            rows = connection.execute(
+                "SELECT * FROM quiz_attempts WHERE learner = ? AND app = ? ORDER BY attempted_at",
+                (learner, app)
+            ).fetchall()
+        return [QuizAttempt(*row) for row in rows]
+
+    def attempt_rows(self, after=0):
+        """ATTEMPT_COLUMNS of every quiz attempt written after the cursor, and the new cursor"""
+        with self.pool.connection() as connection:
+            rows = connection.execute(
+                f"SELECT rowid, {', '.join(ATTEMPT_COLUMNS)} FROM quiz_attempts WHERE rowid > ? ORDER BY rowid",
+                (after,)
+            ).fetchall()
+        return [row[1:] for row in rows], rows[-1][0] if rows else after
+
+    def cohorts(self):
+        """Learner -> cohort"""
+        with self.pool.connection() as connection:
+            return dict(connection.execute(
+                "SELECT learner, cohort FROM cohort_assignments ORDER BY assigned_at"
+            ).fetchall())
+
+    def close(self):
+        self.pool.close()
+
+
+class MemoryBackend:
+    """Records kept in lists, gone with the process (MANUAL_PROGRESS_URL=memory:)"""
+    __slots__ = ("records", "lock")
+
+    def __init__(self):
+        self.records = []
+        self.lock = threading.Lock()
+
+    def write(self, batch):
+        with self.lock:
+            self.records.extend(batch)
+
+    def visited_sections(self, learner, app):
+        with self.lock:
+            return {
+                record.section for record in self.records
+                if isinstance(record, SectionVisit) and (record.learner, record.app) == (learner, app)
+            }
+
+    def quiz_attempts(self, learner, app):
+        with self.lock:
+            return [
+                record for record in self.records
+                if isinstance(record, QuizAttempt) and (record.learner, record.app) == (learner, app)
+            ]
+
+    def attempt_rows(self, after=0):
+        with self.lock:
+            rows = [
+                tuple(getattr(record, column) for column in ATTEMPT_COLUMNS)
+                for record in self.records[after:] if isinstance(record, QuizAttempt)
+            ]
+            return rows, len(self.records)
+
+    def cohorts(self):
+        with self.lock:
+            return {
+                record.learner: record.cohort for record in self.records if isinstance(record, CohortAssignment)
+            }
+
+    def close(self):
+        pass
+
+
+def sqlite_path(rest):
+    """Database path of a sqlite: URL after the scheme
+
+    As in SQLAlchemy, sqlite:///relative/path is relative to the working
+    directory and sqlite:////absolute/path is absolute; sqlite:path is also
+    accepted.
+    """
+    if rest.startswith("///"):
+        return rest[3:]
+    return rest[2:] if rest.startswith("//") else rest
+
+
+# URL scheme -> factory called with the rest of the URL
+BACKENDS = {
+    "sqlite": lambda rest: SQLiteBackend(sqlite_path(rest)),
+    "memory": lambda rest: MemoryBackend(),
+}
+
+
+def register_backend(scheme, factory):
+    """Make scheme:<rest> URLs open factory(rest)"""
+    BACKENDS[scheme] = factory
+
+
+def open_backend(url=PROGRESS_URL):
+    """Backend for a progress URL such as sqlite:///.progress/progress.sqlite3"""
+    scheme, _, rest = url.partition(":")
+    if scheme not in BACKENDS:
+        raise ValueError(f"unknown progress backend {scheme!r} (known: {', '.join(BACKENDS)})")
+    return BACKENDS[scheme](rest)
+
+
+# -----------------------------------
+# Batched writer
+# -----------------------------------
+
+class ProgressStore:
+    """Write-behind queue in front of a backend
+
+    record() is a deque append; a daemon thread drains the queue into the
+    backend every FLUSH_SECONDS, or as soon as BATCH_SIZE records are
+    waiting. Reads go to the backend after the queue is flushed, except
+    visited_sections(), which reruns call: it never waits for a write.
+    """
+    __slots__ = ("backend", "pending", "writing", "wake", "flush_lock", "batch_size", "flush_seconds", "writer")
+
+    def __init__(self, backend, batch_size=BATCH_SIZE, flush_seconds=FLUSH_SECONDS):
+        self.backend = backend
+        self.pending = deque()
+        # The batch being written, until it is committed
+        self.writing = ()
+        self.wake = threading.Event()
+        self.flush_lock = threading.Lock()
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.writer = threading.Thread(target=self._run, name="progress-writer", daemon=True)
+        self.writer.start()
+
+    def record(self, record):
+        """Queue a record for the next batch"""
+        self.pending.append(record)
+        if len(self.pending) >= self.batch_size:
+            self.wake.set()
+
+    def _run(self):
+        while True:
+            self.wake.wait(self.flush_seconds)
+            self.wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Write every queued record now"""
+        with self.flush_lock:
+            # Records leave the queue only once the batch holding them is visible
+            batch = self.writing = tuple(self.pending)
+            for _ in batch:
+                self.pending.popleft()
+            try:
+                if batch:
+                    self.backend.write(batch)
+            except Exception:
+                _LOGGER.exception("dropped %d progress records", len(batch))
+            finally:
+                self.writing = ()
+
+    def visited_sections(self, learner, app):
+        """Sections of app the learner has ever opened
+
+        Reads what is committed plus the records still queued or being
+        written, without flushing. The queue is copied before the batch and
+        the batch before the database is read, so a record moving between
+        them is never missed. If the database cannot be read, only the
+        unwritten visits are returned.
+        """
+        unwritten = (*self.pending, *self.writing)
+        visited = {
+            record.section for record in unwritten
+            if isinstance(record, SectionVisit) and (record.learner, record.app) == (learner, app)
+        }
+        try:
+            return visited | self.backend.visited_sections(learner, app)
+        except sqlite3.Error:
+            report_storage_error("reading visited sections")
+            return visited
+
+    def quiz_attempts(self, learner, app):
+        """The learner's answers in app, oldest first"""
+        self.flush()
+        return self.backend.quiz_attempts(learner, app)
+
+    def attempt_rows(self, after=0):
+        """Quiz attempts of every learner recorded since the cursor, and the new cursor"""
+        self.flush()
+        return self.backend.attempt_rows(after)
+
+    def cohorts(self):
+        """Learner -> cohort, for every learner assigned one"""
+        self.flush()
+        return self.backend.cohorts()
+
+    def close(self):
+        self.flush()
+        self.backend.close()
+
+
+_store = None
+_store_failed = False
+_store_lock = threading.Lock()
+
+
+def progress_store():
+    """The process-wide progress store, opened on first use
+
+    None when disabled or when the backend cannot be opened; the failure is
+    logged once and never reaches the page.
+    """
+    global _store, _store_failed
+    if not PROGRESS_ENABLED:
+        return None
+    if _store is None and not _store_failed:
+        with _store_lock:
+            if _store is None and not _store_failed:
+                try:
+                    backend = open_backend()
+                except Exception:
+                    _LOGGER.exception("progress store %s unavailable; recording nothing", PROGRESS_URL)
+                    _store_failed = True
+                    return None
+                _store = ProgressStore(backend)
+                atexit.register(_store.flush)
+    return _store
+
+
+# -----------------------------------
+# Hooks called by the apps
+# -----------------------------------
+
+def current_learner(session_state):
+    """Learner ID entered in the sidebar, else the browser session
+
+    None outside a Streamlit session (e.g. the static export), so nothing is
+    recorded there.
+    """
+    ctx = script_run_ctx()
+    if ctx is None:
+        return None
+    learner = session_state.get("learner_id", "").strip()
+    return learner or f"{ANONYMOUS_PREFIX}{ctx.session_id}"
+
+
+def _recorder(session_state):
+    """(store, learner) to record progress for, None outside a session or when disabled"""
+    learner = current_learner(session_state)
+    if learner is None:
+        return None
+    store = progress_store()
+    return None if store is None else (store, learner)
+
+
+def record_visit(app, section, session_state):
+    """Record that the current learner moved to a section of app
+
+    Reruns that stay on the same section record nothing; the last section is
+    kept per app, as the portal's pages share one session state. Returns
+    whether a visit was recorded.
+    """
+    key = f"visited_section:{app}"
+    if session_state.get(key) == section:
+        return False
+    session_state[key] = section
+    recorder = _recorder(session_state)
+    if recorder is None:
+        return False
+    store, learner = recorder
+    store.record(SectionVisit(learner, app, section, time.time()))
+    return True
+
+
+def record_quiz(app, quiz_id, answers, correct_ids, session_state):
+    """Record a submitted page of answers (question id -> response), one row per question"""
+    recorder = _recorder(session_state)
+    if recorder is None:
+        return
+    store, learner = recorder
+    now = time.time()
+    for question_id, response in answers.items():
+        if isinstance(response, frozenset):
+            response = sorted(response)
+        store.record(QuizAttempt(
+            learner, app, quiz_id, question_id, json.dumps(response), question_id in correct_ids, now
+        ))
+
+
+def record_checklist(app, checklist, items, session_state):
+    """Record the items ticked on a checklist"""
+    recorder = _recorder(session_state)
+    if recorder is not None:
+        store, learner = recorder
+        store.record(ChecklistResult(learner, app, checklist, json.dumps(list(items)), time.time()))
+
+
+def record_cohort(cohort, session_state):
+    """Record the cohort (resident batch) the current learner belongs to"""
+    recorder = _recorder(session_state)
+    if recorder is not None:
+        store, learner = recorder
+        store.record(CohortAssignment(learner, cohort, time.time()))
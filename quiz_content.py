@@ -0,0 +1,12 @@
+"""
+Quiz registry of the Psycho-Oncology learning apps
+Quiz ids, titles and the quizzes/ module holding each quiz's questions; the
+question bank imports a quiz module the first time the quiz is shown
+"""
+
+# Quiz registry: quiz id -> (title, module holding its QUIZ record)
+# Question ids are prefixed with the quiz id, keeping them unique across apps
+quiz_data = {
+    "nursing.communication": ("Therapeutic Communication Practice", "quizzes.nursing_communication"),
+    "nursing.knowledge": ("Quick Knowledge Check", "quizzes.nursing_knowledge"),
+}
@@ -0,0 +1,116 @@
+"""
+Question bank for the quizzes of both learning apps
+Questions are tuple-backed records authored in the quizzes/ modules; the
+answer key is a set of (question id, answer) pairs, so checking a page of
+answers is one hash lookup per answer
+"""
+
+import importlib
+import threading
+from collections import namedtuple
+from functools import lru_cache
+
+# -----------------------------------
+# Quiz records
+# -----------------------------------
+
+# answer: the correct option, or a frozenset of them for multiple choice
+Question = namedtuple("Question", "id title prompt context options multiple answer")
+Quiz = namedtuple("Quiz", "id title questions praise hint")
+QuizEntry = namedtuple("QuizEntry", "id title module")
+
+
+# -----------------------------------
+# Authoring helpers used by the quizzes/ modules
+# -----------------------------------
+
+def single_choice(question_id, prompt, options, answer, title="", context=""):
+    """Question with one correct option (a radio)"""
+    if answer not in options:
+        raise ValueError(f"{question_id}: answer is not one of the options")
+    return Question(question_id, title, prompt, context, tuple(options), False, answer)
+
+
+def multiple_choice(question_id, prompt, options, answers, title="", context=""):
+    """Question whose answer is a set of options (a multiselect)"""
+    answer = frozenset(answers)
+    if not answer <= set(options):
+        raise ValueError(f"{question_id}: answers are not all among the options")
+    return Question(question_id, title, prompt, context, tuple(options), True, answer)
+
+
+def quiz(quiz_id, title, questions, praise="", hint=""):
+    """A page of questions, with the feedback shown for right and wrong answers"""
+    return Quiz(quiz_id, title, tuple(questions), praise, hint)
+
+
+def response(question, value):
+    """A widget value in the shape the answer key holds (multiselect lists become frozensets)"""
+    return frozenset(value) if question.multiple else value
+
+
+# -----------------------------------
+# Question bank
+# -----------------------------------
+
+class QuestionBank:
+    """Every quiz of both apps plus one answer key, quizzes loaded on first use
+
+    The registry only names each quiz's module; the module is imported (and
+    its answers added to the key) the first time the quiz is requested, so
+    the bank can hold thousands of items without slowing startup.
+    """
+    __slots__ = ("entries", "quizzes", "answer_key", "lock")
+
+    def __init__(self, quiz_data):
+        self.entries = {
+            quiz_id: QuizEntry(quiz_id, title, module)
+            for quiz_id, (title, module) in quiz_data.items()
+        }
+        self.quizzes = {}
+        self.answer_key = set()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, quiz_id):
+        return quiz_id in self.entries
+
+    def load(self, quiz_id):
+        """Quiz by id, importing its module on first use"""
+        loaded = self.quizzes.get(quiz_id)
+        if loaded is not None:
+            return loaded
+        with self.lock:
+            if quiz_id not in self.quizzes:
+                module = importlib.import_module(self.entries[quiz_id].module)
+                self.add(module.QUIZ)
+            return self.quizzes[quiz_id]
+
+    def add(self, loaded):
+        """Register a quiz record and add its answers to the key"""
+        self.entries.setdefault(loaded.id, QuizEntry(loaded.id, loaded.title, None))
+        self.answer_key.update((question.id, question.answer) for question in loaded.questions)
+        self.quizzes[loaded.id] = loaded
+
+    def correct(self, answers):
+        """Ids of the correctly answered questions in a question id -> response mapping"""
+        key = self.answer_key
+        return {question_id for question_id, answer in answers.items() if (question_id, answer) in key}
+
+    def score(self, answers):
+        """Number of correct answers in a question id -> response mapping"""
+        return len(self.correct(answers))
+
+
+def compile_question_bank(module_name="quiz_content"):
+    """Build the question bank from the quiz registry module"""
+    module = importlib.import_module(module_name)
+    return QuestionBank(module.quiz_data)
+
+
+@lru_cache(maxsize=None)
+def shared_question_bank():
+    """The question bank of this process, shared by every page of the portal"""
+    return compile_question_bank()
@@ -0,0 +1,6 @@
+"""
+Quiz content of the learning apps, one module per quiz registry entry
+Each module defines QUIZ, the quiz record built with the quiz_engine
+authoring helpers. The registry in quiz_content names the module of every
+quiz, and the question bank imports it on the quiz's first use.
+"""
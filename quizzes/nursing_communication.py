@@ -0,0 +1,79 @@
+"""
+Nursing guide: therapeutic communication practice scenarios
+Each question is a patient scenario; the context is what the patient says
+"""
+
+from quiz_engine import quiz, single_choice
+
+PROMPT = "Select the most therapeutic response:"
+
+QUIZ = quiz("nursing.communication", "Therapeutic Communication Practice", [
+    single_choice(
+        "nursing.communication.fear_of_dying",
+        PROMPT,
+        [
+            "Don't worry, our doctors are the best.",
+            "That sounds incredibly difficult. Tell me more about what scares you most.",
+            "You need to think positively.",
+            "Let me get you something for sleep."
+        ],
+        "That sounds incredibly difficult. Tell me more about what scares you most.",
+        title="Patient expressing fear of dying",
+        context="I'm so scared I'm going to die. I can't sleep thinking about it."
+    ),
+    single_choice(
+        "nursing.communication.treatment_delays",
+        PROMPT,
+        [
+            "Sir, please calm down. We're doing our best.",
+            "I can hear how frustrated you are. This wait must be really difficult.",
+            "Everyone has to wait their turn.",
+            "I'll see what I can do to speed things up."
+        ],
+        "I can hear how frustrated you are. This wait must be really difficult.",
+        title="Patient angry about treatment delays",
+        context="This is ridiculous! I've been waiting 2 hours! Don't you people care?"
+    ),
+    single_choice(
+        "nursing.communication.caregiver_strain",
+        PROMPT,
+        [
+            "Don't say that, you're doing a great job.",
+            "Being a caregiver is incredibly challenging. Tell me more about what's hardest right now.",
+            "Everyone feels this way sometimes.",
+            "Maybe you should consider hiring more help."
+        ],
+        "Being a caregiver is incredibly challenging. Tell me more about what's hardest right now.",
+        title="Family member overwhelmed with caregiving",
+        context="I don't know how much longer I can do this. I'm exhausted and I'm failing at everything."
+    ),
+    single_choice(
+        "nursing.communication.why_me",
+        PROMPT,
+        [
+            "Cancer is random - it can happen to anyone.",
+            "That's a question many people ask. What thoughts or feelings come up when you wonder 'why me'?",
+            "Try not to dwell on questions without answers.",
+            "Everything happens for a reason.",
+            "Let's focus on the treatment plan instead."
+        ],
+        "That's a question many people ask. What thoughts or feelings come up when you wonder 'why me'?",
+        title="Patient questioning 'Why me?'",
+        context="Why is this happening to me? What did I do to deserve this?"
+    ),
+    single_choice(
+        "nursing.communication.hair_loss",
+        PROMPT,
+        [
+            "Don't worry, it will grow back after treatment.",
+            "Losing your hair must be really difficult. Tell me more about how this is affecting you.",
+            "It's just hair - what matters is that you're getting better.",
+            "Many patients use wigs or scarves. Would you like to see some options?",
+            "You're still beautiful, even without hair."
+        ],
+        "Losing your hair must be really difficult. Tell me more about how this is affecting you.",
+        title="Patient crying about hair loss",
+        context="I look like a monster. I can't even recognize myself in the mirror anymore."
+    ),
+], praise="✅ Excellent! This validates emotion and invites sharing.",
+   hint="Try again - look for the response that validates feelings first.")
@@ -0,0 +1,45 @@
+"""
+Nursing guide: quick knowledge check on the Assessment page
+"""
+
+from quiz_engine import multiple_choice, quiz, single_choice
+
+QUIZ = quiz("nursing.knowledge", "Quick Knowledge Check", [
+    single_choice(
+        "nursing.knowledge.hope",
+        "Which statement about hope in cancer care is most accurate?",
+        [
+            "Nurses should maintain hope for cure at all times",
+            "Hope should be reframed to match current reality",
+            "Hope is only relevant in early-stage cancer",
+            "Discussing hope gives false reassurance"
+        ],
+        "Hope should be reframed to match current reality"
+    ),
+    multiple_choice(
+        "nursing.knowledge.anger",
+        "Which are appropriate therapeutic responses to anger? (Select all that apply)",
+        [
+            "Take it personally and defend the healthcare team",
+            "See anger as expression of underlying distress",
+            "Respond with curiosity about the source",
+            "Set boundaries while maintaining empathy"
+        ],
+        [
+            "See anger as expression of underlying distress",
+            "Respond with curiosity about the source",
+            "Set boundaries while maintaining empathy"
+        ]
+    ),
+    single_choice(
+        "nursing.knowledge.economic_toxicity",
+        "What is 'economic toxicity'?",
+        [
+            "Side effects of chemotherapy",
+            "The financial burden of cancer treatment",
+            "Toxic work environments",
+            "Psychological distress from diagnosis"
+        ],
+        "The financial burden of cancer treatment"
+    ),
+], praise="🎉 Excellent understanding of key concepts!")
@@ -0,0 +1,54 @@
+"""
+Batched rendering for the Streamlit apps
+Accumulates markdown/HTML fragments and emits them as a single element
+"""
+
+import streamlit as st
+
+from content_markup import compose
+from styles import link_tag, style_tag
+
+
+def inject_styles(name):
+    """Apply static/<name>.css to the current page
+
+    Links the versioned stylesheet served by Streamlit, falling back to
+    inlining it when static file serving is disabled (e.g. `streamlit run`
+    outside the repo root, or AppTest).
+    """
+    if st.get_option("server.enableStaticServing"):
+        st.markdown(link_tag(name), unsafe_allow_html=True)
+    else:
+        st.markdown(style_tag(name), unsafe_allow_html=True)
+
+
+class RenderBuffer:
+    """Collects markdown/HTML fragments and flushes them as one st.markdown call
+
+    Fragments are separated by blank lines, so an opening '<div class=...>',
+    markdown content and the closing '</div>' end up in the same element and
+    are actually nested by the browser. Use as a context manager; whatever is
+    still buffered is flushed on exit.
+    """
+    __slots__ = ("container", "parts")
+
+    def __init__(self, container=None):
+        self.container = st if container is None else container
+        self.parts = []
+
+    def add(self, markup):
+        """Queue a markdown/HTML fragment"""
+        self.parts.append(markup)
+
+    def flush(self):
+        """Emit everything queued so far as one element"""
+        if self.parts:
+            self.container.markdown(compose(tuple(self.parts)), unsafe_allow_html=True)
+            self.parts = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
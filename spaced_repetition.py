@@ -0,0 +1,279 @@
+"""
+Spaced repetition deck of the residents' manual review questions
+Self-graded review cards scheduled with SM-2; each learner's card states live
+in a local SQLite database (MANUAL_REVIEW_DB, default .reviews/reviews.sqlite3)
+indexed by due day, so the daily queue is an index range scan however long
+the review history grows; grades are written behind, in batches. Nothing is
+scheduled when MANUAL_PROGRESS=0, and a database that cannot be read leaves
+the queue empty rather than breaking the page.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from datetime import date
+from pathlib import Path
+
+from content_model import Questions, walk_blocks
+from progress_store import PROGRESS_ENABLED, ConnectionPool, ProgressStore, report_storage_error
+
+REVIEW_DB = Path(os.environ.get("MANUAL_REVIEW_DB", ".reviews/reviews.sqlite3"))
+NEW_CARDS_PER_DAY = int(os.environ.get("MANUAL_REVIEW_NEW_PER_DAY", "10"))
+
+Card = namedtuple("Card", "id chapter_id chapter_title question answer")
+CardState = namedtuple("CardState", "repetitions interval easiness due")
+# A graded review and the card state it leads to, queued until committed
+Review = namedtuple("Review", "learner card_id day quality reviewed_at state introduced")
+
+NEW_CARD = CardState(0, 0, 2.5, None)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Self-grading buttons and the SM-2 quality (0-5) each one records
+GRADES = (("Again", 1), ("Hard", 3), ("Good", 4), ("Easy", 5))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS card_state (
+    learner TEXT NOT NULL,
+    card_id TEXT NOT NULL,
+    repetitions INTEGER NOT NULL,
+    interval INTEGER NOT NULL,
+    easiness REAL NOT NULL,
+    due INTEGER NOT NULL,
+    introduced INTEGER NOT NULL,
+    PRIMARY KEY (learner, card_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS card_state_due ON card_state (learner, due);
+CREATE TABLE IF NOT EXISTS review_log (
+    learner TEXT NOT NULL,
+    card_id TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    quality INTEGER NOT NULL,
+    reviewed_at REAL NOT NULL
+);
+"""
+
+
+def today():
+    """Day number used for scheduling (proleptic Gregorian ordinal)"""
+    return date.today().toordinal()
+
+
+def sm2(state, quality, day):
+    """SM-2: a card's next state after a review graded quality (0-5) on day
+
+    A lapse (quality < 3) restarts the repetitions with a one-day interval;
+    otherwise intervals go 1, 6, then grow by the easiness factor, which is
+    adjusted by every grade and never drops below 1.3.
+    """
+    if quality < 3:
+        repetitions, interval = 0, 1
+    else:
+        repetitions = state.repetitions + 1
+        if repetitions == 1:
+            interval = 1
+        elif repetitions == 2:
+            interval = 6
+        else:
+            interval = round(state.interval * state.easiness)
+    easiness = max(1.3, state.easiness + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    return CardState(repetitions, interval, easiness, day + interval)
+
+
+def card_id(chapter, question):
+    """Id of a review question: the chapter id plus a hash of the question's
+    text (e.g. 2.4.1f0c9a2e), so adding or reordering questions does not move
+    learners' schedules to other questions
+    """
+    digest = hashlib.sha256(" ".join(question.split()).encode("utf-8")).hexdigest()[:8]
+    return f"{chapter.id}.{digest}"
+
+
+def chapter_cards(chapter):
+    """A chapter's review questions as cards, in the chapter's order"""
+    questions = (
+        card for block in walk_blocks(chapter.blocks) if isinstance(block, Questions) for card in block.items
+    )
+    return [
+        Card(card_id(chapter, card.question), chapter.id, chapter.title, card.question, card.answer)
+        for card in questions
+    ]
+
+
+def review_deck(store):
+    """Every review question of the manual as a card id -> card mapping, in navigation order"""
+    return {card.id: card for chapter in store for card in chapter_cards(chapter)}
+
+
+class ReviewStore:
+    """Learners' card states and review history in one SQLite database
+
+    Reads go through a connection pool shared by every session. Reviews
+    are applied to an in-memory overlay of unwritten card states and
+    written behind, in batches, by the progress store's writer thread, so
+    a grade click never waits on a commit; every read merges the overlay.
+    """
+    __slots__ = ("path", "pool", "unwritten", "lock", "writer")
+
+    def __init__(self, path=REVIEW_DB):
+        self.path = Path(path)
+        self.pool = ConnectionPool(path)
+        with self.pool.connection() as connection:
+            connection.executescript(SCHEMA)
+        # (learner, card id) -> the Review not yet committed for that card
+        self.unwritten = {}
+        self.lock = threading.Lock()
+        self.writer = ProgressStore(self)
+        atexit.register(self.writer.flush)
+
+    def close(self):
+        self.writer.flush()
+        self.pool.close()
+
+    def write(self, batch):
+        """Commit a batch of reviews (called by the writer thread)
+
+        The batch leaves the overlay whether or not the commit succeeds: a
+        failed batch is logged and dropped, and the cards show their last
+        committed schedule again rather than one that was never saved.
+        """
+        try:
+            with self.pool.connection() as connection, connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO card_state VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(review.learner, review.card_id, *review.state, review.introduced) for review in batch]
+                )
+                connection.executemany(
+                    "INSERT INTO review_log VALUES (?, ?, ?, ?, ?)",
+                    [(review.learner, review.card_id, review.day, review.quality, review.reviewed_at)
+                     for review in batch]
+                )
+        except Exception:
+            _LOGGER.exception("dropped %d reviews", len(batch))
+        with self.lock:
+            for review in batch:
+                key = (review.learner, review.card_id)
+                if self.unwritten.get(key) is review:
+                    del self.unwritten[key]
+
+    def _stored(self, learner, card_id):
+        """(CardState, introduced day) committed for a card, or None"""
+        with self.pool.connection() as connection:
+            row = connection.execute(
+                "SELECT repetitions, interval, easiness, due, introduced FROM card_state"
+                " WHERE learner = ? AND card_id = ?",
+                (learner, card_id)
+            ).fetchone()
+        return (CardState(*row[:4]), row[4]) if row else None
+
+    def _learner_unwritten(self, learner):
+        with self.lock:
+            return {card_id: review for (owner, card_id), review in self.unwritten.items() if owner == learner}
+
+    def state(self, learner, card_id):
+        """A learner's state for one card, NEW_CARD if never reviewed"""
+        review = self.unwritten.get((learner, card_id))
+        if review is not None:
+            return review.state
+        stored = self._stored(learner, card_id)
+        return stored[0] if stored else NEW_CARD
+
+    def review(self, learner, card_id, quality, day=None):
+        """Record a self-graded review and return the card's next state
+
+        None, and nothing recorded, when the card's committed state cannot
+        be read.
+        """
+        day = today() if day is None else day
+        key = (learner, card_id)
+        previous = self.unwritten.get(key)
+        try:
+            stored = None if previous is not None else self._stored(learner, card_id)
+        except sqlite3.Error:
+            report_storage_error("reading a card's review state")
+            return None
+        with self.lock:
+            previous = self.unwritten.get(key, previous)
+            if previous is not None:
+                state, introduced = previous.state, previous.introduced
+            elif stored is not None:
+                state, introduced = stored
+            else:
+                state, introduced = NEW_CARD, day
+            review = Review(learner, card_id, day, quality, time.time(), sm2(state, quality, day), introduced)
+            self.unwritten[key] = review
+        self.writer.record(review)
+        return review.state
+
+    def due_cards(self, learner, day=None):
+        """Ids of the learner's reviewed cards due on or before day, most overdue first
+
+        Only the unwritten reviews count when the database cannot be read.
+        """
+        day = today() if day is None else day
+        unwritten = self._learner_unwritten(learner)
+        try:
+            with self.pool.connection() as connection:
+                rows = connection.execute(
+                    "SELECT card_id, due FROM card_state WHERE learner = ? AND due <= ?",
+                    (learner, day)
+                ).fetchall()
+        except sqlite3.Error:
+            report_storage_error("reading due review cards")
+            rows = []
+        due = {card_id: card_due for card_id, card_due in rows if card_id not in unwritten}
+        due.update((card_id, review.state.due) for card_id, review in unwritten.items() if review.state.due <= day)
+        return sorted(due, key=lambda card_id: (due[card_id], card_id))
+
+    def daily_queue(self, learner, deck, day=None, new_per_day=NEW_CARDS_PER_DAY):
+        """Today's cards for a learner: everything due, then unseen cards in
+        deck order up to the daily allowance of new cards
+
+        No new cards are added when the cards already seen cannot be read.
+        """
+        day = today() if day is None else day
+        queue = [card_id for card_id in self.due_cards(learner, day) if card_id in deck]
+        try:
+            with self.pool.connection() as connection:
+                seen = dict(connection.execute(
+                    "SELECT card_id, introduced FROM card_state WHERE learner = ?", (learner,)
+                ).fetchall())
+        except sqlite3.Error:
+            report_storage_error("reading introduced review cards")
+            return queue
+        seen.update((card_id, review.introduced) for card_id, review in self._learner_unwritten(learner).items())
+        allowance = new_per_day - sum(1 for introduced in seen.values() if introduced == day)
+        if allowance > 0:
+            unseen = (card_id for card_id in deck if card_id not in seen)
+            queue.extend(card_id for _, card_id in zip(range(allowance), unseen))
+        return queue
+
+
+_store = None
+_store_failed = False
+_store_lock = threading.Lock()
+
+
+def review_store():
+    """The process-wide review store, opened on first use
+
+    None when progress is not recorded (MANUAL_PROGRESS=0) or when the
+    database cannot be opened; the failure is logged once.
+    """
+    global _store, _store_failed
+    if not PROGRESS_ENABLED:
+        return None
+    if _store is None and not _store_failed:
+        with _store_lock:
+            if _store is None and not _store_failed:
+                try:
+                    _store = ReviewStore()
+                except (OSError, sqlite3.Error):
+                    _LOGGER.exception("review store %s unavailable; scheduling nothing", REVIEW_DB)
+                    _store_failed = True
+    return _store
@@ -0,0 +1,709 @@
+"""
+Static site export of the Psycho-Oncology manuals
+
+Renders every navigation entry of the residents' manual and every section of
+the nursing guide to plain HTML pages with content-hashed stylesheets, plus
+the standalone emergency helplines page (see emergency_page), and
+writes precompressed .gz and .br siblings (.br only when the brotli package
+is installed; the export says when it is not), so read-only traffic can be
+served without Python, e.g. with nginx:
+
+    location / { gzip_static on; brotli_static on; }
+
+Builds are incremental: .export-manifest.json in the output directory records
+a content hash per chapter, nursing guide section, stylesheet and shared table,
+and only pages whose inputs changed are re-rendered (in parallel). Files whose
+bytes did not change are left untouched so clients keep their cached copies.
+
+Quizzes and other widgets are listed on the static pages with a pointer to
+the interactive Streamlit app.
+
+The app's deep links (?section=2.1&anchor=case_2.1.1) map onto the export:
+chapters are manual/<section>.html and anchors keep their ids, and
+deeplinks.map lets a caching reverse proxy answer them from the export:
+
+    map $arg_section $manual_page { default ""; include site/deeplinks.map; }
+    location = / { if ($manual_page) { return 302 $manual_page#$arg_anchor; } ... }
+
+Usage: python static_export.py [--out site] [--app-url URL] [--jobs N] [--force]
+"""
+
+import argparse
+import ast
+import gzip
+import hashlib
+import json
+import re
+import runpy
+import sys
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+from urllib.parse import urlencode
+
+from content_markup import FOOTER_HTML, HEADER_HTML, case_study_markup, render_plan, review_questions_markup
+from chapters.shared import EMERGENCY_RESOURCES
+from content_model import CaseStudy, Columns, Questions, Table, compile_content_store, walk_blocks
+from emergency_page import emergency_html
+from manual_search import called_functions, section_branches, section_chain
+from markdown_html import inline, to_html
+from quiz_engine import compile_question_bank
+from styles import stylesheet, stylesheet_version
+
+BASE_DIR = Path(__file__).resolve().parent
+NURSING_SCRIPT = BASE_DIR / "streamlit_app.py"
+NURSING_SECTION_LABEL = "Go to section:"
+# First-party modules that import streamlit, re-imported against StaticStreamlit
+STREAMLIT_HELPERS = ("render_buffer", "profiling")
+
+STYLESHEETS = ("export", "manual", "nursing")
+
+# Bump when the output format changes in a way the input hashes cannot see
+EXPORT_VERSION = 1
+MANIFEST_NAME = ".export-manifest.json"
+DEEP_LINKS_NAME = "deeplinks.map"
+# Modules whose source is hashed into every page, so renderer changes rebuild the site
+RENDERER_MODULES = ("static_export.py", "markdown_html.py", "content_markup.py", "tables.py", "emergency_page.py")
+ACTIVE = ' class="active"'
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+{stylesheets}
+</head>
+<body>
+<nav class="site-nav">
+{nav}
+</nav>
+<main class="page">
+{body}
+</main>
+</body>
+</html>
+"""
+
+
+def slugify(text):
+    """URL-safe file name for a section title"""
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+# -----------------------------------
+# Streamlit stand-in for rendering the nursing guide script
+# -----------------------------------
+
+class StaticContainer:
+    """Collects the elements written into a page, column, tab or expander"""
+
+    def __init__(self, st):
+        self.st = st
+        self.children = []
+
+    def add(self, node):
+        self.children.append(node)
+
+    def __enter__(self):
+        self.st.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.st.stack.pop()
+
+    def __getattr__(self, name):
+        method = getattr(self.st, name)
+
+        def call(*args, **kwargs):
+            with self:
+                return method(*args, **kwargs)
+        return call
+
+
+class StaticStreamlit:
+    """Just enough of the streamlit module to record a script's output as nodes
+
+    Selectboxes and radios return the value given in `choices` (keyed by
+    label), otherwise their first option or None; other widgets are recorded
+    as static placeholders and return an empty value.
+    """
+
+    def __init__(self, choices=None):
+        self.choices = choices or {}
+        self.session_state = {}
+        self.root = StaticContainer(self)
+        self.sidebar = StaticContainer(self)
+        self.stack = [self.root]
+        self.options = {}
+        self.selectboxes = []
+
+    def add(self, node):
+        self.stack[-1].add(node)
+
+    def __getattr__(self, name):
+        raise AttributeError(f"static export does not support st.{name}")
+
+    @staticmethod
+    def cache_resource(func=None, **kwargs):
+        return func if func is not None else (lambda wrapped: wrapped)
+
+    cache_data = cache_resource
+    fragment = cache_resource
+
+    def set_page_config(self, **kwargs):
+        pass
+
+    def get_option(self, key):
+        # Stylesheets are linked by the page template, never inlined
+        return False
+
+    def balloons(self):
+        pass
+
+    def markdown(self, body, unsafe_allow_html=False, **kwargs):
+        if not body.lstrip().startswith("<style"):
+            self.add(("markdown", body))
+
+    def write(self, *args, **kwargs):
+        self.markdown(" ".join(str(arg) for arg in args))
+
+    def title(self, body, **kwargs):
+        self.markdown(f"# {body}")
+
+    def header(self, body, **kwargs):
+        self.markdown(f"## {body}")
+
+    def subheader(self, body, **kwargs):
+        self.markdown(f"### {body}")
+
+    def caption(self, body, **kwargs):
+        self.markdown(body)
+
+    def divider(self):
+        self.markdown("---")
+
+    def _alert(self, kind, body):
+        self.add(("alert", kind, body))
+
+    def success(self, body, **kwargs):
+        self._alert("success", body)
+
+    def info(self, body, **kwargs):
+        self._alert("info", body)
+
+    def warning(self, body, **kwargs):
+        self._alert("warning", body)
+
+    def error(self, body, **kwargs):
+        self._alert("error", body)
+
+    def columns(self, spec, **kwargs):
+        count = spec if isinstance(spec, int) else len(spec)
+        containers = [StaticContainer(self) for _ in range(count)]
+        self.add(("columns", containers))
+        return containers
+
+    def tabs(self, labels):
+        containers = [StaticContainer(self) for _ in labels]
+        self.add(("tabs", list(labels), containers))
+        return containers
+
+    def expander(self, label, expanded=False, **kwargs):
+        container = StaticContainer(self)
+        self.add(("expander", label, container))
+        return container
+
+    def selectbox(self, label, options, **kwargs):
+        options = list(options)
+        self.options[label] = options
+        self.selectboxes.append(label)
+        self.add(("select", label))
+        choice = self.choices.get(label)
+        return choice if choice in options else options[0]
+
+    def radio(self, label, options, **kwargs):
+        options = list(options)
+        self.options[label] = options
+        if label in self.choices:
+            return self.choices[label]
+        self.add(("widget", label, options))
+        return None
+
+    def multiselect(self, label, options, **kwargs):
+        self.add(("widget", label, list(options)))
+        return []
+
+    def button(self, label, **kwargs):
+        self.add(("widget", label, []))
+        return False
+
+    def text_input(self, label, **kwargs):
+        self.add(("widget", label, []))
+        return ""
+
+
+def run_script(path, choices=None):
+    """Execute a Streamlit script against StaticStreamlit and return it"""
+    fake = StaticStreamlit(choices)
+    saved = {name: sys.modules.get(name) for name in ("streamlit",) + STREAMLIT_HELPERS}
+    sys.modules["streamlit"] = fake
+    for name in STREAMLIT_HELPERS:
+        sys.modules.pop(name, None)
+    try:
+        runpy.run_path(str(path), run_name="__main__")
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+    return fake
+
+
+# -----------------------------------
+# HTML rendering
+# -----------------------------------
+
+def widget_note(app_url):
+    """Pointer from a static widget placeholder to the interactive app"""
+    if app_url:
+        return f'<p class="widget-note"><a href="{escape(app_url)}">Answer this in the interactive app →</a></p>'
+    return '<p class="widget-note">Interactive exercise: answer this in the Streamlit app.</p>'
+
+
+def nodes_html(nodes, app_url):
+    """HTML fragments for recorded nodes, one per top-level node"""
+    fragments = []
+    for node in nodes:
+        kind = node[0]
+        if kind == "markdown":
+            fragments.append(to_html(textwrap.dedent(node[1]).strip()))
+        elif kind == "alert":
+            fragments.append(f'<div class="alert alert-{node[1]}">{to_html(node[2])}</div>')
+        elif kind == "columns":
+            panes = "".join(
+                f'<div class="column">{"".join(nodes_html(c.children, app_url))}</div>' for c in node[1]
+            )
+            fragments.append(f'<div class="columns">{panes}</div>')
+        elif kind == "tabs":
+            fragments.append("".join(
+                f'<section class="tab"><h3 class="tab-label">{inline(label)}</h3>'
+                f'{"".join(nodes_html(c.children, app_url))}</section>'
+                for label, c in zip(node[1], node[2])
+            ))
+        elif kind == "expander":
+            fragments.append(
+                f'<details><summary>{inline(node[1])}</summary>'
+                f'{"".join(nodes_html(node[2].children, app_url))}</details>'
+            )
+        elif kind == "widget":
+            options = "".join(f"<li>{inline(option)}</li>" for option in node[2])
+            fragments.append(
+                f'<div class="widget"><p class="widget-label">{inline(node[1])}</p>'
+                f'{f"<ul>{options}</ul>" if options else ""}{widget_note(app_url)}</div>'
+            )
+        else:
+            # Selectbox markers are expanded by nursing_section_html
+            fragments.append("")
+    return fragments
+
+
+def manual_blocks_html(blocks):
+    """HTML for a sequence of manual content records"""
+    parts = []
+    for item in render_plan(blocks):
+        if isinstance(item, str):
+            parts.append(to_html(item))
+        elif isinstance(item, CaseStudy):
+            parts.append(
+                f'<details id="case_{escape(item.number)}">'
+                f"<summary>📋 Case Study {escape(item.number)}: {inline(item.title)}</summary>"
+                f"{to_html(case_study_markup(item.number, item.title, item.body))}</details>"
+            )
+        elif isinstance(item, Questions):
+            parts.append(to_html(review_questions_markup(item.items)))
+        elif isinstance(item, Columns):
+            panes = "".join(f'<div class="column">{manual_blocks_html(pane)}</div>' for pane in item.panes)
+            parts.append(f'<div class="columns">{panes}</div>')
+    return "\n".join(parts)
+
+
+def app_deep_link(app_url, chapter_id):
+    """URL of a chapter in the interactive manual (see residentsmanual's ?section=)"""
+    return f"{app_url}?{urlencode({'section': chapter_id})}"
+
+
+def manual_chapter_html(chapter, app_url=None):
+    """Page body for one chapter of the residents' manual"""
+    link = ""
+    if app_url:
+        link = (
+            f'<p class="widget-note"><a href="{escape(app_deep_link(app_url, chapter.id))}">'
+            f'Open this chapter in the interactive manual →</a></p>'
+        )
+    return "\n".join((
+        to_html(textwrap.dedent(HEADER_HTML).strip()),
+        link,
+        manual_blocks_html(chapter.blocks),
+        "<hr>",
+        to_html(textwrap.dedent(FOOTER_HTML).strip()),
+    ))
+
+
+def common_suffix_length(sequences):
+    """Number of trailing items shared by every sequence"""
+    length = 0
+    shortest = min(len(sequence) for sequence in sequences)
+    while length < shortest and len({sequence[-1 - length] for sequence in sequences}) == 1:
+        length += 1
+    return length
+
+
+def nursing_section_html(section, app_url):
+    """Page body for one nursing guide section, expanding its first selectbox"""
+    fake = run_script(NURSING_SCRIPT, {NURSING_SECTION_LABEL: section})
+    fragments = nodes_html(fake.root.children, app_url)
+    if not fake.selectboxes:
+        return "\n".join(fragments)
+
+    # Re-run the section once per option of its selectbox and lay the
+    # option-specific output side by side
+    label = fake.selectboxes[0]
+    marker = next(i for i, node in enumerate(fake.root.children) if node == ("select", label))
+    variants = {}
+    for option in fake.options[label]:
+        run = run_script(NURSING_SCRIPT, {NURSING_SECTION_LABEL: section, label: option})
+        variants[option] = nodes_html(run.root.children, app_url)[marker + 1:]
+    suffix = common_suffix_length(list(variants.values()))
+    sections = "".join(
+        f'<section class="variant"><h4>{inline(label)} {inline(option)}</h4>'
+        f'{"".join(body[:len(body) - suffix])}</section>'
+        for option, body in variants.items()
+    )
+    tail = fragments[len(fragments) - suffix:] if suffix else []
+    return "\n".join(fragments[:marker] + [f'<div class="variants">{sections}</div>'] + tail)
+
+
+# -----------------------------------
+# Site assembly
+# -----------------------------------
+
+@lru_cache(maxsize=None)
+def load_store():
+    """Content store for this process (each pool worker compiles its own)"""
+    return compile_content_store()
+
+
+@lru_cache(maxsize=None)
+def nursing_sections():
+    """Section titles offered by the nursing guide's sidebar radio"""
+    return tuple(run_script(NURSING_SCRIPT).options[NURSING_SECTION_LABEL])
+
+
+@lru_cache(maxsize=None)
+def hashed_asset(name):
+    """File name and bytes of a content-hashed stylesheet"""
+    return f"{name}.{stylesheet_version(name)}.css", stylesheet(name).encode("utf-8")
+
+
+def page(title, nav, body, stylesheets, depth):
+    """Full HTML document"""
+    prefix = "../" * depth
+    links = "\n".join(
+        f'<link rel="stylesheet" href="{prefix}assets/{hashed_asset(name)[0]}">' for name in stylesheets
+    )
+    return PAGE_TEMPLATE.format(title=escape(title), stylesheets=links, nav=nav, body=body)
+
+
+def manual_nav(store, active_id):
+    """Sidebar navigation for the residents' manual"""
+    parts = ['<p class="nav-title"><a href="../index.html">📖 Navigation</a></p>']
+    for section_title, chapters in store.navigation:
+        parts.append(f'<p class="nav-section">{escape(section_title)}</p><ul>')
+        for chapter in chapters:
+            active = ACTIVE if chapter.id == active_id else ""
+            parts.append(
+                f'<li><a{active} href="{escape(chapter.id)}.html">{escape(chapter.id)}: {escape(chapter.title)}</a></li>'
+            )
+        parts.append("</ul>")
+    return "\n".join(parts)
+
+
+def nursing_nav(sections, active):
+    """Sidebar navigation for the nursing guide"""
+    items = "".join(
+        f'<li><a{ACTIVE if section == active else ""} href="{slugify(section)}.html">{escape(section)}</a></li>'
+        for section in sections
+    )
+    return f'<p class="nav-title"><a href="../index.html">📋 Chapter Navigation</a></p><ul>{items}</ul>'
+
+
+def index_html():
+    """Body of the landing page linking both manuals"""
+    store = load_store()
+    return "".join((
+        '<h1>Psycho-Oncology Training Materials</h1>',
+        '<p><a href="emergency.html">🚨 Emergency helplines</a></p>',
+        '<h2>Training Manual in Psycho-Oncology (Psychiatry Residents)</h2><ul>',
+        "".join(f'<li><a href="manual/{escape(c.id)}.html">{escape(c.id)}: {escape(c.title)}</a></li>' for c in store.entries.values()),
+        '</ul><h2>Psychosocial Aspects of Cancer Care (Oncology Nurses)</h2><ul>',
+        "".join(f'<li><a href="nursing/{slugify(s)}.html">{escape(s)}</a></li>' for s in nursing_sections()),
+        '</ul>',
+    ))
+
+
+def deep_links_map(store):
+    """nginx map from the app's ?section= deep links to the exported pages"""
+    return "".join(f'"{chapter_id}" /manual/{chapter_id}.html;\n' for chapter_id in store.entries)
+
+
+def render_job(job):
+    """Bytes of one exported file; runs in a pool worker
+
+    job is (kind, key, app_url) with kind one of
+    asset/manual/nursing/emergency/deeplinks/index.
+    """
+    kind, key, app_url = job
+    if kind == "asset":
+        return hashed_asset(key)[1]
+    if kind == "emergency":
+        return emergency_html(home_url="index.html")
+    if kind == "deeplinks":
+        return deep_links_map(load_store()).encode("utf-8")
+    if kind == "manual":
+        store = load_store()
+        chapter = store.load(key)
+        html = page(
+            f"{chapter.id}: {chapter.title} · Psycho-Oncology Training Manual",
+            manual_nav(store, chapter.id),
+            manual_chapter_html(chapter, app_url),
+            ("export", "manual"),
+            depth=1,
+        )
+    elif kind == "nursing":
+        html = page(
+            f"{key} · Psychosocial Aspects of Cancer Care",
+            nursing_nav(nursing_sections(), key),
+            nursing_section_html(key, app_url),
+            ("export", "nursing"),
+            depth=1,
+        )
+    else:
+        html = page("Psycho-Oncology Training Materials", "", index_html(), ("export",), depth=0)
+    return html.encode("utf-8")
+
+
+# -----------------------------------
+# Incremental builds
+# -----------------------------------
+
+def content_hash(*parts):
+    """Short stable hash of the repr of some inputs"""
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def nursing_source_hashes(path=NURSING_SCRIPT):
+    """Hash of each `if section == ...` branch (including the module-level
+    functions it calls) and of the code shared by all sections
+    """
+    source = Path(path).read_text(encoding="utf-8")
+    tree = ast.parse(source)
+    functions = {node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)}
+    holder, chain = section_chain(tree)
+    shared = [ast.get_source_segment(source, node) for node in tree.body if not isinstance(node, ast.FunctionDef)]
+    branches = {}
+    called = {holder.name} if holder else set()
+    for section, branch in section_branches(chain):
+        names = sorted(called_functions(branch.body, functions))
+        called.update(names)
+        branches[section] = content_hash(
+            [ast.get_source_segment(source, stmt) for stmt in branch.body],
+            [ast.get_source_segment(source, functions[name]) for name in names],
+        )
+    if holder:
+        # render_section itself, without the branches hashed above
+        shared.extend(ast.get_source_segment(source, stmt) for stmt in holder.body if stmt is not chain)
+    shared.extend(ast.get_source_segment(source, node) for name, node in functions.items() if name not in called)
+    return content_hash(shared), branches
+
+
+def quizzes_hash():
+    """Hash of every quiz record, with multiple choice answers in a stable order"""
+    bank = compile_question_bank()
+    questions = [
+        question._replace(answer=sorted(question.answer)) if question.multiple else question
+        for quiz_id in bank.entries
+        for question in bank.load(quiz_id).questions
+    ]
+    return content_hash([bank.load(quiz_id)._replace(questions=()) for quiz_id in bank.entries], questions)
+
+
+def input_hashes(app_url=None):
+    """Named hashes of everything the export reads: stylesheets, navigation,
+    chapters, shared tables, emergency resources, nursing guide branches, the
+    quizzes they show and the renderer itself
+    """
+    store = load_store()
+    renderer = [(BASE_DIR / module).read_text(encoding="utf-8") for module in RENDERER_MODULES]
+    hashes = {"renderer": content_hash(EXPORT_VERSION, renderer, app_url)}
+    for name in STYLESHEETS:
+        hashes[f"css:{name}"] = content_hash(stylesheet(name))
+    hashes["nav:manual"] = content_hash(
+        [(title, [(c.id, c.title) for c in chapters]) for title, chapters in store.navigation]
+    )
+    hashes["nav:nursing"] = content_hash(nursing_sections())
+    hashes["emergency"] = content_hash(EMERGENCY_RESOURCES, stylesheet("emergency"))
+    for chapter in store:
+        hashes[f"chapter:{chapter.id}"] = content_hash(chapter.title, chapter.section, chapter.blocks)
+        for block in walk_blocks(chapter.blocks):
+            if isinstance(block, Table) and block.caption:
+                hashes[f"table:{block.caption}"] = content_hash(block)
+    shared, branches = nursing_source_hashes()
+    hashes["nursing:shared"] = shared
+    hashes["quizzes"] = quizzes_hash()
+    for section, digest in branches.items():
+        hashes[f"nursing:{section}"] = digest
+    return hashes
+
+
+def plan_site(app_url=None):
+    """Every exported file as {path: (job, names of the input hashes it depends on)}"""
+    store = load_store()
+    plan = {}
+    for name in STYLESHEETS:
+        plan[f"assets/{hashed_asset(name)[0]}"] = (("asset", name, app_url), [f"css:{name}"])
+    for chapter in store:
+        depends = ["renderer", "css:export", "css:manual", "nav:manual", f"chapter:{chapter.id}"]
+        depends += sorted({
+            f"table:{block.caption}" for block in walk_blocks(chapter.blocks)
+            if isinstance(block, Table) and block.caption
+        })
+        plan[f"manual/{chapter.id}.html"] = (("manual", chapter.id, app_url), depends)
+    for section in nursing_sections():
+        depends = ["renderer", "css:export", "css:nursing", "nav:nursing", "nursing:shared", "quizzes", f"nursing:{section}"]
+        plan[f"nursing/{slugify(section)}.html"] = (("nursing", section, app_url), depends)
+    plan["emergency.html"] = (("emergency", None, app_url), ["renderer", "emergency"])
+    plan[DEEP_LINKS_NAME] = (("deeplinks", None, app_url), ["renderer", "nav:manual"])
+    plan["index.html"] = (("index", None, app_url), ["renderer", "css:export", "nav:manual", "nav:nursing"])
+    return plan
+
+
+def load_manifest(out_dir):
+    """Manifest of the previous export in out_dir, or an empty one"""
+    path = Path(out_dir) / MANIFEST_NAME
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"version": EXPORT_VERSION, "inputs": {}, "files": {}}
+    if manifest.get("version") != EXPORT_VERSION:
+        return {"version": EXPORT_VERSION, "inputs": {}, "files": {}}
+    return manifest
+
+
+def etag(data):
+    """Strong ETag for a file's bytes"""
+    return '"' + hashlib.sha256(data).hexdigest()[:20] + '"'
+
+
+def brotli_module():
+    """The brotli package, None when it is not installed (no .br files then)"""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def compressed_siblings(path, data):
+    """Precompressed variants of a file: {path: bytes}"""
+    siblings = {f"{path}.gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    brotli = brotli_module()
+    if brotli is not None:
+        siblings[f"{path}.br"] = brotli.compress(data, quality=11)
+    return siblings
+
+
+def remove_file(out_dir, path):
+    """Delete an exported file and its precompressed siblings"""
+    for target in (path, f"{path}.gz", f"{path}.br"):
+        (out_dir / target).unlink(missing_ok=True)
+
+
+def export_site(out_dir, app_url=None, jobs=None, force=False):
+    """Bring the static site in out_dir up to date and return a summary dict
+
+    Only files whose input hashes differ from the previous manifest are
+    re-rendered (across a process pool), and a re-rendered file is only
+    rewritten when its bytes changed, so unchanged files keep their mtime and
+    with it the ETag the web server derives from it.
+    """
+    out_dir = Path(out_dir)
+    previous = load_manifest(out_dir)
+    hashes = input_hashes(app_url)
+    plan = plan_site(app_url)
+
+    files = {}
+    stale = []
+    for path, (job, depends) in plan.items():
+        key = content_hash([(name, hashes[name]) for name in depends])
+        old = previous["files"].get(path)
+        files[path] = {"key": key, "depends": depends, "etag": old["etag"] if old else None}
+        if force or old is None or old["key"] != key or not (out_dir / path).exists():
+            stale.append(path)
+
+    if len(stale) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            rendered = dict(zip(stale, pool.map(render_job, [plan[path][0] for path in stale])))
+    else:
+        rendered = {path: render_job(plan[path][0]) for path in stale}
+
+    written = []
+    for path, data in rendered.items():
+        tag = etag(data)
+        if tag == files[path]["etag"] and (out_dir / path).exists():
+            continue
+        files[path]["etag"] = tag
+        siblings = compressed_siblings(path, data)
+        for target, payload in {path: data, **siblings}.items():
+            destination = out_dir / target
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            destination.write_bytes(payload)
+        if f"{path}.br" not in siblings:
+            # A .br left by an earlier export would be served instead of the new file
+            (out_dir / f"{path}.br").unlink(missing_ok=True)
+        written.append(path)
+
+    removed = [path for path in previous["files"] if path not in files]
+    for path in removed:
+        remove_file(out_dir, path)
+
+    changed = sorted(name for name, digest in hashes.items() if previous["inputs"].get(name) != digest)
+    manifest = {"version": EXPORT_VERSION, "inputs": hashes, "files": files}
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding="utf-8")
+    return {
+        "changed_inputs": changed, "rendered": sorted(rendered), "written": written, "removed": removed,
+        "brotli": brotli_module() is not None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the manuals as a static site")
+    parser.add_argument("--out", default="site", help="output directory (default: site)")
+    parser.add_argument("--app-url", help="URL of the interactive Streamlit app for quiz links")
+    parser.add_argument("--jobs", type=int, help="worker processes for rendering (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="re-render every file regardless of the manifest")
+    args = parser.parse_args()
+    summary = export_site(args.out, args.app_url, jobs=args.jobs, force=args.force)
+    print(f"Changed inputs: {', '.join(summary['changed_inputs']) or 'none'}")
+    print(f"Rendered {len(summary['rendered'])}, wrote {len(summary['written'])}, "
+          f"removed {len(summary['removed'])} files in {args.out}")
+    if not summary["brotli"]:
+        print("brotli is not installed: only .gz siblings were written, no .br (pip install brotli)")
+
+
+if __name__ == "__main__":
+    main()
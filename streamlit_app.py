@@ -1,5 +1,15 @@
 import streamlit as st
 
+from lazy_imports import lazy_import
+from metrics import fragment_metrics, quiz_submitted, rerun_finished, rerun_started
+from profiling import begin_block, end_block, finish_run, profiled, start_run
+from progress_store import record_checklist, record_quiz, record_visit
+from quiz_engine import response, shared_question_bank
+from render_buffer import RenderBuffer, inject_styles
+
+# Only needed once the reader answers or navigates, so kept off the first paint
+analytics = lazy_import("analytics")
+
 # -----------------------------------
 # App Configuration
 # -----------------------------------
@@ -9,185 +19,72 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS for better styling
-st.markdown("""
-<style>
-    .main-header {
-        color: #1E3A8A;
-        padding-bottom: 1rem;
-        border-bottom: 2px solid #E5E7EB;
-    }
-    .sub-header {
-        color: #374151;
-        margin-top: 2rem !important;
-        padding-bottom: 0.5rem;
-        border-bottom: 1px solid #E5E7EB;
-    }
-    .highlight-box {
-        background-color: #F3F4F6;
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #3B82F6;
-        margin: 1rem 0;
-    }
-    .nursing-box {
-        background-color: #F0F9FF;
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #0EA5E9;
-        margin: 1rem 0;
-    }
-    .warning-box {
-        background-color: #FEF3C7;
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #F59E0B;
-        margin: 1rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Sections of the guide, in sidebar order
+SECTIONS = (
+    "Introduction", "Psychological Responses", "Psychosocial Challenges",
+    "Social Sphere", "Therapeutic Communication", "Self-Care", "Assessment"
+)
 
-# -----------------------------------
-# Header Section
-# -----------------------------------
-st.title("🏥 Psychosocial Aspects of Cancer Care")
-st.markdown("### A Comprehensive Guide for Oncology Nurses")
-st.markdown("---")
-
-# Sidebar
-with st.sidebar:
-    st.header("📋 Chapter Navigation")
-    sections = st.radio(
-        "Go to section:",
-        ["Introduction", "Psychological Responses", "Psychosocial Challenges", 
-         "Social Sphere", "Therapeutic Communication", "Self-Care", "Assessment"]
-    )
-    
-    st.divider()
-    
-    st.header("📞 Resources")
-    st.write("**Patient Relation Services:** Ext. ")
-    st.write("**Psychooncology service:** Ext. ")
-    st.write("**Palliative care service:** Ext. ")
 
-# -----------------------------------
-# Main Content Sections
-# -----------------------------------
+def section_changed():
+    """Section radio callback: log the move"""
+    analytics.capture("streamlit_app", "navigation", section=st.session_state["section"])
 
-if sections == "Introduction":
-    st.markdown('<div class="main-header"><h2>Introduction</h2></div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns([3, 1])
-    with col1:
-        st.markdown("""
-        Welcome, oncology nurses. You are at the heart of cancer care, witnessing not just the 
-        physical trajectory of disease, but the profound human experience that accompanies it.
-        
-        This guide is designed to frame and deepen your understanding of the psychological and 
-        social dimensions of cancer. Our goal is to equip you with insights and frameworks that 
-        can enhance your already vital therapeutic presence.
-        """)
-    
-    #with col2:
-    #    st.image("https://ifanglobal.com/2022/10/10/indian-nurses-a-force-to-reckon-with-on-the-global-map/", 
-    #            caption="The Nurse as a Healing Environment", use_container_width=True)
-    
-    st.markdown('<div class="sub-header"><h3>Understanding the Psychosocial Landscape</h3></div>', unsafe_allow_html=True)
-    
-    st.markdown("""
-    Psychosocial care recognizes that a patient is **more than a diagnosis**. It encompasses:
-    
-    - **Psychological**: Emotional, cognitive, and behavioral factors
-    - **Social**: Relationships, roles, financial, and cultural factors
-    
-    **The Biopsychosocial Model**: Cancer affects the mind and society, which in turn affect biology. 
-    Stress, isolation, or depression can influence pain perception, treatment adherence, and immune function.
-    """)
-    
-    st.markdown('<div>', unsafe_allow_html=True)
-    st.markdown("**Key Takeaway**: Your holistic care directly addresses the interplay between biological, psychological, and social factors.")
-    st.markdown('</div>', unsafe_allow_html=True)
 
-elif sections == "Psychological Responses":
-    st.markdown('<div class="main-header"><h2>Psychological Responses to Cancer</h2></div>', unsafe_allow_html=True)
-    
-    st.markdown("""
-    Responses are highly individual but often follow a **non-linear pattern**. 
-    These are **normal reactions to an abnormal situation**.
-    """)
-    
-    # Create tabs for different responses
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "Shock & Disbelief", "Anxiety & Fear", "Sadness & Grief", "Anger", "Hope"
-    ])
+def render_sidebar():
+    """Chapter navigation and resources; returns the selected section"""
+    with st.sidebar:
+        st.header("📋 Chapter Navigation")
+        section = st.radio(
+            "Go to section:",
+            SECTIONS,
+            key="section",
+            on_change=section_changed
+        )
     
-    with tab1:
-        st.markdown("### Initial Shock & Disbelief")
-        st.markdown("*'This can\\'t be happening.'*")
-        st.markdown("**Manifestations**: Numbness, automatic pilot, detachment")
-        st.markdown('<div>', unsafe_allow_html=True)
-        st.markdown("**Nursing Implications**:")
-        st.markdown("""
-        - Provide clear, simple information repeatedly
-        - Be a calm, grounding presence
-        - Use short sentences and check understanding
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with tab2:
-        st.markdown("### Anxiety & Fear")
-        st.markdown("*Fear of pain, death, treatment side effects, loss of identity*")
-        st.markdown("**Manifestations**: Restlessness, insomnia, constant questioning, hypervigilance")
-        st.markdown('<div>', unsafe_allow_html=True)
-        st.markdown("**Nursing Implications**:")
-        st.markdown("""
-        - Normalize these fears
-        - Provide concrete information about what to expect
-        - Teach simple breathing techniques (4-7-8 breathing)
-        - Offer distractions when appropriate
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with tab3:
-        st.markdown("### Sadness & Grief")
-        st.markdown("*Grieving for lost health, future plans, or physical changes*")
-        st.markdown("**Different from clinical depression**, but on a continuum")
-        st.markdown('<div>', unsafe_allow_html=True)
-        st.markdown("**Nursing Implications**:")
-        st.markdown("""
-        - Allow space for tears without immediately jumping to cheer up
-        - Use empathetic statements: *"This is so much to cope with"*
-        - Assess for clinical depression (PHQ-2/9 when appropriate)
-        - Connect with support groups
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with tab4:
-        st.markdown("### Anger")
-        st.markdown("*A response to helplessness or perceived injustice*")
-        st.markdown("**Manifestations**: Irritability, blaming others, withdrawal")
-        st.markdown('<div>', unsafe_allow_html=True)
-        st.markdown("**Nursing Implications**:")
-        st.markdown("""
-        - Do not take it personally
-        - See anger as an expression of underlying distress
-        - Respond with curiosity: *"You seem really frustrated. Tell me more..."*
-        - Set boundaries while maintaining empathy
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.divider()
     
-    with tab5:
-        st.markdown("### Hope")
-        st.markdown("*An essential survival tool*")
-        st.markdown("**Evolves over time**: Cure → Remission → Good days → Peace → Legacy")
-        st.markdown('<div>', unsafe_allow_html=True)
-        st.markdown("**CRITICAL**: Never strip away hope. Help **reframe** it to match the current reality.")
-        st.markdown('</div>', unsafe_allow_html=True)
-        st.markdown("**Ask**: *'What is most important to you right now?'*")
+        st.header("📞 Resources")
+        st.write("**Patient Relation Services:** Ext. ")
+        st.write("**Psychooncology service:** Ext. ")
+        st.write("**Palliative care service:** Ext. ")
+    return section
 
-elif sections == "Psychosocial Challenges":
-    st.markdown('<div class="main-header"><h2>Key Psychosocial Challenges Across the Trajectory</h2></div>', unsafe_allow_html=True)
-    
+
+@st.cache_resource
+def load_question_bank():
+    """Question bank once per process, shared by all sessions and, in the
+    portal, with the faculty dashboard
+    """
+    return shared_question_bank()
+
+
+def scenario_answered(question_id):
+    """Response callback: record the chosen response to a patient scenario"""
+    answers = {question_id: st.session_state[f"response_{question_id}"]}
+    quiz_submitted("streamlit_app", "nursing.communication")
+    analytics.capture("streamlit_app", "answer", quiz="nursing.communication", question=question_id)
+    record_quiz(
+        "streamlit_app", "nursing.communication", answers, load_question_bank().correct(answers), st.session_state
+    )
+
+
+def checklist_changed():
+    """Checklist callback: record the signs currently ticked"""
+    record_checklist("streamlit_app", "burnout", st.session_state["burnout_signs"], st.session_state)
+
+
+# -----------------------------------
+# Interactive Blocks
+# Each widget block is a fragment, so interacting with it reruns only the
+# block instead of the whole guide
+# -----------------------------------
+
+@st.fragment
+@fragment_metrics("streamlit_app")
+@profiled
+def treatment_phase_guide():
+    """Focus areas and nursing role for the selected treatment phase"""
     timeline = st.selectbox(
         "Select treatment phase:",
         ["During Active Treatment", "End of Treatment/Survivorship", "Advanced/Palliative Stages", "End of Life"]
@@ -269,53 +166,12 @@ elif sections == "Psychosocial Challenges":
             - Support the entire family system
             """)
 
-elif sections == "Social Sphere":
-    st.markdown('<div class="main-header"><h2>The Social Sphere: When the World Shrinks and Stress Expands</h2></div>', unsafe_allow_html=True)
-    
-    st.markdown("### Family Dynamics")
-    st.markdown("Cancer is a **family diagnosis**. Roles shift dramatically.")
-    
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown("**Common Patterns**:")
-        st.markdown("""
-        - Overprotectiveness vs. abandonment
-        - Caregiver burnout
-        - Role reversal (child becomes caregiver)
-        - Communication breakdowns
-        """)
-    
-    with col2:
-        st.markdown("**Your Role**:")
-        st.markdown("""
-        - Include family in teaching when appropriate
-        - Assess caregiver burnout (ask directly!)
-        - Refer to family counseling/support groups
-        - Create 'family meetings' when needed
-        """)
-    
-    st.divider()
-    
-    st.markdown("### Economic Toxicity")
-    st.markdown("The crushing financial burden of treatment, travel, and lost wages.")
-    
-    st.markdown('<div>', unsafe_allow_html=True)
-    st.markdown("**Sample Screening Question**:")
-    st.markdown('*"Many people find the costs of treatment stressful. Would you like to speak with someone who can help?"*')
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    st.markdown("**Resources to Have Ready**:")
-    st.markdown("""
-    - Social work contacts
-    - Financial counseling
-    - Patient assistance programs
-    - Transportation services
-    """)
-    
-    st.divider()
-    
-    st.markdown("### Cultural Considerations")
-    
+
+@st.fragment
+@fragment_metrics("streamlit_app")
+@profiled
+def cultural_questions():
+    """Suggested questions for the selected cultural factors"""
     cultural_factors = st.multiselect(
         "Cultural factors to explore:",
         ["Illness causation beliefs", "Decision-making style", "Truth-telling preferences", 
@@ -334,164 +190,63 @@ elif sections == "Social Sphere":
             elif factor == "Spiritual practices":
                 st.write("- *'Are there spiritual practices that are important to you during treatment?'*")
 
-elif sections == "Therapeutic Communication":
-    st.markdown('<div class="main-header"><h2>Your Most Powerful Tool: Therapeutic Communication</h2></div>', unsafe_allow_html=True)
-    
-    st.markdown("### Communication Skills Practice")
-    
+
+@st.fragment
+@fragment_metrics("streamlit_app")
+@profiled
+def communication_practice():
+    """Patient scenario with a response to choose and feedback"""
+    bank = load_question_bank()
+    practice = bank.load("nursing.communication")
+    scenarios = {question.title: question for question in practice.questions}
     scenario = st.selectbox(
         "Choose a patient scenario:",
-        ["Patient expressing fear of dying", 
-         "Patient angry about treatment delays",
-         "Family member overwhelmed with caregiving",
-         "Patient questioning 'Why me?'",
-         "Patient crying about hair loss"]
+        list(scenarios)
     )
+    question = scenarios[scenario]
     
     st.markdown("**Patient Statement**:")
-    if scenario == "Patient expressing fear of dying":
-        st.write("*\"I'm so scared I'm going to die. I can't sleep thinking about it.\"*")
-    elif scenario == "Patient angry about treatment delays":
-        st.write("*\"This is ridiculous! I've been waiting 2 hours! Don't you people care?\"*")
-    elif scenario == "Family member overwhelmed with caregiving":
-        st.write("*\"I don't know how much longer I can do this. I'm exhausted and I'm failing at everything.\"*")
-    elif scenario == "Patient questioning 'Why me?'":
-        st.write("*\"Why is this happening to me? What did I do to deserve this?\"*")
-    elif scenario == "Patient crying about hair loss":
-        st.write("*\"I look like a monster. I can't even recognize myself in the mirror anymore.\"*")
+    st.write(f'*"{question.context}"*')
     
     st.markdown("**Your Response Options**:")
-    
-    if scenario == "Patient expressing fear of dying":
-        option = st.radio(
-            "Select the most therapeutic response:",
-            [
-                "Don't worry, our doctors are the best.",
-                "That sounds incredibly difficult. Tell me more about what scares you most.",
-                "You need to think positively.",
-                "Let me get you something for sleep."
-            ]
-        )
-        if option == "That sounds incredibly difficult. Tell me more about what scares you most.":
-            st.success("✅ Excellent! This validates emotion and invites sharing.")
-        elif option:
-            st.warning("Try again - look for the response that validates feelings first.")
-    elif scenario == "Patient angry about treatment delays":
-        option = st.radio(
-            "Select the most therapeutic response:",
-            [
-                "Sir, please calm down. We're doing our best.",
-                "I can hear how frustrated you are. This wait must be really difficult.",
-                "Everyone has to wait their turn.",
-                "I'll see what I can do to speed things up."
-            ]
-        )
-        if option == "I can hear how frustrated you are. This wait must be really difficult.":
-            st.success("✅ Excellent! This validates emotion and invites sharing.")
-        elif option:
-            st.warning("Try again - look for the response that validates feelings first.")
-    elif scenario == "Family member overwhelmed with caregiving":
-        option = st.radio(
-            "Select the most therapeutic response:",
-            [
-                "Don't say that, you're doing a great job.",
-                "Being a caregiver is incredibly challenging. Tell me more about what's hardest right now.",
-                "Everyone feels this way sometimes.",
-                "Maybe you should consider hiring more help."
-            ]
-        )
-        if option == "Being a caregiver is incredibly challenging. Tell me more about what's hardest right now.":
-            st.success("✅ Excellent! This validates emotion and invites sharing.")
-        elif option:
-            st.warning("Try again - look for the response that validates feelings first.")
-    elif scenario == "Patient questioning 'Why me?'":
-        option = st.radio(
-            "Select the most therapeutic response:",
-            [
-                "Cancer is random - it can happen to anyone.",
-                "That's a question many people ask. What thoughts or feelings come up when you wonder 'why me'?",
-                "Try not to dwell on questions without answers.",
-                "Everything happens for a reason.",
-                "Let's focus on the treatment plan instead."
-            ]
-        )
-        if option == "That's a question many people ask. What thoughts or feelings come up when you wonder 'why me'?":
-            st.success("✅ Excellent! This validates emotion and invites sharing.")
-        elif option:
-            st.warning("Try again - look for the response that validates feelings first.")
-    elif scenario == "Patient crying about hair loss":
-        option = st.radio(
-            "Select the most therapeutic response:",
-            [
-                "Don't worry, it will grow back after treatment.",
-                "Losing your hair must be really difficult. Tell me more about how this is affecting you.",
-                "It's just hair - what matters is that you're getting better.",
-                "Many patients use wigs or scarves. Would you like to see some options?",
-                "You're still beautiful, even without hair."
-            ]
-        )
-        if option == "Losing your hair must be really difficult. Tell me more about how this is affecting you.":
-            st.success("✅ Excellent! This validates emotion and invites sharing.")
-        elif option:
-            st.warning("Try again - look for the response that validates feelings first.")        
-    
-    st.divider()
-    
-    st.markdown("### Communication Techniques")
-    
-    techniques = [
-        ("Active Listening", "Give full attention. Listen for feelings, not just facts."),
-        ("Empathetic Statements", "\"That sounds incredibly difficult.\" \"I can see how worried you are.\""),
-        ("Open-Ended Questions", "\"How are you coping with all this?\" vs. \"Are you okay?\""),
-        ("Responding to Emotion", "Identify the feeling and validate it."),
-        ("Silence", "Allow pauses for patients to gather thoughts.")
-    ]
-    
-    for technique, description in techniques:
-        with st.expander(f"📌 {technique}"):
-            st.write(description)
-            if technique == "Empathetic Statements":
-                st.markdown("**Examples**:")
-                st.write("- \"This must be so overwhelming for you.\"")
-                st.write("- \"I hear how frustrating this is.\"")
-                st.write("- \"It makes sense you'd feel that way.\"")
-
-elif sections == "Self-Care":
-    st.markdown('<div class="main-header"><h2>Boundaries and Self-Care: The Sustenance of the Caregiver</h2></div>', unsafe_allow_html=True)
-    
-    st.markdown("You cannot pour from an empty cup. Witnessing suffering daily leads to:")
-    
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown("**Compassion Fatigue**")
-        st.markdown("Gradual lessening of compassion over time")
-    with col2:
-        st.markdown("**Burnout**")
-        st.markdown("Physical, emotional, mental exhaustion")
-    with col3:
-        st.markdown("**Vicarious Trauma**")
-        st.markdown("Negative transformation from others' trauma")
-    
-    st.divider()
-    
-    st.markdown("### Self-Assessment Checklist")
-    
+    option = st.radio(
+        question.prompt,
+        question.options,
+        key=f"response_{question.id}",
+        on_change=scenario_answered,
+        args=(question.id,)
+    )
+    if bank.score({question.id: option}):
+        st.success(practice.praise)
+    elif option:
+        st.warning(practice.hint)
+
+
+@st.fragment
+@fragment_metrics("streamlit_app")
+@profiled
+def burnout_checklist():
+    """Self-assessment checklist for signs of burnout"""
     burnout_signs = st.multiselect(
         "Which signs have you experienced recently?",
         [
             "Cynicism about work", "Dread of coming to work", "Emotional numbness",
             "Physical exhaustion", "Irritability with patients/colleagues",
             "Feeling ineffective", "Difficulty concentrating", "Frequent headaches/stomach issues"
-        ]
+        ],
+        key="burnout_signs",
+        on_change=checklist_changed
     )
     
     if burnout_signs:
         st.warning(f"You selected {len(burnout_signs)} signs. Consider discussing with a supervisor or accessing wellness resources.")
-    
-    st.divider()
-    
-    st.markdown("### Self-Care Strategies")
-    
+
+
+@st.fragment
+@fragment_metrics("streamlit_app")
+@profiled
+def self_care_strategies():
+    """Self-care strategies for the selected focus area"""
     strategy_type = st.radio(
         "Focus area:",
         ["At Work", "During Transition", "Team Support"]
@@ -518,92 +273,359 @@ elif sections == "Self-Care":
         - Celebrate small wins together
         - Organize team wellness activities
         """)
+
+
+@st.fragment
+@fragment_metrics("streamlit_app")
+@profiled
+def knowledge_check():
+    """Quick knowledge check quiz with scoring"""
+    bank = load_question_bank()
+    check = bank.load("nursing.knowledge")
+    answers = {}
+    for number, question in enumerate(check.questions, 1):
+        ask = st.multiselect if question.multiple else st.radio
+        answers[question.id] = response(question, ask(f"{number}. {question.prompt}", question.options))
+    
+    if st.button("Check Answers"):
+        quiz_submitted("streamlit_app", check.id)
+        # One answer-key lookup per question on the page
+        correct = bank.correct(answers)
+        analytics.capture("streamlit_app", "answer", quiz=check.id, answered=len(answers), correct=len(correct))
+        record_quiz("streamlit_app", check.id, answers, correct, st.session_state)
+        score = len(correct)
+        total = len(check.questions)
+        
+        st.success(f"**Score: {score}/{total}**")
+        if score == total:
+            st.balloons()
+            st.markdown(check.praise)
+
+
+# -----------------------------------
+# Main Content Sections
+# -----------------------------------
+def render_section(section):
+    """Render the selected section of the guide"""
+    begin_block(f"section:{section}")
+
+    if section == "Introduction":
+        st.markdown('<div class="main-header"><h2>Introduction</h2></div>', unsafe_allow_html=True)
+    
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.markdown("""
+            Welcome, oncology nurses. You are at the heart of cancer care, witnessing not just the 
+            physical trajectory of disease, but the profound human experience that accompanies it.
+        
+            This guide is designed to frame and deepen your understanding of the psychological and 
+            social dimensions of cancer. Our goal is to equip you with insights and frameworks that 
+            can enhance your already vital therapeutic presence.
+            """)
+    
+        #with col2:
+        #    st.image("https://ifanglobal.com/2022/10/10/indian-nurses-a-force-to-reckon-with-on-the-global-map/", 
+        #            caption="The Nurse as a Healing Environment", use_container_width=True)
+    
+        st.markdown('<div class="sub-header"><h3>Understanding the Psychosocial Landscape</h3></div>', unsafe_allow_html=True)
+    
+        st.markdown("""
+        Psychosocial care recognizes that a patient is **more than a diagnosis**. It encompasses:
+    
+        - **Psychological**: Emotional, cognitive, and behavioral factors
+        - **Social**: Relationships, roles, financial, and cultural factors
+    
+        **The Biopsychosocial Model**: Cancer affects the mind and society, which in turn affect biology. 
+        Stress, isolation, or depression can influence pain perception, treatment adherence, and immune function.
+        """)
+    
+        with RenderBuffer() as box:
+            box.add('<div>')
+            box.add("**Key Takeaway**: Your holistic care directly addresses the interplay between biological, psychological, and social factors.")
+            box.add('</div>')
+
+    elif section == "Psychological Responses":
+        st.markdown('<div class="main-header"><h2>Psychological Responses to Cancer</h2></div>', unsafe_allow_html=True)
+    
+        st.markdown("""
+        Responses are highly individual but often follow a **non-linear pattern**. 
+        These are **normal reactions to an abnormal situation**.
+        """)
     
-    st.markdown('<div>', unsafe_allow_html=True)
-    st.markdown("**Remember**: Self-care is not selfish. It's a **professional requirement** for sustainable oncology nursing.")
-    st.markdown('</div>', unsafe_allow_html=True)
+        # Create tabs for different responses
+        tab1, tab2, tab3, tab4, tab5 = st.tabs([
+            "Shock & Disbelief", "Anxiety & Fear", "Sadness & Grief", "Anger", "Hope"
+        ])
+    
+        with tab1:
+            st.markdown("### Initial Shock & Disbelief")
+            st.markdown("*'This can\\'t be happening.'*")
+            st.markdown("**Manifestations**: Numbness, automatic pilot, detachment")
+            with RenderBuffer() as box:
+                box.add('<div>')
+                box.add("**Nursing Implications**:")
+                box.add("""
+                - Provide clear, simple information repeatedly
+                - Be a calm, grounding presence
+                - Use short sentences and check understanding
+                """)
+                box.add('</div>')
+    
+        with tab2:
+            st.markdown("### Anxiety & Fear")
+            st.markdown("*Fear of pain, death, treatment side effects, loss of identity*")
+            st.markdown("**Manifestations**: Restlessness, insomnia, constant questioning, hypervigilance")
+            with RenderBuffer() as box:
+                box.add('<div>')
+                box.add("**Nursing Implications**:")
+                box.add("""
+                - Normalize these fears
+                - Provide concrete information about what to expect
+                - Teach simple breathing techniques (4-7-8 breathing)
+                - Offer distractions when appropriate
+                """)
+                box.add('</div>')
+    
+        with tab3:
+            st.markdown("### Sadness & Grief")
+            st.markdown("*Grieving for lost health, future plans, or physical changes*")
+            st.markdown("**Different from clinical depression**, but on a continuum")
+            with RenderBuffer() as box:
+                box.add('<div>')
+                box.add("**Nursing Implications**:")
+                box.add("""
+                - Allow space for tears without immediately jumping to cheer up
+                - Use empathetic statements: *"This is so much to cope with"*
+                - Assess for clinical depression (PHQ-2/9 when appropriate)
+                - Connect with support groups
+                """)
+                box.add('</div>')
+    
+        with tab4:
+            st.markdown("### Anger")
+            st.markdown("*A response to helplessness or perceived injustice*")
+            st.markdown("**Manifestations**: Irritability, blaming others, withdrawal")
+            with RenderBuffer() as box:
+                box.add('<div>')
+                box.add("**Nursing Implications**:")
+                box.add("""
+                - Do not take it personally
+                - See anger as an expression of underlying distress
+                - Respond with curiosity: *"You seem really frustrated. Tell me more..."*
+                - Set boundaries while maintaining empathy
+                """)
+                box.add('</div>')
+    
+        with tab5:
+            st.markdown("### Hope")
+            st.markdown("*An essential survival tool*")
+            st.markdown("**Evolves over time**: Cure → Remission → Good days → Peace → Legacy")
+            with RenderBuffer() as box:
+                box.add('<div>')
+                box.add("**CRITICAL**: Never strip away hope. Help **reframe** it to match the current reality.")
+                box.add('</div>')
+            st.markdown("**Ask**: *'What is most important to you right now?'*")
 
-elif sections == "Assessment":
-    st.markdown('<div class="main-header"><h2>Learning Assessment</h2></div>', unsafe_allow_html=True)
+    elif section == "Psychosocial Challenges":
+        st.markdown('<div class="main-header"><h2>Key Psychosocial Challenges Across the Trajectory</h2></div>', unsafe_allow_html=True)
     
-    st.markdown("### 📝 Post-Session Learning Evaluation")
+        treatment_phase_guide()
+
+    elif section == "Social Sphere":
+        st.markdown('<div class="main-header"><h2>The Social Sphere: When the World Shrinks and Stress Expands</h2></div>', unsafe_allow_html=True)
     
-    st.markdown("""
-    Please complete this brief assessment to help us understand what you've learned 
-    and how we can improve future sessions.
-    """)
+        st.markdown("### Family Dynamics")
+        st.markdown("Cancer is a **family diagnosis**. Roles shift dramatically.")
     
-    # Placeholder for Google Form link
-    #form_link = st.text_input(
-    #    "Enter Google Form Assessment Link:",
-    #    placeholder="https://docs.google.com/forms/d/...",
-    #    value=""
-    #)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**Common Patterns**:")
+            st.markdown("""
+            - Overprotectiveness vs. abandonment
+            - Caregiver burnout
+            - Role reversal (child becomes caregiver)
+            - Communication breakdowns
+            """)
     
-    #if form_link:
-    #    st.success(f"✅ Link saved: {form_link}")
-    #    if st.button("Open Assessment Form"):
-    #        st.markdown(f'<meta http-equiv="refresh" content="0; url={form_link}">', unsafe_allow_html=True)
-    #        st.write(f"Opening: {form_link}")
-    #else:
-    #    st.info("👆 Please enter the Google Form link above to access the assessment.")
+        with col2:
+            st.markdown("**Your Role**:")
+            st.markdown("""
+            - Include family in teaching when appropriate
+            - Assess caregiver burnout (ask directly!)
+            - Refer to family counseling/support groups
+            - Create 'family meetings' when needed
+            """)
     
-    st.divider()
+        st.divider()
     
-    st.markdown("### Quick Knowledge Check")
+        st.markdown("### Economic Toxicity")
+        st.markdown("The crushing financial burden of treatment, travel, and lost wages.")
     
-    q1 = st.radio(
-        "1. Which statement about hope in cancer care is most accurate?",
-        [
-            "Nurses should maintain hope for cure at all times",
-            "Hope should be reframed to match current reality",
-            "Hope is only relevant in early-stage cancer",
-            "Discussing hope gives false reassurance"
-        ]
-    )
+        with RenderBuffer() as box:
+            box.add('<div>')
+            box.add("**Sample Screening Question**:")
+            box.add('*"Many people find the costs of treatment stressful. Would you like to speak with someone who can help?"*')
+            box.add('</div>')
     
-    q2 = st.multiselect(
-        "2. Which are appropriate therapeutic responses to anger? (Select all that apply)",
-        [
-            "Take it personally and defend the healthcare team",
-            "See anger as expression of underlying distress",
-            "Respond with curiosity about the source",
-            "Set boundaries while maintaining empathy"
-        ]
-    )
+        st.markdown("**Resources to Have Ready**:")
+        st.markdown("""
+        - Social work contacts
+        - Financial counseling
+        - Patient assistance programs
+        - Transportation services
+        """)
     
-    q3 = st.radio(
-        "3. What is 'economic toxicity'?",
-        [
-            "Side effects of chemotherapy",
-            "The financial burden of cancer treatment",
-            "Toxic work environments",
-            "Psychological distress from diagnosis"
+        st.divider()
+    
+        st.markdown("### Cultural Considerations")
+    
+        cultural_questions()
+
+    elif section == "Therapeutic Communication":
+        st.markdown('<div class="main-header"><h2>Your Most Powerful Tool: Therapeutic Communication</h2></div>', unsafe_allow_html=True)
+    
+        st.markdown("### Communication Skills Practice")
+    
+        communication_practice()
+    
+        st.divider()
+    
+        st.markdown("### Communication Techniques")
+    
+        techniques = [
+            ("Active Listening", "Give full attention. Listen for feelings, not just facts."),
+            ("Empathetic Statements", "\"That sounds incredibly difficult.\" \"I can see how worried you are.\""),
+            ("Open-Ended Questions", "\"How are you coping with all this?\" vs. \"Are you okay?\""),
+            ("Responding to Emotion", "Identify the feeling and validate it."),
+            ("Silence", "Allow pauses for patients to gather thoughts.")
         ]
-    )
     
-    if st.button("Check Answers"):
-        score = 0
-        if q1 == "Hope should be reframed to match current reality":
-            score += 1
-        if set(q2) == {"See anger as expression of underlying distress", "Respond with curiosity about the source", "Set boundaries while maintaining empathy"}:
-            score += 1
-        if q3 == "The financial burden of cancer treatment":
-            score += 1
-        
-        st.success(f"**Score: {score}/3**")
-        if score == 3:
-            st.balloons()
-            st.markdown("🎉 Excellent understanding of key concepts!")
+        for technique, description in techniques:
+            with st.expander(f"📌 {technique}"):
+                st.write(description)
+                if technique == "Empathetic Statements":
+                    st.markdown("**Examples**:")
+                    st.write("- \"This must be so overwhelming for you.\"")
+                    st.write("- \"I hear how frustrating this is.\"")
+                    st.write("- \"It makes sense you'd feel that way.\"")
+
+    elif section == "Self-Care":
+        st.markdown('<div class="main-header"><h2>Boundaries and Self-Care: The Sustenance of the Caregiver</h2></div>', unsafe_allow_html=True)
+    
+        st.markdown("You cannot pour from an empty cup. Witnessing suffering daily leads to:")
+    
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.markdown("**Compassion Fatigue**")
+            st.markdown("Gradual lessening of compassion over time")
+        with col2:
+            st.markdown("**Burnout**")
+            st.markdown("Physical, emotional, mental exhaustion")
+        with col3:
+            st.markdown("**Vicarious Trauma**")
+            st.markdown("Negative transformation from others' trauma")
+    
+        st.divider()
+    
+        st.markdown("### Self-Assessment Checklist")
+    
+        burnout_checklist()
+    
+        st.divider()
+    
+        st.markdown("### Self-Care Strategies")
+    
+        self_care_strategies()
+    
+        with RenderBuffer() as box:
+            box.add('<div>')
+            box.add("**Remember**: Self-care is not selfish. It's a **professional requirement** for sustainable oncology nursing.")
+            box.add('</div>')
+
+    elif section == "Assessment":
+        st.markdown('<div class="main-header"><h2>Learning Assessment</h2></div>', unsafe_allow_html=True)
+    
+        st.markdown("### 📝 Post-Session Learning Evaluation")
+    
+        st.markdown("""
+        Please complete this brief assessment to help us understand what you've learned 
+        and how we can improve future sessions.
+        """)
+    
+        # Placeholder for Google Form link
+        #form_link = st.text_input(
+        #    "Enter Google Form Assessment Link:",
+        #    placeholder="https://docs.google.com/forms/d/...",
+        #    value=""
+        #)
+    
+        #if form_link:
+        #    st.success(f"✅ Link saved: {form_link}")
+        #    if st.button("Open Assessment Form"):
+        #        st.markdown(f'<meta http-equiv="refresh" content="0; url={form_link}">', unsafe_allow_html=True)
+        #        st.write(f"Opening: {form_link}")
+        #else:
+        #    st.info("👆 Please enter the Google Form link above to access the assessment.")
+    
+        st.divider()
+    
+        st.markdown("### Quick Knowledge Check")
+    
+        knowledge_check()
+
+    end_block()
+
 
 # -----------------------------------
-# Footer
+# Header and Footer
 # -----------------------------------
-st.markdown("---")
-col1, col2 = st.columns(2)
-with col1:
-    st.markdown("**Session Developed By:**")
-    st.markdown("Psychooncology Service, Dept. of Psychiatry, Pramukhswami Medical College, Bhaikaka University, Karamsad")
-with col2:
-    st.markdown("**For Support:**")
-    st.markdown("Hospital Extension: 02692-228201")
+def render_header():
+    """Guide title"""
+    st.title("🏥 Psychosocial Aspects of Cancer Care")
+    st.markdown("### A Comprehensive Guide for Oncology Nurses")
+    st.markdown("---")
+
+
+def render_footer():
+    """Credits and support contacts"""
+    st.markdown("---")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Session Developed By:**")
+        st.markdown("Psychooncology Service, Dept. of Psychiatry, Pramukhswami Medical College, Bhaikaka University, Karamsad")
+    with col2:
+        st.markdown("**For Support:**")
+        st.markdown("Hospital Extension: 02692-228201")
+
+
+def render_page():
+    """Render the header, sidebar, selected section and footer"""
+    # Custom CSS for better styling
+    inject_styles("nursing")
+    render_header()
+    section = render_sidebar()
+    # Progress store: a visit each time the reader moves to another section
+    record_visit("streamlit_app", section, st.session_state)
+    render_section(section)
+    render_footer()
+
+
+def shown_section():
+    """Metrics label of the section shown this rerun, 'unknown' if none was"""
+    section = st.session_state.get("section")
+    return section if section in SECTIONS else "unknown"
+
+
+def main():
+    """Main application function"""
+    rerun_started("streamlit_app")
+    start_run("streamlit_app")
+    try:
+        render_page()
+    finally:
+        finish_run()
+        rerun_finished(shown_section())
+
+
+if __name__ == "__main__":
+    main()
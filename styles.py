@@ -0,0 +1,39 @@
+"""
+Stylesheets shared by the Streamlit apps and the static export
+The apps link static/<name>.css through Streamlit's static file serving
+(server.enableStaticServing in .streamlit/config.toml) with a content-hash
+query string, so the CSS is downloaded once and then served from the browser
+cache; only a short <link> element travels with each rerun
+(see render_buffer.inject_styles).
+"""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+# URL prefix Streamlit serves STATIC_DIR under (relative to the app page)
+STATIC_URL = "app/static"
+
+
+@lru_cache(maxsize=None)
+def stylesheet(name):
+    """CSS text of static/<name>.css"""
+    return (STATIC_DIR / f"{name}.css").read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def stylesheet_version(name):
+    """Short content hash of static/<name>.css, used to bust caches on change"""
+    return hashlib.sha256(stylesheet(name).encode("utf-8")).hexdigest()[:10]
+
+
+def style_tag(name):
+    """Inline <style> element for static/<name>.css"""
+    return f"<style>\n{stylesheet(name)}</style>"
+
+
+def link_tag(name):
+    """<link> element for the versioned static URL of static/<name>.css"""
+    return f'<link rel="stylesheet" href="{STATIC_URL}/{name}.css?v={stylesheet_version(name)}">'
+
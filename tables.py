@@ -0,0 +1,23 @@
+"""
+Table layer for the Streamlit apps
+Static tables are pre-rendered to HTML once per content hash, so rendering a
+chapter never touches pandas
+"""
+
+from functools import lru_cache
+from html import escape
+
+
+@lru_cache(maxsize=512)
+def table_html(table):
+    """Pre-rendered markup for a Table record, styled by the .tool-table CSS"""
+    header = "".join(f"<th>{escape(column)}</th>" for column in table.columns)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{escape(cell)}</td>" for cell in row) + "</tr>"
+        for row in table.rows
+    )
+    markup = f'<table class="tool-table">\n<thead><tr>{header}</tr></thead>\n<tbody>{body}</tbody>\n</table>'
+    if table.caption:
+        return f"**{table.caption}**\n\n{markup}"
+    return markup
+